@@ -0,0 +1,186 @@
+"""A stand-in Redmine REST API for benchmarks.
+
+Serves deterministic issues, projects, wiki pages and enumerations from
+memory with a configurable per-request latency and payload size, so the
+MCP tools can be driven end to end without a real Redmine.
+"""
+
+import asyncio
+import os
+import random
+from dataclasses import dataclass
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+STATUSES = [
+    {"id": 1, "name": "New", "is_closed": False},
+    {"id": 2, "name": "In Progress", "is_closed": False},
+    {"id": 5, "name": "Closed", "is_closed": True},
+]
+TRACKERS = [{"id": 1, "name": "Bug"}, {"id": 2, "name": "Feature"}, {"id": 3, "name": "Task"}]
+PRIORITIES = [{"id": 1, "name": "Low"}, {"id": 2, "name": "Normal"}, {"id": 3, "name": "High"}]
+USERS = [{"id": i, "login": f"user{i}", "firstname": "User", "lastname": str(i)} for i in range(1, 51)]
+
+
+@dataclass
+class FakeRedmineConfig:
+    issues: int = 5000
+    projects: int = 20
+    wiki_pages: int = 30
+    latency: float = 0.02
+    jitter: float = 0.0
+    description_size: int = 500
+    journals_per_issue: int = 5
+
+
+def _issue(iid: int, config: FakeRedmineConfig) -> dict:
+    project_id = iid % config.projects + 1
+    status = STATUSES[iid % len(STATUSES)]
+    return {
+        "id": iid,
+        "project": {"id": project_id, "name": f"Project {project_id}"},
+        "tracker": {"id": TRACKERS[iid % 3]["id"], "name": TRACKERS[iid % 3]["name"]},
+        "status": {"id": status["id"], "name": status["name"], "is_closed": status["is_closed"]},
+        "priority": {"id": 2, "name": "Normal"},
+        "author": {"id": 1, "name": "User 1"},
+        "assigned_to": {"id": iid % 50 + 1, "name": f"User {iid % 50 + 1}"},
+        "subject": f"Issue {iid} subject",
+        "description": ("lorem ipsum " * (config.description_size // 12 + 1))[:config.description_size],
+        "start_date": "2024-01-01",
+        "due_date": None,
+        "done_ratio": 0,
+        "created_on": "2024-01-01T00:00:00Z",
+        "updated_on": f"2024-02-{iid % 28 + 1:02d}T00:00:00Z",
+    }
+
+
+def create_app(config: FakeRedmineConfig | None = None) -> Starlette:
+    config = config or FakeRedmineConfig()
+
+    async def delay() -> None:
+        if config.latency or config.jitter:
+            await asyncio.sleep(config.latency + random.uniform(0, config.jitter))
+
+    def page(request: Request, items: list, key: str) -> JSONResponse:
+        limit = min(int(request.query_params.get("limit", 25)), 100)
+        offset = int(request.query_params.get("offset", 0))
+        return JSONResponse({
+            key: items[offset:offset + limit],
+            "total_count": len(items),
+            "offset": offset,
+            "limit": limit,
+        })
+
+    async def issues(request: Request) -> Response:
+        await delay()
+        if request.method == "POST":
+            return JSONResponse({"issue": _issue(config.issues + 1, config)}, status_code=201)
+        q = request.query_params
+        if "issue_id" in q:
+            ids = [int(i) for i in q["issue_id"].split(",") if 0 < int(i) <= config.issues]
+            return JSONResponse({"issues": [_issue(i, config) for i in ids], "total_count": len(ids)})
+        ids = range(config.issues, 0, -1)
+        if "project_id" in q:
+            project = q["project_id"].removeprefix("project-")
+            ids = [i for i in ids if str(i % config.projects + 1) == project]
+        limit = min(int(q.get("limit", 25)), 100)
+        offset = int(q.get("offset", 0))
+        selected = list(ids)
+        return JSONResponse({
+            "issues": [_issue(i, config) for i in selected[offset:offset + limit]],
+            "total_count": len(selected),
+            "offset": offset,
+            "limit": limit,
+        })
+
+    async def issue(request: Request) -> Response:
+        await delay()
+        iid = int(request.path_params["issue_id"])
+        if not 0 < iid <= config.issues:
+            return Response(status_code=404)
+        if request.method in ("PUT", "DELETE"):
+            return Response(status_code=204)
+        data = _issue(iid, config)
+        if "journals" in request.query_params.get("include", ""):
+            data["journals"] = [
+                {"id": iid * 100 + j, "user": {"id": 1, "name": "User 1"}, "notes": f"note {j}",
+                 "created_on": "2024-01-02T00:00:00Z", "details": []}
+                for j in range(config.journals_per_issue)
+            ]
+        return JSONResponse({"issue": data})
+
+    async def search(request: Request) -> Response:
+        await delay()
+        q = request.query_params.get("q", "")
+        results = [
+            {"id": i, "title": f"Bug #{i} (New): Issue {i} subject", "type": "issue",
+             "url": f"/issues/{i}", "description": "", "datetime": "2024-01-01T00:00:00Z"}
+            for i in range(1, min(config.issues, 200) + 1) if q in f"Issue {i} subject"
+        ]
+        return page(request, results, "results")
+
+    async def projects(request: Request) -> Response:
+        await delay()
+        items = [
+            {"id": p, "identifier": f"project-{p}", "name": f"Project {p}", "status": 1}
+            for p in range(1, config.projects + 1)
+        ]
+        return page(request, items, "projects")
+
+    async def project(request: Request) -> Response:
+        await delay()
+        pid = request.path_params["project_id"].removeprefix("project-")
+        return JSONResponse({"project": {
+            "id": int(pid), "identifier": f"project-{pid}", "name": f"Project {pid}",
+            "trackers": TRACKERS, "issue_categories": [],
+        }})
+
+    async def wiki_index(request: Request) -> Response:
+        await delay()
+        return JSONResponse({"wiki_pages": [
+            {"title": f"Page{n}", "version": 1, "updated_on": "2024-01-01T00:00:00Z"}
+            for n in range(config.wiki_pages)
+        ]})
+
+    async def wiki_page(request: Request) -> Response:
+        await delay()
+        title = request.path_params["title"]
+        return JSONResponse({"wiki_page": {
+            "title": title, "version": 1, "updated_on": "2024-01-01T00:00:00Z",
+            "text": f"# {title}\n" + "本文 " * (config.description_size // 3),
+        }})
+
+    def static(key: str, items: list):
+        async def handler(request: Request) -> Response:
+            await delay()
+            return JSONResponse({key: items})
+        return handler
+
+    async def users(request: Request) -> Response:
+        await delay()
+        return page(request, USERS, "users")
+
+    return Starlette(routes=[
+        Route("/issues.json", issues, methods=["GET", "POST"]),
+        Route("/issues/{issue_id:int}.json", issue, methods=["GET", "PUT", "DELETE"]),
+        Route("/search.json", search),
+        Route("/projects.json", projects),
+        Route("/projects/{project_id}.json", project),
+        Route("/projects/{project_id}/wiki/index.json", wiki_index),
+        Route("/projects/{project_id}/wiki/{title}.json", wiki_page),
+        Route("/issue_statuses.json", static("issue_statuses", STATUSES)),
+        Route("/trackers.json", static("trackers", TRACKERS)),
+        Route("/enumerations/issue_priorities.json", static("issue_priorities", PRIORITIES)),
+        Route("/users.json", users),
+    ])
+
+
+def app_from_env() -> Starlette:
+    """App factory for ``uvicorn --factory``, configured by FAKE_REDMINE_* variables."""
+    return create_app(FakeRedmineConfig(
+        latency=float(os.environ.get("FAKE_REDMINE_LATENCY", "0.02")),
+        description_size=int(os.environ.get("FAKE_REDMINE_PAYLOAD", "500")),
+    ))
@@ -0,0 +1,141 @@
+"""Measure how streamable HTTP throughput scales with the worker count.
+
+Starts the fake Redmine, then for each worker count runs ``main.py`` with
+MCP_TRANSPORT=streamable-http (stateless, JSON responses) and sends
+``tools/call`` requests over HTTP at a fixed concurrency.
+
+Usage:
+    uv run python -m benchmarks.http_workers --workers 1,2,4 --calls 2000 --concurrency 64
+
+Throughput can only scale up to the number of CPU cores, and the load
+generator and the fake Redmine share those cores with the workers.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_ready(url: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as http:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{proc.args} exited with {proc.returncode}")
+            try:
+                await http.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise TimeoutError(url)
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+async def drive(url: str, tool: str, arguments: dict, calls: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+    headers = {"Accept": "application/json, text/event-stream"}
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60.0) as http:
+        async def one(i: int) -> None:
+            nonlocal errors
+            body = {"jsonrpc": "2.0", "id": i, "method": "tools/call",
+                    "params": {"name": tool, "arguments": arguments}}
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    resp = await http.post(url, json=body, headers=headers)
+                    if resp.status_code != 200 or resp.json().get("result", {}).get("isError"):
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(calls)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "calls_per_second": round(calls / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(0.99 * (len(latencies) - 1))] * 1000, 2),
+        "errors": errors,
+    }
+
+
+async def main(args: argparse.Namespace) -> list[dict]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    fake_port = _free_port()
+    fake = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.fake_redmine:app_from_env", "--factory",
+         "--port", str(fake_port), "--workers", str(args.fake_workers), "--log-level", "warning"],
+        cwd=ROOT, env={**env, "FAKE_REDMINE_LATENCY": str(args.latency)},
+    )
+    rows = []
+    try:
+        await _wait_ready(f"http://127.0.0.1:{fake_port}/trackers.json", fake)
+        for workers in [int(w) for w in args.workers.split(",")]:
+            port = _free_port()
+            server = subprocess.Popen(
+                [sys.executable, "main.py"], cwd=ROOT,
+                env={**env, "MCP_TRANSPORT": "streamable-http", "MCP_WORKERS": str(workers),
+                     "MCP_HOST": "127.0.0.1", "MCP_PORT": str(port), "MCP_JSON_RESPONSE": "1",
+                     "REDMINE_URL": f"http://127.0.0.1:{fake_port}", "REDMINE_API_KEY": "bench"},
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            try:
+                await _wait_ready(f"http://127.0.0.1:{port}/metrics", server)
+                url = f"http://127.0.0.1:{port}/mcp"
+                # Warm every worker's connection pool before measuring.
+                await drive(url, args.tool, {"issue_id": 1}, workers * 20, workers * 4)
+                result = await drive(url, args.tool, {"issue_id": 1}, args.calls, args.concurrency)
+            finally:
+                _stop(server)
+            rows.append({"workers": workers, **result})
+    finally:
+        _stop(fake)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--calls", type=int, default=2000, help="Tool calls per worker count")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent HTTP requests")
+    parser.add_argument("--tool", default="get_issue", help="Tool to call (with issue_id=1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake Redmine latency per request (s)")
+    parser.add_argument("--fake-workers", type=int, default=2, help="Worker processes for the fake Redmine")
+    args = parser.parse_args()
+
+    rows = asyncio.run(main(args))
+    base = rows[0]["calls_per_second"] if rows else 0
+    print(f"{'workers':>8}{'calls/s':>10}{'speedup':>9}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for row in rows:
+        speedup = row["calls_per_second"] / base if base else 0
+        print(f"{row['workers']:>8}{row['calls_per_second']:>10}{speedup:>9.2f}"
+              f"{row['p50_ms']:>10}{row['p99_ms']:>10}{row['errors']:>8}")
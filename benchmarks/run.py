@@ -0,0 +1,185 @@
+"""Load benchmark for the Redmine MCP tools.
+
+Drives the real tools through FastMCP ``call_tool`` against the fake Redmine
+in ``benchmarks/fake_redmine.py`` and reports p50/p99 latency, calls per
+second and peak Python memory per scenario and concurrency level.
+
+Usage:
+    uv run python -m benchmarks.run
+    uv run python -m benchmarks.run --concurrency 1,16,64 --calls 500 --latency 0.05
+    uv run python -m benchmarks.run --http            # real TCP via uvicorn
+    uv run python -m benchmarks.run --save baseline.json
+    uv run python -m benchmarks.run --compare baseline.json --tolerance 0.2
+
+With --compare the exit status is 1 if any scenario's p99 grew or its
+throughput dropped by more than the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from benchmarks.fake_redmine import FakeRedmineConfig, create_app
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.server import create_server
+
+# Scenario name -> (tool name, argument factory taking the call index).
+SCENARIOS: dict[str, tuple[str, Callable[[int], dict[str, Any]]]] = {
+    "get_issue": ("get_issue", lambda i: {"issue_id": i % 5000 + 1}),
+    "get_issue_journals_compact": (
+        "get_issue", lambda i: {"issue_id": i % 5000 + 1, "include": "journals", "compact": True},
+    ),
+    "get_issue_journals": ("get_issue_journals", lambda i: {"issue_id": i % 5000 + 1, "limit": 3}),
+    "get_issues_50": ("get_issues", lambda i: {"issue_ids": [(i * 50 + n) % 5000 + 1 for n in range(50)]}),
+    "list_issues": ("list_issues", lambda i: {"project_id": f"project-{i % 20 + 1}", "limit": 100}),
+    "list_issues_fetch_all": (
+        "list_issues", lambda i: {"project_id": f"project-{i % 20 + 1}", "fetch_all": True},
+    ),
+    "search_issues": ("search_issues", lambda i: {"query": "subject", "limit": 25}),
+    "list_statuses": ("list_statuses", lambda i: {}),
+    "get_project": ("get_project", lambda i: {"project_id": f"project-{i % 20 + 1}", "include": "trackers"}),
+    "get_wiki_page": ("get_wiki_page", lambda i: {"project_id": "project-1", "title": f"Page{i % 30}"}),
+    "bulk_update_50": (
+        "bulk_update_issues", lambda i: {"issue_ids": [(i * 50 + n) % 5000 + 1 for n in range(50)], "status_id": 2},
+    ),
+}
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def run_scenario(mcp: Any, tool: str, make_args: Callable[[int], dict], calls: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await mcp.call_tool(tool, make_args(i))
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    return {
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "calls_per_second": round(calls / elapsed, 1),
+        "peak_memory_kib": round(peak / 1024, 1),
+        "errors": errors,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def main(args: argparse.Namespace) -> dict[str, dict[str, dict]]:
+    app = create_app(FakeRedmineConfig(latency=args.latency, description_size=args.payload))
+    server_task = None
+    if args.http:
+        import uvicorn
+
+        port = _free_port()
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        client = RedmineClient(url=f"http://127.0.0.1:{port}", api_key="bench")
+    else:
+        client = RedmineClient(url="http://fake-redmine", api_key="bench",
+                               transport=httpx.ASGITransport(app=app))
+    mcp = create_server(client)
+
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    levels = [int(c) for c in args.concurrency.split(",")]
+    results: dict[str, dict[str, dict]] = {}
+    tracemalloc.start()
+    try:
+        async with client:
+            for name in names:
+                tool, make_args = SCENARIOS[name]
+                results[name] = {}
+                for level in levels:
+                    results[name][str(level)] = await run_scenario(mcp, tool, make_args, args.calls, level)
+    finally:
+        tracemalloc.stop()
+        if server_task is not None:
+            server.should_exit = True
+            await server_task
+    return results
+
+
+def report(results: dict[str, dict[str, dict]]) -> None:
+    header = f"{'scenario':<28}{'conc':>6}{'p50 ms':>10}{'p99 ms':>10}{'calls/s':>10}{'peak KiB':>11}{'errors':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, levels in results.items():
+        for level, r in levels.items():
+            print(f"{name:<28}{level:>6}{r['p50_ms']:>10}{r['p99_ms']:>10}"
+                  f"{r['calls_per_second']:>10}{r['peak_memory_kib']:>11}{r['errors']:>8}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, levels in results.items():
+        for level, r in levels.items():
+            base = baseline.get(name, {}).get(level)
+            if base is None:
+                continue
+            if r["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+                regressions.append(f"{name}@{level}: p99 {base['p99_ms']} -> {r['p99_ms']} ms")
+            if r["calls_per_second"] < base["calls_per_second"] * (1 - tolerance):
+                regressions.append(
+                    f"{name}@{level}: throughput {base['calls_per_second']} -> {r['calls_per_second']} calls/s"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--calls", type=int, default=200, help="Tool calls per scenario and level")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake Redmine latency per request (s)")
+    parser.add_argument("--payload", type=int, default=500, help="Description / wiki text size (chars)")
+    parser.add_argument("--http", action="store_true", help="Serve the fake Redmine over TCP")
+    parser.add_argument("--save", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    # FastMCP configures INFO logging; per-request httpx lines would drown the report.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    results = asyncio.run(main(args))
+    report(results)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,78 @@
+"""Measure stdio cold start: process spawn to the first ``tools/list`` response.
+
+Each run starts ``main.py`` over stdio, sends ``initialize`` and
+``tools/list``, and times the reply. No Redmine is contacted.
+
+Usage:
+    uv run python -m benchmarks.startup --runs 10
+    uv run python -m benchmarks.startup --runs 10 --budget 1500
+
+With --budget the exit status is 1 if the median exceeds it (milliseconds).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+INITIALIZE = {
+    "jsonrpc": "2.0", "id": 1, "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {},
+               "clientInfo": {"name": "startup-benchmark", "version": "0"}},
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+LIST_TOOLS = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def measure_once(env: dict[str, str]) -> tuple[float, int]:
+    """Return (seconds to the tools/list response, number of tools)."""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "main.py"], cwd=ROOT, env=env,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    try:
+        for message in (INITIALIZE, INITIALIZED, LIST_TOOLS):
+            proc.stdin.write(json.dumps(message) + "\n")
+        proc.stdin.flush()
+        for line in proc.stdout:
+            reply = json.loads(line)
+            if reply.get("id") == 2:
+                return time.perf_counter() - started, len(reply["result"]["tools"])
+        raise RuntimeError("main.py exited before answering tools/list")
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Number of cold starts")
+    parser.add_argument("--budget", type=float, help="Fail if the median exceeds this many ms")
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "MCP_TRANSPORT": "stdio",
+        "REDMINE_URL": os.environ.get("REDMINE_URL", "http://127.0.0.1:9"),
+        "REDMINE_API_KEY": os.environ.get("REDMINE_API_KEY", "startup-benchmark"),
+    }
+    measure_once(env)  # Let the OS page cache and bytecode cache settle.
+    timings = []
+    tools = 0
+    for _ in range(args.runs):
+        elapsed, tools = measure_once(env)
+        timings.append(elapsed * 1000)
+    timings.sort()
+    median = statistics.median(timings)
+    print(f"tools/list after {median:.0f} ms median, {timings[0]:.0f} ms min, "
+          f"{timings[-1]:.0f} ms max over {args.runs} runs ({tools} tools)")
+    if args.budget is not None and median > args.budget:
+        print(f"Cold start over budget: {median:.0f} ms > {args.budget:.0f} ms", file=sys.stderr)
+        sys.exit(1)
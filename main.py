@@ -1,14 +1,24 @@
 import os
 
-from redmine_mcp.server import mcp
+from redmine_mcp.config import env_int
+from redmine_mcp.server import mcp, metrics
 
 if __name__ == "__main__":
     transport = os.environ.get("MCP_TRANSPORT", "stdio")
     if transport == "sse":
-        mcp.run(
-            transport="sse",
-            host=os.environ.get("MCP_HOST", "0.0.0.0"),
-            port=int(os.environ.get("MCP_PORT", "8000")),
+        mcp.run(transport="sse")
+    elif transport == "streamable-http":
+        import uvicorn
+
+        # An import string so uvicorn can start the app in each worker process.
+        uvicorn.run(
+            "redmine_mcp.asgi:app",
+            host=mcp.settings.host,
+            port=mcp.settings.port,
+            workers=env_int("MCP_WORKERS", 1),
+            log_level=mcp.settings.log_level.lower(),
         )
     else:
+        # No scrape endpoint over stdio: log one structured line per tool call.
+        metrics.log_calls = True
         mcp.run(transport="stdio")
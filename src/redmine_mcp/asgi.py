@@ -0,0 +1,13 @@
+"""ASGI entry point for the streamable HTTP transport.
+
+Run with several workers behind a load balancer, e.g.::
+
+    uvicorn redmine_mcp.asgi:app --workers 4 --host 0.0.0.0 --port 8000
+
+Each worker imports this module and builds its own server, client and
+connection pool.
+"""
+
+from redmine_mcp.server import create_http_app, mcp
+
+app = create_http_app(mcp)
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TYPE_CHECKING, Any
+
+from redmine_mcp.config import env_float
+from redmine_mcp.tenancy import cache_scope
+
+if TYPE_CHECKING:
+    from redmine_mcp.shared import SharedState
+
+DEFAULT_TTL = 3600.0
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is pending await the same result or exception. Nothing is kept once the
+    call completes.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Hashable, asyncio.Future[Any]] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.shared += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The caller that owned the call was cancelled; run it ourselves.
+                return await self.do(key, func)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure does not log "never retrieved".
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._pending.pop(key, None)
+
+
+def _scoped(key: Hashable) -> Hashable:
+    """Append the current user's scope to a key; the namespace stays first."""
+    scope = cache_scope()
+    if scope is None:
+        return key
+    return (*key, ("user", scope)) if isinstance(key, tuple) else (key, ("user", scope))
+
+
+class TTLCache:
+    """In-process cache whose entries expire ``ttl`` seconds after being stored.
+
+    Keys are tuples whose first element is a namespace (e.g. ``("project",
+    "myproj", "trackers")``) so related entries can be invalidated together.
+    Concurrent misses for the same key share a single fetch. Cached values are
+    shared between callers and must not be mutated. A ``ttl`` of ``0``
+    disables caching.
+
+    With ``shared``, entries are also written to ``SharedState`` and local
+    misses are looked up there, so worker processes fill the cache for each
+    other and invalidations reach every worker's next lookup of a key it has
+    not cached locally. Only tuple keys and JSON-serializable values are
+    shared; anything else stays local. Shared keys start with ``name``, so
+    caches sharing one store never invalidate each other's entries. Reads
+    and writes of the shared store run in a thread, so a worker waiting on
+    another's lock does not stall its event loop.
+
+    Entries stored while serving another user's credentials (see
+    ``tenancy.ClientPool``) are kept apart from the server's own and from
+    every other user's, since visible projects and even the Redmine instance
+    may differ.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        shared: "SharedState | None" = None,
+        name: str = "reference",
+    ):
+        self.ttl = ttl if ttl is not None else env_float("REDMINE_CACHE_TTL", DEFAULT_TTL)
+        self.shared = shared
+        self.name = name
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return ``(found, value)`` for a live entry, counting a hit or miss."""
+        key = _scoped(key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+        shared_key = self._shared_key(key)
+        if shared_key is not None:
+            found, value, expires_at = await asyncio.to_thread(self.shared.get, shared_key)
+            if found:
+                self._entries[key] = (time.monotonic() + expires_at - time.time(), value)
+                self.hits += 1
+                return True, value
+        self.misses += 1
+        return False, None
+
+    async def set(self, key: Hashable, value: Any) -> None:
+        key = _scoped(key)
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            shared_key = self._shared_key(key)
+            if shared_key is not None:
+                try:
+                    await asyncio.to_thread(self.shared.set, shared_key, value, self.ttl)
+                except TypeError:
+                    pass
+
+    def _shared_key(self, key: Hashable) -> str | None:
+        if self.shared is None or not isinstance(key, tuple):
+            return None
+        try:
+            return f"{self.name}:{json.dumps(list(key))}"
+        except TypeError:
+            return None
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, calling ``fetch`` on a miss."""
+        found, value = await self.get(key)
+        if found:
+            return value
+
+        async def fetch_and_store() -> Any:
+            value = await fetch()
+            await self.set(key, value)
+            return value
+
+        return await self._flight.do(_scoped(key), fetch_and_store)
+
+    async def invalidate(self, namespace: str | None = None) -> int:
+        """Drop all entries, or only those whose key starts with ``namespace``.
+
+        Only this cache's entries are dropped, also from ``shared``. Returns
+        the number of local entries removed.
+        """
+        if self.shared is not None:
+            prefix = f"{self.name}:"
+            if namespace is None:
+                await asyncio.to_thread(self.shared.delete, prefix)
+            else:
+                # Shared keys are JSON lists: '["ns", ...]', or '["ns"]' for a bare ("ns",).
+                encoded = json.dumps([namespace])
+                await asyncio.to_thread(self.shared.delete, prefix + encoded[:-1] + ",")
+                await asyncio.to_thread(self.shared.delete, prefix + encoded)
+        if namespace is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        keys = [k for k in self._entries if isinstance(k, tuple) and k and k[0] == namespace]
+        for k in keys:
+            del self._entries[k]
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,160 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_float
+from redmine_mcp.executor import BulkExecutor
+from redmine_mcp.pagination import MAX_PAGE_SIZE, Paginator
+
+if TYPE_CHECKING:
+    from redmine_mcp.shared import SharedState
+
+DEFAULT_CURSOR_TTL = 30 * 86400.0
+# Project key of the stored cursor of a feed over every project.
+ALL_PROJECTS = "*"
+
+
+def normalize_since(since: str) -> str:
+    """A date or ISO 8601 datetime as the UTC timestamp format Redmine returns."""
+    try:
+        parsed = datetime.fromisoformat(since)
+    except ValueError:
+        raise ValueError(f"since must be an ISO 8601 date or datetime (got {since!r})") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class Cursor:
+    """Position in the change feed of a project.
+
+    Issues are read in ``updated_on`` order from ``since`` on; ``seen`` holds
+    the issues already returned whose ``updated_on`` is exactly ``since``, so
+    that the next page (which starts at ``since`` inclusively, the filter's
+    resolution being one second) does not return them again.
+    """
+
+    project_id: str | None
+    since: str
+    seen: list[int] = field(default_factory=list)
+
+    def encode(self) -> str:
+        data = json.dumps({"p": self.project_id, "t": self.since, "s": self.seen}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            return cls(data["p"], data["t"], list(data["s"]))
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"Invalid cursor {token!r}") from None
+
+
+def cursor_cache(shared: "SharedState | None" = None) -> TTLCache:
+    """Cache for each project's last cursor, expiring after REDMINE_CHANGES_CURSOR_TTL seconds."""
+    return TTLCache(ttl=env_float("REDMINE_CHANGES_CURSOR_TTL", DEFAULT_CURSOR_TTL), shared=shared, name="changes")
+
+
+def field_deltas(journals: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Net change of each field over ``journals`` (oldest first): first old, last new value."""
+    deltas: dict[str, dict[str, Any]] = {}
+    for journal in journals:
+        for detail in journal.get("details", []):
+            prop, name = detail.get("property"), detail.get("name")
+            key = {"attr": name, "cf": f"cf_{name}"}.get(prop, f"{prop}_{name}")
+            delta = deltas.setdefault(key, {"old": detail.get("old_value")})
+            delta["new"] = detail.get("new_value")
+    return {k: d for k, d in deltas.items() if d["old"] != d["new"] or k.startswith(("attachment", "relation"))}
+
+
+def summarize(issue: dict[str, Any], since: str, seen: set[int]) -> dict[str, Any]:
+    """The compact change record of an issue: its new journals and field deltas."""
+
+    def is_new(journal: dict[str, Any]) -> bool:
+        created = journal.get("created_on") or ""
+        # Journals at exactly ``since`` were returned with the issue already if it was seen.
+        return created > since or (created == since and issue["id"] not in seen)
+
+    journals = sorted(
+        (j for j in issue.get("journals", []) if is_new(j)),
+        key=lambda j: (j.get("created_on") or "", j.get("id", 0)),
+    )
+    record: dict[str, Any] = {
+        "id": issue["id"],
+        "subject": issue.get("subject"),
+        "tracker": (issue.get("tracker") or {}).get("name"),
+        "status": (issue.get("status") or {}).get("name"),
+        "assigned_to": (issue.get("assigned_to") or {}).get("name"),
+        "updated_on": issue.get("updated_on"),
+        "created": (issue.get("created_on") or "") >= since,
+    }
+    if deltas := field_deltas(journals):
+        record["changes"] = deltas
+    notes = [
+        {
+            "id": j.get("id"),
+            "user": (j.get("user") or {}).get("name"),
+            "created_on": j.get("created_on"),
+            "notes": j["notes"],
+        }
+        for j in journals if j.get("notes")
+    ]
+    if notes:
+        record["journals"] = notes
+    return record
+
+
+async def fetch_changes(client: RedmineClient, cursor: Cursor, limit: int) -> dict[str, Any]:
+    """Up to ``limit`` issues changed since ``cursor``, oldest change first, and the next cursor.
+
+    One ``updated_on>=`` query lists the changed issues; their journals are
+    then fetched concurrently (skipped for issues created since the cursor
+    and not updated after).
+    """
+    seen = set(cursor.seen)
+    params: dict[str, Any] = {"status_id": "*", "sort": "updated_on,id", "updated_on": f">={cursor.since}"}
+    if cursor.project_id is not None:
+        params["project_id"] = cursor.project_id
+    wanted = limit + len(seen)
+    paginator = Paginator(
+        client, "/issues.json", "issues", params, max_items=wanted, page_size=min(wanted, MAX_PAGE_SIZE),
+    )
+    changed: list[dict[str, Any]] = []
+    skipped = 0
+    async for issue in paginator:
+        if issue["id"] in seen and issue.get("updated_on") == cursor.since:
+            skipped += 1
+        else:
+            changed.append(issue)
+    changed = changed[:limit]
+
+    with_history = [i for i in changed if i.get("updated_on") != i.get("created_on")]
+    report = await BulkExecutor().run(
+        with_history,
+        lambda issue: client.get(f"/issues/{issue['id']}.json", params={"include": "journals"}),
+    )
+    for outcome in report.outcomes:
+        if not outcome.ok:
+            raise outcome.error
+    detailed = {o.item["id"]: o.result["issue"] for o in report.outcomes}
+    records = [summarize(detailed.get(i["id"], i), cursor.since, seen) for i in changed]
+
+    if changed:
+        since = changed[-1]["updated_on"]
+        next_seen = [i["id"] for i in changed if i["updated_on"] == since]
+        if since == cursor.since:
+            next_seen = cursor.seen + next_seen
+        next_cursor = Cursor(cursor.project_id, since, next_seen)
+    else:
+        next_cursor = cursor
+    return {
+        "changes": records,
+        "cursor": next_cursor.encode(),
+        "has_more": (paginator.total_count or 0) > skipped + len(changed),
+    }
@@ -1,61 +1,407 @@
-import os
-from typing import Any
+import asyncio
+import copy
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from redmine_mcp.cache import SingleFlight
+from redmine_mcp.config import env_flag, env_float, env_int, env_required
+from redmine_mcp.resilience import (
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_TIMEOUT,
+    CircuitBreaker,
+    RateLimiter,
+    backoff_delay,
+    retry_after,
+)
+from redmine_mcp.scheduler import Scheduler, request_class
+from redmine_mcp.tenancy import current_tenant, tenant_scope
+
+if TYPE_CHECKING:
+    from redmine_mcp.httpcache import HttpCache
+    from redmine_mcp.metrics import Metrics
+    from redmine_mcp.shared import SharedState
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+
+# Methods whose repetition cannot duplicate a side effect. PUT is excluded
+# because a Redmine issue update with notes adds a journal each time.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Statuses that signal an overloaded or restarting upstream rather than a bad request.
+TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _never_sent(exc: BaseException | None, resp: httpx.Response | None) -> bool:
+    """True if the upstream certainly did not process the request."""
+    if resp is not None:
+        return resp.status_code == 429
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
 
 class RedmineClient:
-    """Async HTTP client for Redmine REST API."""
+    """Async HTTP client for Redmine REST API.
+
+    All requests share one long-lived ``httpx.AsyncClient`` so connections
+    (and their TLS sessions) are kept alive between tool calls. The pool is
+    opened lazily on first use or when the client is entered as an async
+    context manager, and closed when the outermost context exits.
+
+    Transient failures (429/502/503/504 and transport errors) are retried with
+    jittered exponential backoff, honoring ``Retry-After``. Idempotent requests
+    are retried on any transient failure; others only when the request never
+    reached Redmine. A per-host circuit breaker rejects requests immediately
+    with ``CircuitOpenError`` while the upstream keeps failing.
+
+    ``rate_limit`` caps requests per second to Redmine (every attempt counts).
+    With ``shared`` the cap is enforced jointly by all worker processes that
+    use the same ``SharedState``.
+
+    Every attempt first takes a slot from the ``Scheduler``, which queues
+    requests by priority (interactive reads, writes, then background work
+    marked with ``scheduler.background()``) and adapts how many may be in
+    flight to the upstream's latency and errors.
+
+    With ``http_cache``, GET responses are kept on disk and revalidated with
+    ``If-None-Match`` / ``If-Modified-Since`` before reuse (see ``HttpCache``).
+
+    ``with_credentials`` derives clients for other users that share all of
+    the above. While a tool call is being served for another user (see
+    ``tenancy.ClientPool``), this client forwards requests to that user's
+    client.
+    """
 
     def __init__(
         self,
         url: str | None = None,
         api_key: str | None = None,
+        *,
+        timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retries: int | None = None,
+        retry_backoff: float | None = None,
+        rate_limit: float | None = None,
+        shared: "SharedState | None" = None,
+        http_cache: "HttpCache | None" = None,
+        scheduler: Scheduler | None = None,
     ):
-        self.base_url = (url or os.environ["REDMINE_URL"]).rstrip("/")
-        self.api_key = api_key or os.environ["REDMINE_API_KEY"]
-        self._headers = {
-            "X-Redmine-API-Key": self.api_key,
-            "Content-Type": "application/json",
+        # REDMINE_URL / REDMINE_API_KEY are read on first use, so the server can
+        # start (and list its tools) before they are needed.
+        self._url = url
+        self._api_key = api_key
+        self.timeout = timeout if timeout is not None else env_float(
+            "REDMINE_TIMEOUT", DEFAULT_TIMEOUT,
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections if max_connections is not None else env_int(
+                "REDMINE_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS,
+            ),
+            max_keepalive_connections=(
+                max_keepalive_connections if max_keepalive_connections is not None
+                else env_int("REDMINE_MAX_KEEPALIVE_CONNECTIONS", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+            ),
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        )
+        self.http2 = http2 if http2 is not None else env_flag("REDMINE_HTTP2")
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._users = 0
+        self.retries = retries if retries is not None else env_int(
+            "REDMINE_RETRIES", DEFAULT_RETRIES,
+        )
+        self.retry_backoff = retry_backoff if retry_backoff is not None else env_float(
+            "REDMINE_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF,
+        )
+        self.rate_limit = rate_limit if rate_limit is not None else env_float(
+            "REDMINE_RATE_LIMIT", 0.0,
+        )
+        self._limiter = RateLimiter(self.rate_limit, shared, name="upstream")
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._flight = SingleFlight()
+        self.http_cache = http_cache
+        self.scheduler = scheduler if scheduler is not None else Scheduler(
+            env_int("REDMINE_SCHEDULER_MAX_CONCURRENCY", self.limits.max_connections or DEFAULT_MAX_CONNECTIONS),
+        )
+        self.request_count = 0
+        self.retry_count = 0
+        self.metrics: "Metrics | None" = None
+        # Set on clients made by with_credentials; None for the server's own.
+        self.scope: str | None = None
+        self._root = self
+
+    @property
+    def base_url(self) -> str:
+        if self._url is None:
+            self._url = env_required("REDMINE_URL")
+        return self._url.rstrip("/")
+
+    @property
+    def api_key(self) -> str:
+        if self._api_key is None:
+            self._api_key = env_required("REDMINE_API_KEY")
+        return self._api_key
+
+    @property
+    def _headers(self) -> dict[str, str]:
+        return {"X-Redmine-API-Key": self.api_key, "Content-Type": "application/json"}
+
+    async def __aenter__(self) -> "RedmineClient":
+        self._users += 1
+        self._client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._users -= 1
+        if self._users <= 0:
+            self._users = 0
+            await self.aclose()
+
+    def with_credentials(self, url: str, api_key: str) -> "RedmineClient":
+        """A client for another user sharing this client's pool, breakers and limits."""
+        tenant = copy.copy(self)
+        tenant._url = url.rstrip("/")
+        tenant._api_key = api_key
+        tenant.scope = tenant_scope(tenant.base_url, api_key)
+        return tenant
+
+    def current(self) -> "RedmineClient":
+        """The client for the user whose tool call is being served."""
+        if self._root is self:
+            tenant = current_tenant.get()
+            if tenant is not None and tenant._root is self:
+                return tenant
+        return self
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the shared connection pool, creating it on first use."""
+        if self._root is not self:
+            return self._root._client()
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the connection pool. It is reopened on the next request."""
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        host = httpx.URL(url).host
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=env_int("REDMINE_BREAKER_THRESHOLD", DEFAULT_FAILURE_THRESHOLD),
+                reset_timeout=env_float("REDMINE_BREAKER_RESET", DEFAULT_RESET_TIMEOUT),
+            )
+        return breaker
+
+    def stats(self) -> dict[str, Any]:
+        """Request, retry and circuit breaker counters (shared by all users)."""
+        root = self._root
+        stats = {
+            "requests": root.request_count,
+            "retries": root.retry_count,
+            "coalesced": self._flight.shared,
+            "breakers": {host: b.stats() for host, b in self._breakers.items()},
+            "scheduler": self.scheduler.stats(),
         }
+        if self.http_cache is not None:
+            stats["http_cache"] = self.http_cache.stats()
+        return stats
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        stream: bool = False,
+        body: Callable[[], AsyncIterator[bytes]] | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request with rate limiting, circuit breaking and retries.
+
+        ``body`` produces a fresh streamed request body for every attempt.
+        """
+        url = f"{self.base_url}{path}"
+        headers = {**self._headers, **headers} if headers else self._headers
+        breaker = self._breaker(url)
+        priority = request_class(method in IDEMPOTENT_METHODS)
+        attempt = 0
+        while True:
+            await self.scheduler.acquire(priority)
+            latency: float | None = None
+            resp: httpx.Response | None = None
+            error: Exception | None = None
+            try:
+                await self._limiter.acquire()
+                breaker.before_request()
+                self._root.request_count += 1
+                started = time.perf_counter()
+                if body is not None:
+                    kwargs["content"] = body()
+                try:
+                    if stream:
+                        # The slot covers the wait for the response headers.
+                        http = self._client()
+                        request = http.build_request(method, url, headers=headers, **kwargs)
+                        resp = await http.send(request, stream=True)
+                    else:
+                        resp = await self._client().request(method, url, headers=headers, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+                except BaseException:
+                    breaker.release()
+                    raise
+                latency = time.perf_counter() - started
+            finally:
+                congested = error is not None or (resp is not None and resp.status_code in TRANSIENT_STATUS_CODES)
+                self.scheduler.release(priority, latency, congested)
+            if self.metrics is not None:
+                self.metrics.observe_upstream(
+                    method,
+                    resp.status_code if resp is not None else None,
+                    latency,
+                    int(resp.request.headers.get("Content-Length", 0)) if resp is not None else 0,
+                    len(resp.content) if resp is not None and not stream else 0,
+                )
+
+            if resp is not None and resp.status_code not in TRANSIENT_STATUS_CODES:
+                breaker.record_success()
+                if stream and resp.is_error:
+                    await resp.aclose()
+                if resp.status_code != httpx.codes.NOT_MODIFIED:
+                    resp.raise_for_status()
+                if method not in IDEMPOTENT_METHODS and self.http_cache is not None:
+                    await asyncio.to_thread(self.http_cache.expire)
+                return resp
+            if resp is not None and stream:
+                await resp.aclose()
+            if resp is not None and resp.status_code == 429:
+                # Throttled, not down: don't count toward opening the circuit.
+                breaker.release()
+            else:
+                breaker.record_failure()
+
+            retryable = method in IDEMPOTENT_METHODS or _never_sent(error, resp)
+            if attempt >= self.retries or not retryable:
+                if error is not None:
+                    raise error
+                resp.raise_for_status()
+            delay = retry_after(resp) if resp is not None else None
+            if delay is None:
+                delay = backoff_delay(attempt, self.retry_backoff)
+            attempt += 1
+            self._root.retry_count += 1
+            await asyncio.sleep(delay)
 
     async def get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}{path}",
-                headers=self._headers,
-                params=params,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        if (tenant := self.current()) is not self:
+            return await tenant.get(path, params)
+        key = (
+            self._headers["X-Redmine-API-Key"],
+            self.base_url,
+            path,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        )
+        if self.http_cache is not None:
+            body = await self._flight.do(key, lambda: self._get_cached(path, params))
+            return json.loads(body)
+        resp = await self._flight.do(key, lambda: self._request("GET", path, params=params))
+        return resp.json()
+
+    async def _get_cached(self, path: str, params: dict[str, Any] | None) -> bytes:
+        """GET a response body through the disk cache, revalidating stored entries."""
+        cache = self.http_cache
+        key = cache.key(tenant_scope(self.base_url, self.api_key), path, params)
+        entry = await asyncio.to_thread(cache.lookup, key)
+        if entry is not None and entry.fresh:
+            return entry.body
+        headers = entry.validators() if entry is not None else None
+        resp = await self._request("GET", path, headers=headers, params=params)
+        if resp.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            await asyncio.to_thread(cache.refresh, key)
+            return entry.body
+        await asyncio.to_thread(
+            cache.store, key, resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+        )
+        return resp.content
+
+    @asynccontextmanager
+    async def stream(self, path: str, params: dict[str, Any] | None = None) -> AsyncIterator[httpx.Response]:
+        """GET ``path`` and yield the response before its body is read.
+
+        Failures before the response arrives are retried as for ``get``. The
+        caller reads the body incrementally (``aiter_bytes``) and may stop
+        early; the connection is released when the context exits.
+        """
+        if (tenant := self.current()) is not self:
+            async with tenant.stream(path, params) as resp:
+                yield resp
+            return
+        resp = await self._request("GET", path, stream=True, params=params)
+        try:
+            yield resp
+        finally:
+            await resp.aclose()
+            if self.metrics is not None:
+                self.metrics.observe_streamed("GET", resp.num_bytes_downloaded)
 
     async def post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self.base_url}{path}",
-                headers=self._headers,
-                json=json,
-            )
-            resp.raise_for_status()
-            if resp.status_code == 204:
-                return {}
-            return resp.json()
+        if (tenant := self.current()) is not self:
+            return await tenant.post(path, json)
+        resp = await self._request("POST", path, json=json)
+        if resp.status_code == 204:
+            return {}
+        return resp.json()
+
+    async def upload(
+        self,
+        body: Callable[[], AsyncIterator[bytes]],
+        size: int,
+        filename: str | None = None,
+    ) -> dict[str, Any]:
+        """Stream a file to /uploads.json and return Redmine's ``{"upload": {...}}`` reply.
+
+        ``body`` is called for each attempt and must yield the ``size`` bytes
+        of the file; nothing is buffered beyond the chunk being sent.
+        """
+        if (tenant := self.current()) is not self:
+            return await tenant.upload(body, size, filename)
+        resp = await self._request(
+            "POST", "/uploads.json",
+            body=body,
+            headers={"Content-Type": "application/octet-stream", "Content-Length": str(size)},
+            params={"filename": filename} if filename else None,
+        )
+        return resp.json()
 
     async def put(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            resp = await client.put(
-                f"{self.base_url}{path}",
-                headers=self._headers,
-                json=json,
-            )
-            resp.raise_for_status()
-            return {}
+        if (tenant := self.current()) is not self:
+            return await tenant.put(path, json)
+        await self._request("PUT", path, json=json)
+        return {}
 
     async def delete(self, path: str) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            resp = await client.delete(
-                f"{self.base_url}{path}",
-                headers=self._headers,
-            )
-            resp.raise_for_status()
-            return {}
+        if (tenant := self.current()) is not self:
+            return await tenant.delete(path)
+        await self._request("DELETE", path)
+        return {}
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from redmine_mcp.config import env_float, env_int
+from redmine_mcp.resilience import RateLimiter
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass
+class Outcome(Generic[T]):
+    """Result of running one item through the executor."""
+
+    item: T
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkReport(Generic[T]):
+    """Per-item outcomes (in input order) plus timing for a bulk run."""
+
+    outcomes: list[Outcome[T]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for o in self.outcomes if o.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.outcomes) - self.succeeded
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "items_per_second": round(len(self.outcomes) / self.elapsed, 2) if self.elapsed else None,
+        }
+
+
+class BulkExecutor:
+    """Runs an async function over many items with bounded concurrency.
+
+    At most ``max_concurrency`` calls are in flight at once and new calls are
+    started no faster than ``rate_limit`` per second. Failures never abort
+    the batch. Items are not retried here: ``RedmineClient`` already retries
+    transient errors, and only where a repeat is safe (a PUT with notes that
+    may have reached Redmine would add the journal twice).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        rate_limit: float | None = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency or env_int(
+            "REDMINE_BULK_CONCURRENCY", DEFAULT_MAX_CONCURRENCY,
+        ))
+        self.rate_limit = rate_limit if rate_limit is not None else env_float(
+            "REDMINE_BULK_RATE_LIMIT", 0.0,
+        )
+
+    async def run(
+        self,
+        items: Iterable[T],
+        func: Callable[[T], Awaitable[Any]],
+    ) -> BulkReport[T]:
+        outcomes = [Outcome(item) for item in items]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = RateLimiter(self.rate_limit)
+
+        async def attempt(outcome: Outcome[T]) -> None:
+            async with semaphore:
+                await limiter.acquire()
+                try:
+                    outcome.result = await func(outcome.item)
+                except Exception as e:
+                    outcome.error = e
+
+        started = time.monotonic()
+        await asyncio.gather(*(attempt(o) for o in outcomes))
+        return BulkReport(outcomes=outcomes, elapsed=time.monotonic() - started)
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from redmine_mcp.config import env_float
+
+DEFAULT_MAX_MB = 100.0
+# Last access times are only rewritten when older than this, so that
+# hits do not turn every read into a write.
+TOUCH_INTERVAL = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fresh_until REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and the validators to revalidate it with."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fresh: bool
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Persistent cache of GET response bodies, shared by every process using ``path``.
+
+    Responses are stored with their ``ETag`` / ``Last-Modified`` validators
+    in a SQLite file (WAL mode), compressed, and revalidated with a
+    conditional request before reuse: an unchanged resource costs a 304
+    instead of its full payload. Within ``max_age`` seconds of being stored
+    or revalidated an entry is served without asking Redmine at all; any
+    write through the client ends that window for every entry.
+
+    The file is kept under ``max_bytes`` by evicting the least recently used
+    entries. Keys include the credentials' scope, so users never see each
+    other's responses.
+    """
+
+    def __init__(self, path: str, max_bytes: int | None = None, max_age: float | None = None):
+        self.path = path
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            env_float("REDMINE_HTTP_CACHE_MAX_MB", DEFAULT_MAX_MB) * 1024 * 1024,
+        )
+        self.max_age = max_age if max_age is not None else env_float("REDMINE_HTTP_CACHE_MAX_AGE", 0.0)
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=10.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "HttpCache | None":
+        """Open REDMINE_HTTP_CACHE_PATH, or return None if it is not set."""
+        path = os.environ.get("REDMINE_HTTP_CACHE_PATH")
+        return cls(path) if path else None
+
+    @staticmethod
+    def key(scope: str, path: str, params: dict[str, Any] | None) -> str:
+        query = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return hashlib.sha256(json.dumps([scope, path, query]).encode()).hexdigest()
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, body, fresh_until, accessed_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and now - row[4] > TOUCH_INTERVAL:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        if row is None:
+            return None
+        fresh = row[3] > now
+        if fresh:
+            self.hits += 1
+        return CachedResponse(zlib.decompress(row[2]), row[0], row[1], fresh)
+
+    def refresh(self, key: str) -> None:
+        """Record that Redmine confirmed the entry unchanged (a 304)."""
+        self.revalidated += 1
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET fresh_until = ?, accessed_at = ? WHERE key = ?",
+                (now + self.max_age, now, key),
+            )
+
+    def store(self, key: str, body: bytes, etag: str | None, last_modified: str | None) -> None:
+        """Keep a response body, if it can be revalidated or reused at all."""
+        self.misses += 1
+        if not etag and not last_modified and self.max_age <= 0:
+            return
+        data = zlib.compress(body, 1)
+        if len(data) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, etag, last_modified, body, size, fresh_until, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, etag, last_modified, data, len(data), now + self.max_age, now),
+                )
+                self._evict()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used entries until the rest fit, leaving some
+        # headroom so that the next stores do not each evict again.
+        target = total - self.max_bytes * 0.9
+        freed = 0
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if freed >= target:
+                break
+            victims.append((key,))
+            freed += size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def expire(self) -> None:
+        """Make every entry be revalidated before its next use."""
+        if self.max_age <= 0:
+            return
+        with self._lock:
+            self._db.execute("UPDATE responses SET fresh_until = 0 WHERE fresh_until > ?", (time.time(),))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
@@ -0,0 +1,295 @@
+import asyncio
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from redmine_mcp.config import env_float, env_int
+from redmine_mcp.scheduler import background
+from redmine_mcp.tenancy import cache_scope
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_RETENTION = 86400.0
+# Running jobs are marked alive this often; a job not marked for
+# STALE_AFTER seconds belongs to a process that is gone and may be resumed.
+HEARTBEAT_INTERVAL = 15.0
+STALE_AFTER = 60.0
+# Progress is written to the job store at most this often.
+CHECKPOINT_INTERVAL = 1.0
+# How long cancel() waits for a job running here to stop.
+CANCEL_WAIT = 1.0
+
+ACTIVE = ("queued", "running")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    heartbeat REAL NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+class JobCancelled(Exception):
+    """Raised at a checkpoint of a job that was cancelled from another process."""
+
+
+@dataclass
+class Job:
+    """A long-running operation and its progress."""
+
+    id: str
+    kind: str
+    params: dict[str, Any]
+    scope: str | None = None
+    status: str = "queued"
+    total: int | None = None
+    done: int = 0
+    failed: int = 0
+    results: list[Any] = field(default_factory=list)
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self, results_offset: int = 0, results_limit: int | None = None) -> dict[str, Any]:
+        """Public view of the job, with a window of its (partial) results."""
+        end = None if results_limit is None else results_offset + results_limit
+        data = {k: v for k, v in asdict(self).items() if k not in ("params", "scope", "results")}
+        data["results"] = self.results[results_offset:end]
+        data["results_total"] = len(self.results)
+        return data
+
+
+class JobQueue:
+    """Runs submitted jobs in the background, at most ``max_workers`` at a time.
+
+    Jobs run as tasks on the server's event loop and report progress through
+    their ``Job``. Each kind of job has a runner registered with
+    ``register``; runners call ``checkpoint`` as they make progress.
+
+    With a ``path``, jobs are kept in a SQLite file: their status is visible
+    to every worker process sharing it, and jobs left unfinished by a process
+    that stopped are resumed by ``run`` elsewhere or after a restart. Jobs
+    submitted with per-user credentials cannot be resumed (credentials are
+    never stored) and are marked failed instead.
+    """
+
+    def __init__(self, max_workers: int | None = None, path: str | None = None):
+        self.max_workers = max(1, max_workers or env_int("REDMINE_JOB_WORKERS", DEFAULT_WORKERS))
+        self.retention = env_float("REDMINE_JOB_RETENTION", DEFAULT_RETENTION)
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._runners: dict[str, Callable[[Job], Awaitable[None]]] = {}
+        self._jobs: dict[str, Job] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._cancelling: set[str] = set()
+        self._saved: dict[str, float] = {}
+        self._db: "sqlite3.Connection | None" = None
+        self._lock = threading.Lock()
+        if path:
+            # Only imported when persistence is configured, like the other stores.
+            import sqlite3
+
+            self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=10.0)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> "JobQueue":
+        """A queue persisted to REDMINE_JOBS_PATH if it is set."""
+        return cls(path=os.environ.get("REDMINE_JOBS_PATH") or None)
+
+    def register(self, kind: str, runner: Callable[[Job], Awaitable[None]]) -> None:
+        self._runners[kind] = runner
+
+    def submit(self, kind: str, params: dict[str, Any]) -> Job:
+        """Queue a job of a registered kind and return it without waiting."""
+        if kind not in self._runners:
+            raise ValueError(f"Unknown job kind {kind!r}")
+        self._prune()
+        job = Job(id=secrets.token_hex(8), kind=kind, params=params, scope=cache_scope())
+        self._start(job)
+        return job
+
+    def _start(self, job: Job) -> None:
+        self._jobs[job.id] = job
+        self._save(job, force=True)
+        self._tasks[job.id] = asyncio.create_task(self._run(job))
+
+    async def _run(self, job: Job) -> None:
+        try:
+            async with self._slots:
+                job.status = "running"
+                job.started_at = time.time()
+                self._save(job, force=True)
+                with background():
+                    await self._runners[job.kind](job)
+                job.status = "completed"
+        except JobCancelled:
+            job.status = "cancelled"
+        except asyncio.CancelledError:
+            if job.id not in self._cancelling:
+                # The server is shutting down: leave the job to be resumed.
+                self._save(job, force=True)
+                raise
+            job.status = "cancelled"
+        except Exception as e:
+            logger.warning("Job %s (%s) failed: %s", job.id, job.kind, e)
+            job.status = "failed"
+            job.error = str(e)
+        self._cancelling.discard(job.id)
+        self._tasks.pop(job.id, None)
+        job.finished_at = time.time()
+        self._save(job, force=True)
+
+    def checkpoint(self, job: Job) -> None:
+        """Record the progress of a running job; raises JobCancelled if cancelled elsewhere."""
+        self._save(job)
+        if self._db is not None:
+            with self._lock:
+                row = self._db.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job.id,)).fetchone()
+            if row is not None and row[0]:
+                raise JobCancelled(job.id)
+
+    def get(self, job_id: str) -> Job | None:
+        """The job, if it exists and was submitted with the current credentials."""
+        job = self._jobs.get(job_id) or self._load(job_id)
+        return job if job is not None and job.scope == cache_scope() else None
+
+    def list_jobs(self) -> list[Job]:
+        """Jobs of the current credentials, newest first."""
+        jobs = {j.id: j for j in self._load_all()}
+        jobs.update(self._jobs)
+        scope = cache_scope()
+        return sorted((j for j in jobs.values() if j.scope == scope), key=lambda j: -j.created_at)
+
+    async def cancel(self, job_id: str, wait: float = CANCEL_WAIT) -> Job:
+        """Stop a job; it is still active on return if it did not stop within ``wait``."""
+        job = self.get(job_id)
+        if job is None:
+            raise ValueError(f"No job {job_id!r}")
+        if job.status not in ACTIVE:
+            return job
+        task = self._tasks.get(job_id)
+        if task is not None:
+            self._cancelling.add(job_id)
+            task.cancel()
+            await asyncio.wait({task}, timeout=wait)
+        elif self._db is not None:
+            # Running in another process: it stops at its next checkpoint.
+            with self._lock:
+                self._db.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+        return job
+
+    def _save(self, job: Job, force: bool = False) -> None:
+        if self._db is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._saved.get(job.id, 0.0) < CHECKPOINT_INTERVAL:
+            return
+        self._saved[job.id] = now
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, status, heartbeat, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET status = excluded.status, "
+                "heartbeat = excluded.heartbeat, data = excluded.data",
+                (job.id, job.status, time.time(), json.dumps(asdict(job))),
+            )
+
+    def _load(self, job_id: str) -> Job | None:
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job(**json.loads(row[0])) if row is not None else None
+
+    def _load_all(self) -> list[Job]:
+        if self._db is None:
+            return []
+        with self._lock:
+            rows = self._db.execute("SELECT data FROM jobs").fetchall()
+        return [Job(**json.loads(row[0])) for row in rows]
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        for job_id, job in list(self._jobs.items()):
+            if job.status not in ACTIVE and (job.finished_at or 0) < cutoff:
+                del self._jobs[job_id]
+                self._saved.pop(job_id, None)
+        if self._db is not None:
+            with self._lock:
+                self._db.execute(
+                    "DELETE FROM jobs WHERE status NOT IN (?, ?) AND heartbeat < ?", (*ACTIVE, cutoff),
+                )
+
+    def resume(self) -> int:
+        """Take over unfinished jobs whose process stopped; returns how many were resumed."""
+        if self._db is None:
+            return 0
+        stale = time.time() - STALE_AFTER
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE status IN (?, ?) AND heartbeat < ?", (*ACTIVE, stale),
+            ).fetchall()
+        resumed = 0
+        for (job_id,) in rows:
+            if job_id in self._tasks:
+                continue
+            with self._lock:
+                # Claim the job so that no other process resumes it too.
+                claimed = self._db.execute(
+                    "UPDATE jobs SET heartbeat = ? WHERE id = ? AND heartbeat < ?", (time.time(), job_id, stale),
+                ).rowcount
+            job = self._load(job_id) if claimed else None
+            if job is None:
+                continue
+            if job.scope is not None or job.kind not in self._runners:
+                job.status = "failed"
+                job.error = "Interrupted by a restart; submit it again"
+                job.finished_at = time.time()
+                self._save(job, force=True)
+                continue
+            logger.info("Resuming job %s (%s) at %d/%s", job.id, job.kind, job.done, job.total)
+            job.status = "queued"
+            self._start(job)
+            resumed += 1
+        return resumed
+
+    def _heartbeat(self) -> None:
+        if self._db is None or not self._tasks:
+            return
+        ids = list(self._tasks)
+        with self._lock:
+            self._db.execute(
+                f"UPDATE jobs SET heartbeat = ? WHERE id IN ({','.join('?' * len(ids))})",
+                (time.time(), *ids),
+            )
+
+    async def run(self) -> None:
+        """Keep this process's jobs marked alive and resume abandoned ones, forever."""
+        if self._db is None:
+            return
+        import sqlite3
+
+        while True:
+            try:
+                self._heartbeat()
+                self.resume()
+            except sqlite3.Error as e:
+                logger.warning("Job store unavailable: %s", e)
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    def stats(self) -> dict[str, Any]:
+        return {"running": len(self._tasks), "known": len(self._jobs), "workers": self.max_workers}
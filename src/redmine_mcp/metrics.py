@@ -0,0 +1,212 @@
+import functools
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CALL_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+@dataclass
+class _Invocation:
+    upstream_calls: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+_current: ContextVar[_Invocation | None] = ContextVar("redmine_mcp_invocation", default=None)
+
+
+def _error_code(exc: BaseException) -> str:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return str(exc.response.status_code)
+    return type(exc).__name__
+
+
+def _labels(**labels: str) -> str:
+    inner = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    return "{" + inner + "}" if inner else ""
+
+
+class Metrics:
+    """Per-tool and upstream request metrics with Prometheus text exposition.
+
+    Tools are timed by wrapping them at registration (see ``instrument``);
+    ``RedmineClient`` reports each upstream request through
+    ``observe_upstream``, which is attributed to the tool invocation that
+    issued it. With ``log_calls`` every tool call is also written as a JSON
+    log line, for stdio deployments without a scrape endpoint.
+    """
+
+    def __init__(self, log_calls: bool = False):
+        self.log_calls = log_calls
+        self.tool_latency: dict[str, Histogram] = {}
+        self.tool_upstream_calls: dict[str, Histogram] = {}
+        self.tool_calls: Counter[tuple[str, str]] = Counter()
+        self.tool_errors: Counter[tuple[str, str]] = Counter()
+        self.upstream_latency: dict[str, Histogram] = {}
+        self.upstream_responses: Counter[tuple[str, str]] = Counter()
+        self.upstream_bytes_in: Counter[str] = Counter()
+        self.upstream_bytes_out: Counter[str] = Counter()
+        self._observed: list[tuple[str, str, str, Callable[[], float]]] = []
+
+    def add_gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Expose a value owned elsewhere (e.g. pool size) at scrape time."""
+        self._observed.append((name, help_text, "gauge", read))
+
+    def add_counter(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Expose a running total owned elsewhere (e.g. cache hits) at scrape time.
+
+        The total must only grow for the life of the process, so that
+        ``rate()`` can tell a restart from a decrease.
+        """
+        self._observed.append((name, help_text, "counter", read))
+
+    def observe_upstream(
+        self,
+        method: str,
+        status: int | None,
+        elapsed: float,
+        bytes_out: int,
+        bytes_in: int,
+    ) -> None:
+        self.upstream_latency.setdefault(method, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+        self.upstream_responses[(method, str(status) if status is not None else "error")] += 1
+        self.upstream_bytes_out[method] += bytes_out
+        self.upstream_bytes_in[method] += bytes_in
+        invocation = _current.get()
+        if invocation is not None:
+            invocation.upstream_calls += 1
+            invocation.bytes_in += bytes_in
+            invocation.bytes_out += bytes_out
+
+    def observe_streamed(self, method: str, bytes_in: int) -> None:
+        """Count the body of a streamed response, read after ``observe_upstream``."""
+        self.upstream_bytes_in[method] += bytes_in
+        invocation = _current.get()
+        if invocation is not None:
+            invocation.bytes_in += bytes_in
+
+    def wrap_tool(self, fn: Callable[..., Any], name: str) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            invocation = _Invocation()
+            token = _current.set(invocation)
+            started = time.perf_counter()
+            error: BaseException | None = None
+            try:
+                return await fn(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                _current.reset(token)
+                self._record_tool(name, time.perf_counter() - started, invocation, error)
+
+        return wrapper
+
+    def _record_tool(
+        self,
+        name: str,
+        elapsed: float,
+        invocation: _Invocation,
+        error: BaseException | None,
+    ) -> None:
+        self.tool_latency.setdefault(name, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+        self.tool_upstream_calls.setdefault(name, Histogram(CALL_COUNT_BUCKETS)).observe(
+            invocation.upstream_calls,
+        )
+        self.tool_calls[(name, "ok" if error is None else "error")] += 1
+        if error is not None:
+            self.tool_errors[(name, _error_code(error))] += 1
+        if self.log_calls:
+            logger.info(json.dumps({
+                "event": "tool_call",
+                "tool": name,
+                "status": "ok" if error is None else "error",
+                "error_code": _error_code(error) if error is not None else None,
+                "duration_ms": round(elapsed * 1000, 2),
+                "upstream_calls": invocation.upstream_calls,
+                "upstream_bytes_in": invocation.bytes_in,
+                "upstream_bytes_out": invocation.bytes_out,
+            }))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def histogram(name: str, help_text: str, series: dict[str, Histogram], label: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, h in sorted(series.items()):
+                for bound, count in zip(h.buckets, h.counts):
+                    lines.append(f"{name}_bucket{_labels(**{label: key, 'le': str(bound)})} {count}")
+                lines.append(f"{name}_bucket{_labels(**{label: key, 'le': '+Inf'})} {h.count}")
+                lines.append(f"{name}_sum{_labels(**{label: key})} {h.sum}")
+                lines.append(f"{name}_count{_labels(**{label: key})} {h.count}")
+
+        def counter(name: str, help_text: str, series: Counter, labels: tuple[str, ...]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(series.items()):
+                values = key if isinstance(key, tuple) else (key,)
+                lines.append(f"{name}{_labels(**dict(zip(labels, values)))} {value}")
+
+        histogram("redmine_mcp_tool_duration_seconds", "Tool call latency.",
+                  self.tool_latency, "tool")
+        histogram("redmine_mcp_tool_upstream_calls", "Upstream requests per tool call.",
+                  self.tool_upstream_calls, "tool")
+        counter("redmine_mcp_tool_calls_total", "Tool calls by outcome.",
+                self.tool_calls, ("tool", "outcome"))
+        counter("redmine_mcp_tool_errors_total", "Tool errors by upstream status or exception.",
+                self.tool_errors, ("tool", "code"))
+        histogram("redmine_upstream_duration_seconds", "Upstream request latency.",
+                  self.upstream_latency, "method")
+        counter("redmine_upstream_responses_total", "Upstream responses by status code.",
+                self.upstream_responses, ("method", "status"))
+        counter("redmine_upstream_bytes_sent_total", "Request body bytes sent to Redmine.",
+                self.upstream_bytes_out, ("method",))
+        counter("redmine_upstream_bytes_received_total", "Response body bytes received from Redmine.",
+                self.upstream_bytes_in, ("method",))
+        for name, help_text, kind, read in self._observed:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {read()}")
+        return "\n".join(lines) + "\n"
+
+
+def instrument(mcp: FastMCP, metrics: Metrics) -> None:
+    """Time every tool registered on ``mcp`` from now on."""
+    add_tool = mcp.add_tool
+
+    def add_instrumented_tool(fn: Callable[..., Any], name: str | None = None, **kwargs: Any) -> None:
+        add_tool(metrics.wrap_tool(fn, name or fn.__name__), name=name, **kwargs)
+
+    mcp.add_tool = add_instrumented_tool
@@ -0,0 +1,405 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_float, env_flag
+from redmine_mcp.executor import BulkExecutor
+from redmine_mcp.pagination import Paginator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 300.0
+# Scope name for a mirror of every visible issue (no project filter).
+ALL_PROJECTS = "*"
+BATCH_SIZE = 100
+# Redmine sort keys that map directly onto mirror columns.
+SORT_COLUMNS = {
+    "id": "id",
+    "subject": "subject",
+    "created_on": "created_on",
+    "updated_on": "updated_on",
+}
+_ID_LIST = re.compile(r"^\d+(\|\d+)*$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER,
+    tracker_id INTEGER,
+    status_id INTEGER,
+    priority_id INTEGER,
+    assigned_to_id INTEGER,
+    subject TEXT,
+    created_on TEXT,
+    updated_on TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_scopes (
+    scope TEXT NOT NULL,
+    issue_id INTEGER NOT NULL,
+    PRIMARY KEY (scope, issue_id)
+);
+CREATE TABLE IF NOT EXISTS statuses (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    is_closed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    project_id INTEGER,
+    cursor TEXT,
+    synced_at REAL
+);
+"""
+
+
+def _ref_id(issue: dict[str, Any], name: str) -> int | None:
+    ref = issue.get(name)
+    return ref.get("id") if isinstance(ref, dict) else None
+
+
+def _id_filter(value: str | int | None) -> list[int] | None:
+    """Parse a Redmine "1|2|3" id filter, or return None if it is not one."""
+    if value is None:
+        return None
+    text = str(value)
+    return [int(v) for v in text.split("|")] if _ID_LIST.match(text) else None
+
+
+class IssueMirror:
+    """Local SQLite copy of Redmine issues for fast, offline list and search.
+
+    Each mirrored *scope* is a project identifier (or ``"*"`` for all visible
+    issues) kept up to date by incremental syncs that fetch only issues with
+    ``updated_on`` at or after the last cursor. Queries on a scope that has not
+    been synced within ``max_age`` seconds trigger a sync first. Issues deleted
+    in Redmine or moved out of a scope are only dropped by a full sync.
+
+    Subject, description and (optionally) journal notes are indexed with FTS5
+    using the trigram tokenizer when available, which also matches Japanese
+    text without word boundaries.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        scopes: Iterable[str] = (ALL_PROJECTS,),
+        max_age: float | None = None,
+        with_journals: bool = False,
+    ):
+        self.path = path
+        self.scopes = list(scopes) or [ALL_PROJECTS]
+        self.max_age = max_age if max_age is not None else env_float(
+            "REDMINE_MIRROR_MAX_AGE", DEFAULT_MAX_AGE,
+        )
+        self.with_journals = with_journals
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+        self.trigram = self._create_fts()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def from_env(cls) -> "IssueMirror | None":
+        """Build the mirror configured by REDMINE_MIRROR_* variables, if enabled."""
+        path = os.environ.get("REDMINE_MIRROR_PATH")
+        if not path:
+            return None
+        scopes = [
+            s.strip() for s in os.environ.get("REDMINE_MIRROR_PROJECTS", "").split(",") if s.strip()
+        ]
+        return cls(path, scopes=scopes, with_journals=env_flag("REDMINE_MIRROR_JOURNALS"))
+
+    def _create_fts(self) -> bool:
+        for tokenize in ("trigram", "unicode61"):
+            try:
+                self._db.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5("
+                    f"subject, description, journals, tokenize='{tokenize}')"
+                )
+                return tokenize == "trigram"
+            except sqlite3.OperationalError:
+                continue
+        raise RuntimeError("SQLite FTS5 is required for the issue mirror")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def upsert(self, issues: Iterable[dict[str, Any]], scope: str | None = None) -> int:
+        """Store issues (as returned by the REST API) and index their text.
+
+        With ``scope`` the issues are recorded as belonging to it; otherwise
+        they are added to every synced scope whose project matches.
+        """
+        count = 0
+        with self._db:
+            for issue in issues:
+                self._upsert_one(issue, scope)
+                count += 1
+        return count
+
+    def _upsert_one(self, issue: dict[str, Any], scope: str | None) -> None:
+        iid = issue["id"]
+        project_id = _ref_id(issue, "project")
+        self._db.execute(
+            "INSERT OR REPLACE INTO issues (id, project_id, tracker_id, status_id, priority_id,"
+            " assigned_to_id, subject, created_on, updated_on, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                iid, project_id, _ref_id(issue, "tracker"), _ref_id(issue, "status"),
+                _ref_id(issue, "priority"), _ref_id(issue, "assigned_to"),
+                issue.get("subject"), issue.get("created_on"), issue.get("updated_on"),
+                json.dumps({k: v for k, v in issue.items() if k != "journals"}, ensure_ascii=False),
+            ),
+        )
+        if "journals" in issue:
+            journals = "\n".join(j.get("notes") or "" for j in issue["journals"])
+        else:
+            row = self._db.execute(
+                "SELECT journals FROM issues_fts WHERE rowid = ?", (iid,),
+            ).fetchone()
+            journals = row["journals"] if row else ""
+        self._db.execute("DELETE FROM issues_fts WHERE rowid = ?", (iid,))
+        self._db.execute(
+            "INSERT INTO issues_fts (rowid, subject, description, journals) VALUES (?, ?, ?, ?)",
+            (iid, issue.get("subject") or "", issue.get("description") or "", journals),
+        )
+        if scope is not None:
+            scopes = [scope]
+        else:
+            scopes = [
+                r["scope"] for r in self._db.execute(
+                    "SELECT scope FROM sync_state WHERE scope = ? OR project_id = ?",
+                    (ALL_PROJECTS, project_id),
+                )
+            ]
+        self._db.executemany(
+            "INSERT OR IGNORE INTO issue_scopes (scope, issue_id) VALUES (?, ?)",
+            [(s, iid) for s in scopes],
+        )
+
+    def scope_for(self, project_id: str | None) -> str | None:
+        """Return the mirrored scope that answers queries for ``project_id``."""
+        scope = ALL_PROJECTS if project_id is None else str(project_id)
+        return scope if scope in self.scopes else None
+
+    def synced_at(self, scope: str) -> float | None:
+        row = self._db.execute(
+            "SELECT synced_at FROM sync_state WHERE scope = ?", (scope,),
+        ).fetchone()
+        return row["synced_at"] if row else None
+
+    def is_fresh(self, scope: str) -> bool:
+        synced_at = self.synced_at(scope)
+        return synced_at is not None and time.time() - synced_at < self.max_age
+
+    async def ensure_fresh(self, client: RedmineClient, scope: str) -> bool:
+        """Sync ``scope`` if it is older than ``max_age``.
+
+        Returns False if the sync failed but an older copy can still be served;
+        raises if the scope has never been synced.
+        """
+        if self.is_fresh(scope):
+            return True
+        try:
+            await self.sync(client, scope)
+            return True
+        except Exception as e:
+            if self.synced_at(scope) is None:
+                raise
+            logger.warning("Mirror sync of %s failed, serving stale data: %s", scope, e)
+            return False
+
+    async def sync(
+        self,
+        client: RedmineClient,
+        scope: str,
+        full: bool = False,
+        force: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch issues updated since the scope's cursor and store them.
+
+        A scope that is still fresh is skipped unless ``force`` or ``full`` is
+        set, so concurrent callers waiting on the same sync do not repeat it.
+        """
+        lock = self._locks.setdefault(scope, asyncio.Lock())
+        async with lock:
+            if not (full or force) and self.is_fresh(scope):
+                return {"scope": scope, "synced": 0, "skipped": True}
+            started = time.time()
+            row = self._db.execute(
+                "SELECT project_id, cursor FROM sync_state WHERE scope = ?", (scope,),
+            ).fetchone()
+            cursor = None if full or row is None else row["cursor"]
+            project_id = row["project_id"] if row else None
+
+            if full or not self._db.execute("SELECT 1 FROM statuses LIMIT 1").fetchone():
+                await self._sync_statuses(client)
+            params: dict[str, Any] = {"status_id": "*", "sort": "updated_on"}
+            if scope != ALL_PROJECTS:
+                params["project_id"] = scope
+                if project_id is None:
+                    project = await client.get(f"/projects/{scope}.json")
+                    project_id = project["project"]["id"]
+            if cursor:
+                params["updated_on"] = f">={cursor}"
+
+            synced = 0
+            newest = cursor or ""
+            seen: set[int] = set()
+            batch: list[dict[str, Any]] = []
+            async for issue in Paginator(client, "/issues.json", "issues", params):
+                batch.append(issue)
+                seen.add(issue["id"])
+                newest = max(newest, issue.get("updated_on") or "")
+                if len(batch) >= BATCH_SIZE:
+                    synced += await self._store_batch(client, batch, scope)
+                    batch = []
+            if batch:
+                synced += await self._store_batch(client, batch, scope)
+            cursor = newest or None
+
+            with self._db:
+                if full:
+                    # Drop issues that were deleted or moved out of the scope.
+                    stale = [
+                        (scope, r["issue_id"]) for r in self._db.execute(
+                            "SELECT issue_id FROM issue_scopes WHERE scope = ?", (scope,),
+                        ) if r["issue_id"] not in seen
+                    ]
+                    self._db.executemany(
+                        "DELETE FROM issue_scopes WHERE scope = ? AND issue_id = ?", stale,
+                    )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sync_state (scope, project_id, cursor, synced_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (scope, project_id, cursor, started),
+                )
+            return {"scope": scope, "synced": synced, "cursor": cursor}
+
+    async def _store_batch(
+        self, client: RedmineClient, batch: list[dict[str, Any]], scope: str,
+    ) -> int:
+        if self.with_journals:
+            report = await BulkExecutor().run(
+                batch,
+                lambda issue: client.get(
+                    f"/issues/{issue['id']}.json", params={"include": "journals"},
+                ),
+            )
+            batch = [o.result["issue"] if o.ok else o.item for o in report.outcomes]
+        return self.upsert(batch, scope)
+
+    async def _sync_statuses(self, client: RedmineClient) -> None:
+        data = await client.get("/issue_statuses.json")
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO statuses (id, name, is_closed) VALUES (?, ?, ?)",
+                [
+                    (s["id"], s.get("name"), int(bool(s.get("is_closed"))))
+                    for s in data.get("issue_statuses", [])
+                ],
+            )
+
+    def list_issues(
+        self,
+        scope: str,
+        status_id: str | None = None,
+        assigned_to_id: str | None = None,
+        tracker_id: int | None = None,
+        sort: str | None = None,
+        limit: int = 25,
+        offset: int = 0,
+    ) -> dict[str, Any] | None:
+        """Answer a list_issues query locally, or return None if it can't be."""
+        where = ["s.scope = ?"]
+        args: list[Any] = [scope]
+        status = status_id or "open"
+        if status in ("open", "closed"):
+            where.append("i.status_id IN (SELECT id FROM statuses WHERE is_closed = ?)")
+            args.append(int(status == "closed"))
+        elif status != "*":
+            ids = _id_filter(status)
+            if ids is None:
+                return None
+            where.append(f"i.status_id IN ({','.join('?' * len(ids))})")
+            args.extend(ids)
+        if assigned_to_id is not None:
+            ids = _id_filter(assigned_to_id)
+            if ids is None:
+                return None
+            where.append(f"i.assigned_to_id IN ({','.join('?' * len(ids))})")
+            args.extend(ids)
+        if tracker_id is not None:
+            where.append("i.tracker_id = ?")
+            args.append(tracker_id)
+
+        order = []
+        for part in (sort or "id:desc").split(","):
+            field, _, direction = part.strip().partition(":")
+            column = SORT_COLUMNS.get(field)
+            if column is None:
+                return None
+            order.append(f"i.{column} {'DESC' if direction == 'desc' else 'ASC'}")
+
+        sql = (
+            "FROM issues i JOIN issue_scopes s ON s.issue_id = i.id WHERE " + " AND ".join(where)
+        )
+        total = self._db.execute(f"SELECT COUNT(*) {sql}", args).fetchone()[0]
+        rows = self._db.execute(
+            f"SELECT i.data {sql} ORDER BY {', '.join(order)} LIMIT ? OFFSET ?",
+            [*args, limit, offset],
+        ).fetchall()
+        return {
+            "issues": [json.loads(r["data"]) for r in rows],
+            "total_count": total,
+            "offset": offset,
+            "limit": limit,
+        }
+
+    def search(self, scope: str, query: str, limit: int = 25, offset: int = 0) -> dict[str, Any]:
+        """Full-text search shaped like /search.json, ranked by BM25."""
+        terms = query.split()
+        if not terms:
+            return {"results": [], "total_count": 0, "offset": offset, "limit": limit}
+        if self.trigram and any(len(t) < 3 for t in terms):
+            # Trigram indexes cannot match shorter terms; scan instead.
+            cond = " AND ".join(
+                "(f.subject LIKE ? OR f.description LIKE ? OR f.journals LIKE ?)" for _ in terms
+            )
+            args: list[Any] = [f"%{t}%" for t in terms for _ in range(3)]
+            rank = "i.updated_on DESC"
+        else:
+            cond = "issues_fts MATCH ?"
+            args = [" ".join('"' + t.replace('"', '""') + '"' for t in terms)]
+            rank = "bm25(issues_fts)"
+        sql = (
+            "FROM issues_fts f JOIN issues i ON i.id = f.rowid"
+            " JOIN issue_scopes s ON s.issue_id = i.id"
+            f" WHERE s.scope = ? AND {cond}"
+        )
+        args = [scope, *args]
+        total = self._db.execute(f"SELECT COUNT(*) {sql}", args).fetchone()[0]
+        rows = self._db.execute(
+            f"SELECT i.data {sql} ORDER BY {rank} LIMIT ? OFFSET ?", [*args, limit, offset],
+        ).fetchall()
+        results = []
+        for row in rows:
+            issue = json.loads(row["data"])
+            tracker = (issue.get("tracker") or {}).get("name", "Issue")
+            status = (issue.get("status") or {}).get("name", "")
+            results.append({
+                "id": issue["id"],
+                "title": f"{tracker} #{issue['id']} ({status}): {issue.get('subject', '')}",
+                "type": "issue",
+                "description": issue.get("description") or "",
+                "datetime": issue.get("updated_on"),
+            })
+        return {"results": results, "total_count": total, "offset": offset, "limit": limit}
@@ -0,0 +1,113 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_int
+
+MAX_PAGE_SIZE = 100
+DEFAULT_PAGE_CONCURRENCY = 4
+DEFAULT_FETCH_ALL_LIMIT = 2000
+
+
+class Paginator:
+    """Iterates every item of a paginated Redmine collection.
+
+    The first page is fetched alone to learn ``total_count``; the remaining
+    offsets are then fetched concurrently, at most ``concurrency`` pages at a
+    time. Items are yielded in the server's sort order as soon as each page
+    and all pages before it have arrived, so only a window of pages is held in
+    memory. Items already seen (by ``id``) are skipped, which guards against
+    duplicates when rows shift between pages during the scan.
+    """
+
+    def __init__(
+        self,
+        client: RedmineClient,
+        path: str,
+        key: str,
+        params: dict[str, Any] | None = None,
+        *,
+        offset: int = 0,
+        max_items: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int | None = None,
+    ):
+        self.client = client
+        self.path = path
+        self.key = key
+        self.params = dict(params or {})
+        self.offset = offset
+        self.max_items = max_items
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        self.concurrency = max(1, concurrency or env_int(
+            "REDMINE_PAGE_CONCURRENCY", DEFAULT_PAGE_CONCURRENCY,
+        ))
+        self.total_count: int | None = None
+
+    async def _fetch(self, offset: int) -> list[dict[str, Any]]:
+        data = await self.client.get(
+            self.path, params={**self.params, "limit": self.page_size, "offset": offset},
+        )
+        if self.total_count is None:
+            self.total_count = data.get("total_count", 0)
+        return data.get(self.key, [])
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        remaining = self.max_items if self.max_items is not None else float("inf")
+        if remaining <= 0:
+            return
+        seen: set[Any] = set()
+        first = await self._fetch(self.offset)
+        end = min(self.total_count or 0, self.offset + remaining)
+        offsets = iter(range(self.offset + self.page_size, int(end), self.page_size))
+        window: deque[asyncio.Task[list[dict[str, Any]]]] = deque()
+
+        def fill() -> None:
+            while len(window) < self.concurrency:
+                next_offset = next(offsets, None)
+                if next_offset is None:
+                    return
+                window.append(asyncio.create_task(self._fetch(next_offset)))
+
+        fill()
+        page = first
+        try:
+            while True:
+                for item in page:
+                    item_id = item.get("id")
+                    if item_id is not None:
+                        if item_id in seen:
+                            continue
+                        seen.add(item_id)
+                    yield item
+                    remaining -= 1
+                    if remaining <= 0:
+                        return
+                if not window:
+                    return
+                page = await window.popleft()
+                fill()
+        finally:
+            for task in window:
+                task.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+
+    async def collect(self) -> dict[str, Any]:
+        """Gather all items into a Redmine-shaped list response."""
+        items = [item async for item in self]
+        total = self.total_count or 0
+        return {
+            self.key: items,
+            "total_count": total,
+            "offset": self.offset,
+            "limit": len(items),
+            "truncated": self.offset + len(items) < total,
+        }
+
+
+def fetch_limit(max_items: int | None) -> int:
+    """Cap a fetch-all request so a single tool response stays bounded."""
+    limit = env_int("REDMINE_FETCH_ALL_LIMIT", DEFAULT_FETCH_ALL_LIMIT)
+    return limit if max_items is None else min(max_items, limit)
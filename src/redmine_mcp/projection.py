@@ -0,0 +1,92 @@
+from typing import Any
+
+from redmine_mcp.config import env_int
+
+DEFAULT_TEXT_LIMIT = 500
+
+FieldTree = dict[str, "FieldTree"]
+
+
+def parse_fields(fields: str | None) -> FieldTree | None:
+    """Parse "id,subject,status.name" into a nested tree of kept keys."""
+    if not fields:
+        return None
+    tree: FieldTree = {}
+    for path in fields.split(","):
+        node = tree
+        for part in path.strip().split("."):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and set(value) == {"id", "name"}
+
+
+class _Shaper:
+    def __init__(self, tree: FieldTree | None, compact: bool, text_limit: int):
+        self.tree = tree
+        self.compact = compact
+        self.text_limit = text_limit
+        self.truncated: list[dict[str, Any]] = []
+
+    def value(self, value: Any, tree: FieldTree | None, path: str) -> Any:
+        if isinstance(value, dict):
+            return self.record(value, tree, path)
+        if isinstance(value, list):
+            return [self.value(v, tree, f"{path}[{i}]") for i, v in enumerate(value)]
+        if self.compact and isinstance(value, str) and len(value) > self.text_limit:
+            self.truncated.append({"path": path, "length": len(value)})
+            return value[:self.text_limit] + "…"
+        return value
+
+    def record(self, record: dict[str, Any], tree: FieldTree | None, path: str) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for key, value in record.items():
+            if tree and key not in tree:
+                continue
+            subtree = tree[key] if tree else None
+            if self.compact:
+                if value is None or value == "" or value == [] or value == {}:
+                    continue
+                if _is_ref(value) and not subtree:
+                    out[key] = value["name"]
+                    out[f"{key}_id"] = value["id"]
+                    continue
+            out[key] = self.value(value, subtree or None, f"{path}.{key}" if path else key)
+        return out
+
+
+def shape(
+    data: dict[str, Any],
+    key: str,
+    fields: str | None = None,
+    compact: bool = False,
+    keyed: bool = False,
+) -> dict[str, Any]:
+    """Project and/or compact the records under ``data[key]``.
+
+    ``fields`` is a comma-separated whitelist of dotted paths relative to each
+    record (lists are traversed implicitly), e.g. "id,subject,journals.notes".
+    ``compact`` drops null and empty values, flattens ``{"id", "name"}``
+    references to ``name`` plus ``<key>_id``, and truncates strings longer
+    than REDMINE_COMPACT_TEXT_LIMIT characters. Truncated strings are listed
+    in ``_truncated`` with their path and full length; request that path via
+    ``fields`` without ``compact`` to read it in full.
+
+    With ``keyed`` the records are the values of a mapping (e.g. by issue id).
+    The input is never modified, so cached responses can be shaped safely.
+    """
+    tree = parse_fields(fields)
+    if tree is None and not compact:
+        return data
+    shaper = _Shaper(tree, compact, env_int("REDMINE_COMPACT_TEXT_LIMIT", DEFAULT_TEXT_LIMIT))
+    out = dict(data)
+    if keyed and isinstance(data.get(key), dict):
+        out[key] = {k: shaper.value(v, tree, f"{key}.{k}") for k, v in data[key].items()}
+    elif key in data:
+        out[key] = shaper.value(data[key], tree, key)
+    if shaper.truncated:
+        out["_truncated"] = shaper.truncated
+    return out
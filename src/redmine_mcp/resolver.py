@@ -0,0 +1,210 @@
+import asyncio
+import difflib
+import logging
+import re
+import time
+import unicodedata
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_float
+from redmine_mcp.pagination import Paginator
+from redmine_mcp.tenancy import cache_scope
+from redmine_mcp.tools.master import REFERENCE_ENDPOINTS, get_reference
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 900.0
+# A name that matches nothing triggers a refetch at most this often.
+MIN_REFETCH_INTERVAL = 60.0
+FUZZY_CUTOFF = 0.8
+MAX_CANDIDATES = 5
+
+# Response keys of the reference enumerations.
+REFERENCE_KEYS = {"statuses": "issue_statuses", "trackers": "trackers", "priorities": "issue_priorities"}
+# Collections indexed besides the reference enumerations: (path, key, params).
+DIRECTORY_ENDPOINTS = {
+    "users": ("/users.json", "users", {"status": 1}),
+    "projects": ("/projects.json", "projects", {}),
+}
+KINDS = (*REFERENCE_ENDPOINTS, *DIRECTORY_ENDPOINTS)
+# Singular nouns for error messages.
+LABELS = {
+    "statuses": "status", "trackers": "tracker", "priorities": "priority",
+    "users": "user", "projects": "project",
+}
+
+_SPACES = re.compile(r"\s+")
+# Redmine project identifiers: lowercase letters, digits, "-" and "_", not all digits.
+PROJECT_IDENTIFIER = re.compile(r"^(?!\d+$)[a-z0-9_-]+$")
+
+
+def normalize(name: str) -> str:
+    """Fold width, case and whitespace so that lookups ignore them."""
+    return _SPACES.sub(" ", unicodedata.normalize("NFKC", name).casefold()).strip()
+
+
+def aliases(kind: str, record: dict[str, Any]) -> set[str]:
+    """Every name a record can be looked up by."""
+    names = {record.get("name", "")}
+    if kind == "users":
+        first, last = record.get("firstname", ""), record.get("lastname", "")
+        names |= {record.get("login", ""), first, last,
+                  f"{first} {last}", f"{last} {first}", f"{last}{first}"}
+    elif kind == "projects":
+        names.add(record.get("identifier", ""))
+    return {normalize(n) for n in names if n and n.strip()}
+
+
+@dataclass
+class Lookup:
+    """Name lookup tables built from one snapshot of a collection."""
+
+    by_name: dict[str, set[int]] = field(default_factory=dict)
+    records: dict[int, dict[str, Any]] = field(default_factory=dict)
+    built_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(cls, kind: str, records: list[dict[str, Any]]) -> "Lookup":
+        lookup = cls()
+        for record in records:
+            rid = record["id"]
+            lookup.records[rid] = record
+            for alias in aliases(kind, record):
+                lookup.by_name.setdefault(alias, set()).add(rid)
+        return lookup
+
+    def label(self, rid: int) -> str:
+        record = self.records[rid]
+        full_name = " ".join(p for p in (record.get("firstname"), record.get("lastname")) if p)
+        return record.get("name") or full_name or record.get("login") or str(rid)
+
+    def match(self, name: str, strict: bool = False) -> set[int]:
+        """Ids matching ``name``: exactly, else by prefix or substring, else fuzzily.
+
+        Each stage is only used if the previous one found nothing. With
+        ``strict`` only exact and prefix matches count, for writes, where a
+        loose match could quietly pick another record.
+        """
+        key = normalize(name)
+        if not key:
+            return set()
+        if key in self.by_name:
+            return self.by_name[key]
+        for test in (str.startswith,) if strict else (str.startswith, str.__contains__):
+            ids = {rid for alias, rids in self.by_name.items() if test(alias, key) for rid in rids}
+            if ids:
+                return ids
+        if strict:
+            return set()
+        close = difflib.get_close_matches(key, self.by_name, n=MAX_CANDIDATES, cutoff=FUZZY_CUTOFF)
+        return {rid for alias in close for rid in self.by_name[alias]}
+
+
+class NameIndex:
+    """Resolves status, tracker, priority, user and project names to ids.
+
+    The underlying collections are stored in ``cache`` (enumerations under the
+    same keys as ``list_statuses`` and friends, so ``clear_reference_cache``
+    resets both), and lookup tables are rebuilt only when the cached snapshot
+    changes. Once a collection is loaded, resolving a name makes no request;
+    ``run`` keeps the loaded collections fresh in the background. Users come
+    from /users.json, which needs admin rights.
+    """
+
+    def __init__(self, client: RedmineClient, cache: TTLCache, refresh_interval: float | None = None):
+        self.client = client
+        self.cache = cache
+        self.refresh_interval = (
+            refresh_interval if refresh_interval is not None
+            else env_float("REDMINE_INDEX_REFRESH", DEFAULT_REFRESH_INTERVAL)
+        )
+        # (tenant scope, kind) -> (source snapshot, lookup built from it)
+        self._lookups: dict[tuple[str | None, str], tuple[Any, Lookup]] = {}
+
+    def forget(self, scope: str) -> None:
+        """Drop the lookup tables built for a user's credentials (see ``ClientPool.on_evict``)."""
+        for slot in [slot for slot in self._lookups if slot[0] == scope]:
+            del self._lookups[slot]
+
+    def _fetcher(self, kind: str) -> Callable[[], Awaitable[Any]]:
+        path, key, params = DIRECTORY_ENDPOINTS[kind]
+        return lambda: Paginator(self.client, path, key, params).collect()
+
+    async def lookup(self, kind: str) -> Lookup:
+        """Lookup tables for ``kind``, loading the collection if it is not cached."""
+        if kind in REFERENCE_ENDPOINTS:
+            data = await get_reference(self.client, self.cache, kind)
+            key = REFERENCE_KEYS[kind]
+        else:
+            data = await self.cache.get_or_fetch(("index", kind), self._fetcher(kind))
+            key = DIRECTORY_ENDPOINTS[kind][1]
+        slot = (cache_scope(), kind)
+        built = self._lookups.get(slot)
+        if built is None or built[0] is not data:
+            built = self._lookups[slot] = (data, Lookup.build(kind, data.get(key, [])))
+        return built[1]
+
+    async def refetch(self, kind: str) -> None:
+        """Replace the cached collection with a fresh copy from Redmine."""
+        if kind in REFERENCE_ENDPOINTS:
+            await self.cache.set(("reference", kind), await self.client.get(REFERENCE_ENDPOINTS[kind]))
+        else:
+            await self.cache.set(("index", kind), await self._fetcher(kind)())
+
+    async def resolve(self, kind: str, name: str | int, strict: bool = False) -> int:
+        """Id of the single record called ``name``; digits are taken as an id.
+
+        With ``strict``, only an exact name or a unique prefix is accepted
+        (see ``Lookup.match``). Raises ValueError if nothing or more than one
+        record matches.
+        """
+        if isinstance(name, int) or str(name).strip().isdigit():
+            return int(name)
+        lookup = await self.lookup(kind)
+        ids = lookup.match(name, strict)
+        if not ids and time.monotonic() - lookup.built_at > MIN_REFETCH_INTERVAL:
+            # The record may have been created since the snapshot was taken.
+            await self.refetch(kind)
+            lookup = await self.lookup(kind)
+            ids = lookup.match(name, strict)
+        label = LABELS[kind]
+        if not ids:
+            how = " exactly or by prefix" if strict else ""
+            raise ValueError(f"No {label} matches {name!r}{how}")
+        if len(ids) > 1:
+            candidates = ", ".join(f"{lookup.label(i)!r} ({i})" for i in sorted(ids)[:MAX_CANDIDATES])
+            raise ValueError(f"{name!r} matches more than one {label}: {candidates}; use the id")
+        return next(iter(ids))
+
+    async def resolve_project(self, project: str, strict: bool = False) -> str:
+        """A project id or identifier as given, or the identifier of the project named ``project``."""
+        if project.isdigit() or PROJECT_IDENTIFIER.match(project):
+            return project
+        pid = await self.resolve("projects", project, strict)
+        record = (await self.lookup("projects")).records.get(pid, {})
+        return record.get("identifier") or str(pid)
+
+    async def warm_up(self, kinds: tuple[str, ...] = KINDS) -> None:
+        """Load ``kinds`` so that the first lookups need no request."""
+        results = await asyncio.gather(*(self.lookup(kind) for kind in kinds), return_exceptions=True)
+        for kind, result in zip(kinds, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to index %s: %s", kind, result)
+
+    async def run(self) -> None:
+        """Refetch the collections loaded with the server's credentials, forever."""
+        if self.refresh_interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            for scope, kind in list(self._lookups):
+                if scope is not None:
+                    continue
+                try:
+                    await self.refetch(kind)
+                except Exception as e:
+                    logger.warning("Failed to refresh the %s index: %s", kind, e)
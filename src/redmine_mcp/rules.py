@@ -0,0 +1,243 @@
+import dataclasses
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_float
+
+if TYPE_CHECKING:
+    from redmine_mcp.shared import SharedState
+
+TICKET_RULES_PAGE = "TicketRules"
+DEFAULT_RULES_TTL = 300.0
+
+# Section titles from docs/wiki-convention.md.
+SECTION_TRACKERS = "トラッカー"
+SECTION_REQUIRED = "必須フィールド"
+SECTION_SUBJECT = "件名の命名規則"
+SECTION_TEMPLATES = "説明テンプレート"
+SECTION_DEFAULTS = "デフォルト値"
+SECTION_PARENT = "親チケット"
+SECTION_NOTES = "注意事項"
+
+# Values in the defaults table that mean "no default".
+NO_VALUE = {"", "-", "なし", "（なし）", "(なし)", "none", "null"}
+# Characters that start a placeholder in a subject format, e.g. "[BUG] 〈説明〉".
+PLACEHOLDER_START = "〈<{"
+
+_HEADING = re.compile(r"^(?:(#{1,6})\s+|h([1-6])\.\s+)(.+?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_LIST_ITEM = re.compile(r"^\s*[-*+]\s+(.*)$")
+_FIELD_NAME = re.compile(r"^`?([A-Za-z_][A-Za-z0-9_]*)")
+_SUBJECT_FORMAT = re.compile(r"^(.+?)\s*[:：]\s*`?(.+?)`?\s*$")
+
+
+@dataclass
+class TicketRules:
+    """Structured form of a project's TicketRules wiki page."""
+
+    version: int | None = None
+    trackers: list[dict[str, Any]] = field(default_factory=list)
+    required_fields: list[str] = field(default_factory=list)
+    subject_formats: dict[str, str] = field(default_factory=dict)
+    templates: dict[str, str] = field(default_factory=dict)
+    defaults: dict[str, Any] = field(default_factory=dict)
+    parent_rules: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+    def tracker_name(self, tracker_id: int | None) -> str | None:
+        for tracker in self.trackers:
+            if tracker["id"] == tracker_id:
+                return tracker["name"]
+        return None
+
+    def template_for(self, tracker_id: int | None) -> str | None:
+        """Title of the description template for a tracker, matched by name."""
+        name = self.tracker_name(tracker_id)
+        if name is None:
+            return None
+        return next((title for title in self.templates if name in title), None)
+
+    def apply_defaults(self, issue: dict[str, Any]) -> dict[str, Any]:
+        """Return ``issue`` with default values filled in for unset fields."""
+        return {**{k: v for k, v in self.defaults.items() if v is not None}, **issue}
+
+    def validate(self, issue: dict[str, Any], settable: set[str]) -> list[str]:
+        """Return the rule violations of ``issue`` (empty if it may be created).
+
+        Required fields outside ``settable`` cannot be checked and are ignored.
+        """
+        violations = []
+        for name in self.required_fields:
+            if name in settable and issue.get(name) in (None, ""):
+                hint = ""
+                if name == "description" and (template := self.template_for(issue.get("tracker_id"))):
+                    hint = f" (use the template {template!r})"
+                violations.append(f"{name} is required{hint}")
+        tracker_id = issue.get("tracker_id")
+        if self.trackers and tracker_id is not None and self.tracker_name(tracker_id) is None:
+            allowed = ", ".join(f"{t['id']} ({t['name']})" for t in self.trackers)
+            violations.append(f"tracker_id {tracker_id} is not allowed; use one of {allowed}")
+        subject_format = self.subject_formats.get(self.tracker_name(tracker_id) or "")
+        if subject_format is not None:
+            prefix = re.split(f"[{PLACEHOLDER_START}]", subject_format, maxsplit=1)[0].strip()
+            if prefix and not str(issue.get("subject", "")).startswith(prefix):
+                violations.append(f"subject must follow the format {subject_format!r}")
+        return violations
+
+
+def _cells(line: str) -> list[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def _table(lines: list[str]) -> list[list[str]]:
+    """Rows of the first markdown/Textile table in ``lines``, header first."""
+    rows = []
+    for line in lines:
+        if not line.strip().startswith("|"):
+            if rows:
+                break
+            continue
+        cells = _cells(line)
+        if all(re.fullmatch(r":?-{2,}:?", c) for c in cells if c):
+            continue
+        rows.append([c.removeprefix("_.").strip() for c in cells])
+    return rows
+
+
+def _list_items(lines: list[str]) -> list[str]:
+    return [m.group(1).strip() for line in lines if (m := _LIST_ITEM.match(line))]
+
+
+def _value(text: str) -> Any:
+    text = text.strip().strip("`")
+    if text.lower() in NO_VALUE:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+
+def parse_ticket_rules(text: str, version: int | None = None) -> TicketRules:
+    """Parse a TicketRules page written per docs/wiki-convention.md.
+
+    Sections are recognized by their ``##`` (or Textile ``h2.``) titles and
+    all are optional. Headings inside code fences belong to the templates.
+    """
+    sections: dict[str, list[str]] = {}
+    templates: dict[str, str] = {}
+    section: str | None = None
+    subsection: str | None = None
+    fence: str | None = None
+    block: list[str] = []
+
+    for line in text.replace("\r\n", "\n").split("\n"):
+        fence_match = _FENCE.match(line)
+        if fence is not None:
+            if fence_match and fence_match.group(1) == fence:
+                if section == SECTION_TEMPLATES and subsection:
+                    templates[subsection] = "\n".join(block).strip("\n")
+                fence, block = None, []
+            else:
+                block.append(line)
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+        heading = _HEADING.match(line)
+        if heading:
+            level = len(heading.group(1) or "") or int(heading.group(2))
+            title = heading.group(3).strip()
+            if level == 2:
+                section, subsection = title, None
+                sections.setdefault(section, [])
+            elif level >= 3:
+                subsection = title
+            continue
+        if section is not None:
+            sections[section].append(line)
+
+    rules = TicketRules(version=version, templates=templates)
+
+    rows = _table(sections.get(SECTION_TRACKERS, []))
+    if rows:
+        header = [h.lower() for h in rows[0]]
+        id_col = header.index("tracker_id") if "tracker_id" in header else 1
+        for row in rows[1:]:
+            if len(row) <= id_col or not row[id_col].isdigit():
+                continue
+            rules.trackers.append({
+                "name": row[0],
+                "id": int(row[id_col]),
+                "purpose": row[id_col + 1] if len(row) > id_col + 1 else "",
+            })
+
+    for item in _list_items(sections.get(SECTION_REQUIRED, [])):
+        if match := _FIELD_NAME.match(item):
+            rules.required_fields.append(match.group(1))
+
+    for item in _list_items(sections.get(SECTION_SUBJECT, [])):
+        if match := _SUBJECT_FORMAT.match(item):
+            rules.subject_formats[match.group(1).strip()] = match.group(2).strip()
+
+    for row in _table(sections.get(SECTION_DEFAULTS, []))[1:]:
+        if len(row) >= 2 and (match := _FIELD_NAME.match(row[0])):
+            rules.defaults[match.group(1)] = _value(row[1])
+
+    rules.parent_rules = _list_items(sections.get(SECTION_PARENT, []))
+    rules.notes = _list_items(sections.get(SECTION_NOTES, []))
+    return rules
+
+
+def rules_cache(shared: "SharedState | None" = None) -> TTLCache:
+    """Cache for parsed rule sets, expiring after REDMINE_RULES_TTL seconds."""
+    return TTLCache(ttl=env_float("REDMINE_RULES_TTL", DEFAULT_RULES_TTL), shared=shared, name="rules")
+
+
+async def remember(cache: TTLCache, project_id: str, page: dict[str, Any] | None) -> TicketRules | None:
+    """Store the rules from a freshly fetched page (None if there is none).
+
+    The page is parsed only when its version differs from the cached one.
+    """
+    key = ("ticket_rules", project_id)
+    if page is None:
+        await cache.set(key, {"version": None, "rules": None})
+        return None
+    version = page.get("version")
+    found, cached = await cache.get(key)
+    if found and cached["rules"] is not None and cached["version"] == version:
+        rules = TicketRules(**cached["rules"])
+    else:
+        rules = parse_ticket_rules(page.get("text", ""), version)
+    await cache.set(key, {"version": version, "rules": rules.to_dict()})
+    return rules
+
+
+async def fetch_rules_page(client: RedmineClient, project_id: str) -> dict[str, Any] | None:
+    """The TicketRules wiki page, or None if the project has none."""
+    try:
+        result = await client.get(f"/projects/{project_id}/wiki/{TICKET_RULES_PAGE}.json")
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return None
+        raise
+    return result["wiki_page"]
+
+
+async def get_rules(client: RedmineClient, cache: TTLCache, project_id: str) -> TicketRules | None:
+    """The project's rule set, fetched and parsed only when not cached."""
+    found, cached = await cache.get(("ticket_rules", project_id))
+    if found:
+        return TicketRules(**cached["rules"]) if cached["rules"] is not None else None
+    return await remember(cache, project_id, await fetch_rules_page(client, project_id))
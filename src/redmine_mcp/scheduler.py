@@ -0,0 +1,193 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from redmine_mcp.config import env_float
+
+# Priority classes, most urgent first.
+INTERACTIVE = 0
+WRITE = 1
+BACKGROUND = 2
+CLASSES = {INTERACTIVE: "interactive", WRITE: "write", BACKGROUND: "background"}
+
+DEFAULT_LATENCY_TOLERANCE = 2.0
+# Multiplicative decrease of the limit on congestion.
+BACKOFF_FACTOR = 0.7
+# Share of the limit background requests may hold, so that interactive
+# calls find a free slot instead of waiting behind a bulk operation.
+BACKGROUND_SHARE = 0.75
+# Weights of each response in the recent and the long-term average latency.
+# Requests of every kind feed both, so a mix of fast and slow endpoints
+# moves them alike; only queueing in Redmine pulls them apart.
+RECENT_WEIGHT = 0.1
+BASELINE_WEIGHT = 0.01
+
+_priority: ContextVar[int | None] = ContextVar("request_priority", default=None)
+
+
+@contextmanager
+def background() -> Iterator[None]:
+    """Send the requests made inside (and in tasks started inside) as background work."""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def request_class(idempotent: bool) -> int:
+    """Priority of a request: background if marked so, else by whether it reads."""
+    marked = _priority.get()
+    if marked is not None:
+        return marked
+    return INTERACTIVE if idempotent else WRITE
+
+
+class Scheduler:
+    """Admission control for upstream requests, by priority class.
+
+    At most ``limit`` requests are in flight; the rest wait in a queue served
+    interactive reads first, then writes, then background work (bulk
+    operations, jobs, syncs), first come first served within a class.
+    Background requests never hold more than BACKGROUND_SHARE of the slots.
+
+    The limit adapts AIMD-style between ``min_limit`` and ``max_limit``: it
+    grows by about one per limit's worth of healthy responses, and shrinks by
+    BACKOFF_FACTOR (at most once per recent latency) when a request fails
+    transiently or when the recent average latency exceeds
+    ``latency_tolerance`` times the long-term average, i.e. when Redmine
+    starts queueing.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        latency_tolerance: float | None = None,
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.latency_tolerance = latency_tolerance if latency_tolerance is not None else env_float(
+            "REDMINE_SCHEDULER_LATENCY_TOLERANCE", DEFAULT_LATENCY_TOLERANCE,
+        )
+        self.limit = float(self.max_limit)
+        self.in_flight = {c: 0 for c in CLASSES}
+        self.recent: float | None = None
+        self.baseline: float | None = None
+        self._decreased_at = 0.0
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self.waited = {c: 0.0 for c in CLASSES}
+        self.admitted = {c: 0 for c in CLASSES}
+        self.max_wait = {c: 0.0 for c in CLASSES}
+        self.decreases = 0
+
+    def _capacity(self, cls: int) -> int:
+        share = BACKGROUND_SHARE if cls == BACKGROUND else 1.0
+        return max(1, math.floor(self.limit * share))
+
+    def _admissible(self, cls: int) -> bool:
+        total = sum(self.in_flight.values())
+        if total >= max(1, math.floor(self.limit)):
+            return False
+        return cls != BACKGROUND or self.in_flight[BACKGROUND] < self._capacity(BACKGROUND)
+
+    async def acquire(self, cls: int) -> None:
+        """Wait for a slot for a request of class ``cls``."""
+        started = time.monotonic()
+        if self._admissible(cls) and self.queue_depth(max_class=cls) == 0:
+            self.in_flight[cls] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._queue, (cls, next(self._order), future))
+            try:
+                await future
+            except BaseException:
+                # A cancelled waiter stays queued until _dispatch drops it.
+                if future.done() and not future.cancelled():
+                    # The slot was granted as the wait was cancelled: give it back.
+                    self.in_flight[cls] -= 1
+                    self._dispatch()
+                raise
+        waited = time.monotonic() - started
+        self.admitted[cls] += 1
+        self.waited[cls] += waited
+        self.max_wait[cls] = max(self.max_wait[cls], waited)
+
+    def release(self, cls: int, latency: float | None, congested: bool = False) -> None:
+        """Free a slot and adapt the limit to how the request went.
+
+        ``latency`` is None for requests that did not complete (e.g. were
+        cancelled); ``congested`` marks responses that signal overload.
+        """
+        self.in_flight[cls] -= 1
+        if latency is not None:
+            self._adapt(latency, congested)
+        self._dispatch()
+
+    def _adapt(self, latency: float, congested: bool) -> None:
+        if self.recent is None or self.baseline is None:
+            self.recent = self.baseline = latency
+        else:
+            self.recent += RECENT_WEIGHT * (latency - self.recent)
+            self.baseline += BASELINE_WEIGHT * (latency - self.baseline)
+        slow = self.recent > self.baseline * self.latency_tolerance
+        if congested or slow:
+            now = time.monotonic()
+            if now - self._decreased_at >= self.recent:
+                self._decreased_at = now
+                self.decreases += 1
+                self.limit = max(self.min_limit, self.limit * BACKOFF_FACTOR)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiters in priority order while there is room."""
+        skipped = []
+        while self._queue:
+            cls, order, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            if sum(self.in_flight.values()) >= max(1, math.floor(self.limit)):
+                break
+            heapq.heappop(self._queue)
+            if not self._admissible(cls):
+                # Background is at its share; later interactive or write waiters may still go.
+                skipped.append((cls, order, future))
+                continue
+            self.in_flight[cls] += 1
+            future.set_result(None)
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+
+    def queue_depth(self, cls: int | None = None, max_class: int | None = None) -> int:
+        """Waiting requests, of class ``cls`` or of ``max_class`` and more urgent classes."""
+        return sum(
+            1 for c, _, f in self._queue
+            if not f.done() and (cls is None or c == cls) and (max_class is None or c <= max_class)
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "recent_latency": round(self.recent, 4) if self.recent is not None else None,
+            "baseline_latency": round(self.baseline, 4) if self.baseline is not None else None,
+            "decreases": self.decreases,
+            "classes": {
+                name: {
+                    "in_flight": self.in_flight[cls],
+                    "queued": self.queue_depth(cls),
+                    "admitted": self.admitted[cls],
+                    "mean_wait": round(self.waited[cls] / self.admitted[cls], 4) if self.admitted[cls] else 0.0,
+                    "max_wait": round(self.max_wait[cls], 4),
+                }
+                for cls, name in CLASSES.items()
+            },
+        }
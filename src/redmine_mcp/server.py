@@ -1,12 +1,225 @@
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
+from redmine_mcp import changes, rules, tenancy
+from redmine_mcp.cache import TTLCache
 from redmine_mcp.client import RedmineClient
-from redmine_mcp.tools import issues, master, projects, wiki
+from redmine_mcp.config import env_flag
+from redmine_mcp.jobs import JobQueue
+from redmine_mcp.metrics import Metrics, instrument
+from redmine_mcp.resolver import NameIndex
+from redmine_mcp.scheduler import CLASSES, background
+from redmine_mcp.tools import attachments, issues, jobs, master, projects, wiki
+
+if TYPE_CHECKING:
+    from redmine_mcp.httpcache import HttpCache
+    from redmine_mcp.mirror import IssueMirror
+    from redmine_mcp.shared import SharedState
+
+logger = logging.getLogger(__name__)
+
+
+def _export_client_metrics(metrics: Metrics, client: RedmineClient, cache: TTLCache) -> None:
+    client.metrics = metrics
+    metrics.add_counter("redmine_upstream_retries_total", "Upstream requests retried.",
+                        lambda: client.retry_count)
+    metrics.add_counter("redmine_upstream_coalesced_total", "GETs served by an identical in-flight request.",
+                        lambda: client.stats()["coalesced"])
+    metrics.add_gauge("redmine_circuit_open_hosts", "Hosts whose circuit breaker is not closed.",
+                      lambda: sum(b["state"] != "closed" for b in client.stats()["breakers"].values()))
+    metrics.add_counter("redmine_reference_cache_hits_total", "Reference cache hits.",
+                        lambda: cache.hits)
+    metrics.add_counter("redmine_reference_cache_misses_total", "Reference cache misses.",
+                        lambda: cache.misses)
+    scheduler = client.scheduler
+    metrics.add_gauge("redmine_scheduler_limit", "Adaptive limit of upstream requests in flight.",
+                      lambda: scheduler.limit)
+    for cls, name in CLASSES.items():
+        metrics.add_gauge(f"redmine_scheduler_{name}_in_flight", f"{name.capitalize()} requests in flight.",
+                          lambda cls=cls: scheduler.in_flight[cls])
+        metrics.add_gauge(f"redmine_scheduler_{name}_queued", f"{name.capitalize()} requests waiting for a slot.",
+                          lambda cls=cls: scheduler.queue_depth(cls))
+        metrics.add_counter(f"redmine_scheduler_{name}_wait_seconds_total",
+                            f"Time {name} requests spent waiting for a slot.",
+                            lambda cls=cls: scheduler.waited[cls])
+        metrics.add_counter(f"redmine_scheduler_{name}_admitted_total", f"{name.capitalize()} requests admitted.",
+                            lambda cls=cls: scheduler.admitted[cls])
+    if client.http_cache is not None:
+        http_cache = client.http_cache
+        metrics.add_counter("redmine_http_cache_hits_total", "GETs served from the disk cache without a request.",
+                            lambda: http_cache.hits)
+        metrics.add_counter("redmine_http_cache_revalidated_total", "GETs answered 304 Not Modified.",
+                            lambda: http_cache.revalidated)
+        metrics.add_counter("redmine_http_cache_misses_total", "GETs that transferred a full response.",
+                            lambda: http_cache.misses)
+
+
+def create_server(
+    client: RedmineClient,
+    *,
+    reference_cache: TTLCache | None = None,
+    rules_cache: TTLCache | None = None,
+    mirror: "IssueMirror | None" = None,
+    job_queue: JobQueue | None = None,
+    change_cursors: TTLCache | None = None,
+    metrics: Metrics | None = None,
+    **settings: Any,
+) -> FastMCP:
+    """Assemble a FastMCP server with every Redmine tool registered.
+
+    ``settings`` are passed to FastMCP (host, port, ...).
+    """
+    reference_cache = reference_cache if reference_cache is not None else TTLCache()
+    rules_cache = rules_cache if rules_cache is not None else rules.rules_cache()
+    job_queue = job_queue if job_queue is not None else JobQueue()
+    change_cursors = change_cursors if change_cursors is not None else changes.cursor_cache()
+    metrics = metrics if metrics is not None else Metrics()
+    tenants = tenancy.ClientPool(client)
+    names = NameIndex(client, reference_cache)
+    tenants.on_evict.append(names.forget)
+    _export_client_metrics(metrics, client, reference_cache)
+    metrics.add_gauge("redmine_user_clients", "Per-user clients in the pool.", lambda: len(tenants))
+    metrics.add_gauge("redmine_jobs_running", "Background jobs running in this process.",
+                      lambda: job_queue.stats()["running"])
+
+    async def sync_mirror() -> None:
+        for scope in mirror.scopes:
+            try:
+                await mirror.ensure_fresh(client, scope)
+            except Exception as e:
+                logger.warning("Initial mirror sync of %s failed: %s", scope, e)
+
+    users = 0
+    tasks: list[asyncio.Task] = []
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        """Keep the shared connection pool open while any session is running.
+
+        With REDMINE_CACHE_WARMUP set, reference data and the name index are
+        prefetched in the background so the first lookups are served from the
+        cache; loaded names are then refreshed every REDMINE_INDEX_REFRESH
+        seconds. A configured issue mirror is likewise brought up to date in
+        the background, and persisted jobs left unfinished by a stopped
+        process are resumed; all of it yields to interactive requests in the
+        request scheduler. The background work starts with the first
+        concurrent session and stops with the last, so stateless HTTP (one
+        session per request) does not restart it on every call.
+        """
+        nonlocal users
+        async with client:
+            users += 1
+            if users == 1:
+                # Tasks copy the context, so their requests are scheduled as background work.
+                with background():
+                    if env_flag("REDMINE_CACHE_WARMUP"):
+                        tasks.append(asyncio.create_task(master.warm_up(client, reference_cache)))
+                        tasks.append(asyncio.create_task(names.warm_up()))
+                    tasks.append(asyncio.create_task(names.run()))
+                    tasks.append(asyncio.create_task(job_queue.run()))
+                    if mirror is not None:
+                        tasks.append(asyncio.create_task(sync_mirror()))
+            try:
+                yield
+            finally:
+                users -= 1
+                if users == 0:
+                    for task in tasks:
+                        task.cancel()
+                    tasks.clear()
+
+    mcp = FastMCP("redmine", lifespan=lifespan, **settings)
+    instrument(mcp, metrics)
+    tenancy.install(mcp, tenants)
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics_endpoint(request: Request) -> PlainTextResponse:
+        """Prometheus scrape endpoint (SSE / HTTP transports)."""
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+    issues.register(mcp, client, mirror, rules_cache, names, job_queue, change_cursors)
+    projects.register(mcp, client, reference_cache)
+    master.register(mcp, client, reference_cache)
+    wiki.register(mcp, client, rules_cache)
+    attachments.register(mcp, client)
+    jobs.register(mcp, job_queue)
+    return mcp
+
+
+def create_http_app(mcp: FastMCP) -> Starlette:
+    """Streamable HTTP ASGI app that keeps the server lifespan open per process.
+
+    In stateless mode every request is its own session; holding the lifespan
+    for the life of the worker keeps the connection pool and background work
+    from being torn down between requests.
+    """
+    app = mcp.streamable_http_app()
+    session_manager_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with mcp.settings.lifespan(mcp), session_manager_lifespan(app):
+            yield
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def _shared_state_from_env() -> "SharedState | None":
+    # sqlite3 and the optional components are only imported when configured,
+    # which keeps stdio cold starts short.
+    if not os.environ.get("REDMINE_SHARED_STATE_PATH"):
+        return None
+    from redmine_mcp.shared import SharedState
+
+    return SharedState.from_env()
+
+
+def _http_cache_from_env() -> "HttpCache | None":
+    if not os.environ.get("REDMINE_HTTP_CACHE_PATH"):
+        return None
+    from redmine_mcp.httpcache import HttpCache
+
+    return HttpCache.from_env()
+
+
+def _mirror_from_env() -> "IssueMirror | None":
+    if not os.environ.get("REDMINE_MIRROR_PATH"):
+        return None
+    from redmine_mcp.mirror import IssueMirror
+
+    return IssueMirror.from_env()
+
 
-mcp = FastMCP("redmine")
-client = RedmineClient()
+shared = _shared_state_from_env()
+client = RedmineClient(shared=shared, http_cache=_http_cache_from_env())
+reference_cache = TTLCache(shared=shared)
+rules_cache = rules.rules_cache(shared)
+change_cursors = changes.cursor_cache(shared)
+mirror = _mirror_from_env()
+job_queue = JobQueue.from_env()
+metrics = Metrics()
 
-issues.register(mcp, client)
-projects.register(mcp, client)
-master.register(mcp, client)
-wiki.register(mcp, client)
+mcp = create_server(
+    client,
+    reference_cache=reference_cache,
+    rules_cache=rules_cache,
+    mirror=mirror,
+    job_queue=job_queue,
+    change_cursors=change_cursors,
+    metrics=metrics,
+    host=os.environ.get("MCP_HOST", "0.0.0.0"),
+    port=int(os.environ.get("MCP_PORT", "8000")),
+    # Stateless streamable HTTP lets any worker behind a load balancer serve any request.
+    stateless_http=env_flag("MCP_STATELESS_HTTP", default=True),
+    json_response=env_flag("MCP_JSON_RESPONSE"),
+)
@@ -0,0 +1,98 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rate_slots (
+    name TEXT PRIMARY KEY,
+    next_slot REAL NOT NULL
+);
+"""
+
+
+class SharedState:
+    """State shared by the worker processes of one deployment.
+
+    Backed by a SQLite file in WAL mode, so every worker on the host sees the
+    same cache entries and rate limit slots. Values must be JSON-serializable.
+    Workers on different hosts cannot share a file; each host then keeps its
+    own state, which is still correct for caches (entries only live for their
+    TTL) and makes rate limits per host.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=10.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SharedState | None":
+        """Open REDMINE_SHARED_STATE_PATH, or return None if it is not set."""
+        path = os.environ.get("REDMINE_SHARED_STATE_PATH")
+        return cls(path) if path else None
+
+    def get(self, key: str) -> tuple[bool, Any, float]:
+        """Return ``(found, value, expires_at)``; ``expires_at`` is wall-clock time."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return False, None, 0.0
+        return True, json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        data = json.dumps(value)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, data),
+            )
+
+    def delete(self, prefix: str = "") -> int:
+        """Delete cache entries whose key starts with ``prefix`` (all by default)."""
+        with self._lock:
+            cur = self._db.execute(
+                "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix),
+            )
+            self._db.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        return cur.rowcount
+
+    def reserve(self, name: str, interval: float) -> float:
+        """Claim the next slot of a rate limit shared by all workers.
+
+        Slots are ``interval`` seconds apart. Returns how long the caller must
+        wait before its slot starts.
+        """
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._db.execute(
+                    "SELECT next_slot FROM rate_slots WHERE name = ?", (name,),
+                ).fetchone()
+                slot = max(now, row[0] if row else 0.0)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO rate_slots (name, next_slot) VALUES (?, ?)",
+                    (name, slot + interval),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return slot - now
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,199 @@
+import itertools
+from collections import Counter
+from typing import Any
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_int
+from redmine_mcp.executor import BulkExecutor
+from redmine_mcp.pagination import MAX_PAGE_SIZE, Paginator
+from redmine_mcp.resolver import NameIndex
+
+# Dimension -> (issue filter parameter, issue field holding {id, name}).
+DIMENSIONS = {
+    "status": ("status_id", "status"),
+    "tracker": ("tracker_id", "tracker"),
+    "priority": ("priority_id", "priority"),
+    "assignee": ("assigned_to_id", "assigned_to"),
+}
+# Name index collections the other dimensions are enumerated from.
+KINDS = {"status": "statuses", "tracker": "trackers", "priority": "priorities"}
+DEFAULT_MAX_FACET_QUERIES = 100
+DEFAULT_SCAN_LIMIT = 10000
+# Label of issues assigned to someone outside the project's members.
+OTHER_ASSIGNEE = "(other)"
+
+Facet = tuple[Any, str | None]  # (filter value, label)
+
+
+async def facet_values(
+    client: RedmineClient,
+    names: NameIndex,
+    dimension: str,
+    params: dict[str, Any],
+) -> list[Facet] | None:
+    """Every value ``dimension`` can take under ``params``, or None if unknown.
+
+    Assignees can only be enumerated from a project's memberships.
+    """
+    value = params.get(DIMENSIONS[dimension][0])
+    if value is not None and str(value).isdigit():
+        if dimension == "assignee":
+            return [(value, str(value))]
+        lookup = await names.lookup(KINDS[dimension])
+        record = lookup.records.get(int(value))
+        return [(value, record["name"] if record else str(value))]
+    if dimension == "assignee":
+        if value is not None or "project_id" not in params:
+            return None
+        members = await Paginator(
+            client, f"/projects/{params['project_id']}/memberships.json", "memberships",
+        ).collect()
+        facets: dict[int, str] = {}
+        for membership in members["memberships"]:
+            principal = membership.get("user") or membership.get("group")
+            if principal is not None:
+                facets[principal["id"]] = principal["name"]
+        return [("!*", None), *facets.items()]
+    if dimension == "tracker" and "project_id" in params:
+        project = await client.get(f"/projects/{params['project_id']}.json", params={"include": "trackers"})
+        return [(t["id"], t["name"]) for t in project["project"].get("trackers", [])]
+    records = (await names.lookup(KINDS[dimension])).records.values()
+    if dimension == "status":
+        if value is None or value == "open":
+            records = [r for r in records if not r.get("is_closed")]
+        elif value == "closed":
+            records = [r for r in records if r.get("is_closed")]
+        elif value != "*":
+            return None
+    return [(r["id"], r["name"]) for r in records]
+
+
+async def count_by_facets(
+    client: RedmineClient,
+    params: dict[str, Any],
+    group_by: list[str],
+    facets: dict[str, list[Facet]],
+    total: int,
+) -> tuple[Counter, int]:
+    """Count each combination of facet values with a ``limit=1`` query.
+
+    Only ``total_count`` of each response is used. When grouping by assignee,
+    issues assigned outside the enumerated members are counted as
+    OTHER_ASSIGNEE by subtracting from the totals over the other dimensions.
+    """
+    combos = list(itertools.product(*(facets[d] for d in group_by)))
+    others = [d for d in group_by if d != "assignee"]
+    marginals = (
+        list(itertools.product(*(facets[d] for d in others))) if "assignee" in group_by and others else []
+    )
+
+    async def count(dims: list[str], combo: tuple[Facet, ...]) -> int:
+        query = {**params, "limit": 1}
+        for dim, (value, _) in zip(dims, combo):
+            query[DIMENSIONS[dim][0]] = value
+        return (await client.get("/issues.json", params=query))["total_count"]
+
+    executor = BulkExecutor()
+    report = await executor.run(
+        [(group_by, c) for c in combos] + [(others, m) for m in marginals],
+        lambda job: count(*job),
+    )
+    for outcome in report.outcomes:
+        if not outcome.ok:
+            raise outcome.error
+    results = [o.result for o in report.outcomes]
+
+    counts: Counter = Counter()
+    for combo, n in zip(combos, results):
+        counts[tuple(label for _, label in combo)] += n
+    if "assignee" in group_by:
+        index = group_by.index("assignee")
+        totals = dict(zip((tuple(label for _, label in m) for m in marginals), results[len(combos):]))
+        if not others:
+            totals = {(): total}
+        for key, subtotal in totals.items():
+            assigned = sum(n for k, n in counts.items() if k[:index] + k[index + 1:] == key)
+            if subtotal > assigned:
+                counts[key[:index] + (OTHER_ASSIGNEE,) + key[index:]] += subtotal - assigned
+    return counts, len(report.outcomes)
+
+
+async def count_by_scan(
+    client: RedmineClient,
+    params: dict[str, Any],
+    group_by: list[str],
+    limit: int,
+) -> tuple[Counter, int, bool]:
+    """Count issues by streaming through them page by page (at most ``limit``)."""
+    paginator = Paginator(client, "/issues.json", "issues", params, max_items=limit)
+    counts: Counter = Counter()
+    scanned = 0
+    async for issue in paginator:
+        scanned += 1
+        counts[tuple((issue.get(DIMENSIONS[d][1]) or {}).get("name") for d in group_by)] += 1
+    pages = max(1, -(-scanned // paginator.page_size))
+    return counts, pages, scanned < (paginator.total_count or 0)
+
+
+async def issue_stats(
+    client: RedmineClient,
+    names: NameIndex,
+    params: dict[str, Any],
+    group_by: list[str],
+    method: str = "auto",
+) -> dict[str, Any]:
+    """Issue counts under ``params`` grouped by ``group_by``.
+
+    With ``method="auto"``, a result set that fits one page is simply read;
+    otherwise each facet combination is counted with a ``limit=1`` query if
+    every dimension can be enumerated and the combinations stay within
+    REDMINE_STATS_MAX_FACETS, and the issues are scanned if not.
+    """
+    unknown = [d for d in group_by if d not in DIMENSIONS]
+    if unknown or not group_by:
+        raise ValueError(f"group_by must name some of {', '.join(DIMENSIONS)} (got {unknown or group_by})")
+    if method not in ("auto", "facets", "scan"):
+        raise ValueError(f"Unknown method {method!r}; use auto, facets or scan")
+    group_by = list(dict.fromkeys(group_by))
+    total = (await client.get("/issues.json", params={**params, "limit": 1}))["total_count"]
+    queries = 1
+    truncated = False
+
+    used = "scan"
+    if method == "facets" or (method == "auto" and total > MAX_PAGE_SIZE):
+        facets: dict[str, list[Facet]] = {}
+        for dim in group_by:
+            values = await facet_values(client, names, dim, params)
+            if values is None:
+                if method == "facets":
+                    raise ValueError(f"Cannot enumerate {dim} values here; use method='scan'")
+                break
+            facets[dim] = values
+        else:
+            size = 1
+            for dim in group_by:
+                size *= len(facets[dim])
+            max_queries = env_int("REDMINE_STATS_MAX_FACETS", DEFAULT_MAX_FACET_QUERIES)
+            if size <= max_queries or method == "facets":
+                used = "facets"
+                counts, n = await count_by_facets(client, params, group_by, facets, total)
+                queries += n
+    if used == "scan":
+        counts, n, truncated = await count_by_scan(
+            client, params, group_by, env_int("REDMINE_STATS_SCAN_LIMIT", DEFAULT_SCAN_LIMIT),
+        )
+        queries += n
+
+    rows = [
+        {**dict(zip(group_by, key)), "count": n}
+        for key, n in sorted(counts.items(), key=lambda kv: (-kv[1], [str(k) for k in kv[0]]))
+        if n
+    ]
+    return {
+        "group_by": group_by,
+        "total": total,
+        "rows": rows,
+        "method": used,
+        "queries": queries,
+        "truncated": truncated,
+    }
@@ -0,0 +1,81 @@
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator
+from typing import Any
+
+# A single array element larger than this is treated as malformed input.
+MAX_ITEM_CHARS = 16 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class StreamFormatError(ValueError):
+    """The streamed document did not contain a well-formed array under the key."""
+
+
+async def iter_array_items(chunks: AsyncIterator[bytes], key: str) -> AsyncIterator[Any]:
+    """Yield the elements of the first ``"key": [...]`` array in a JSON byte stream.
+
+    Elements are decoded one at a time as soon as they are complete, and only
+    the undecoded tail of the stream is buffered, so memory stays bounded by
+    the largest single element rather than the whole document. Everything
+    before the array is skipped without being parsed. Stopping iteration
+    early leaves the rest of the stream unread.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    # An unescaped quote cannot occur inside a JSON string, so this only
+    # matches a real key.
+    marker = re.compile(r'(?<!\\)"' + re.escape(key) + r'"\s*:\s*\[')
+    buf = ""
+    in_array = False
+    done = False
+
+    async def more() -> bool:
+        nonlocal buf, done
+        async for chunk in chunks:
+            text = utf8.decode(chunk)
+            if text:
+                buf += text
+                return True
+        buf += utf8.decode(b"", final=True)
+        done = True
+        return False
+
+    while True:
+        if not in_array:
+            match = marker.search(buf)
+            if match is None:
+                # Keep just enough of the tail to match a marker split across chunks.
+                buf = buf[-(len(key) + 64):]
+                if not await more():
+                    return
+                continue
+            buf = buf[match.end():]
+            in_array = True
+
+        pos = 0
+        while pos < len(buf) and (buf[pos] in _WHITESPACE or buf[pos] == ","):
+            pos += 1
+        buf = buf[pos:]
+        if not buf:
+            if not await more():
+                raise StreamFormatError(f"Stream ended inside the {key!r} array")
+            continue
+        if buf[0] == "]":
+            return
+        try:
+            item, end = _decoder.raw_decode(buf)
+        except json.JSONDecodeError:
+            if len(buf) > MAX_ITEM_CHARS:
+                raise StreamFormatError(f"Element of {key!r} exceeds {MAX_ITEM_CHARS} characters")
+            if done or not await more():
+                raise StreamFormatError(f"Malformed element in the {key!r} array")
+            continue
+        if end == len(buf) and not done and not isinstance(item, (dict, list, str)):
+            # A number or literal at the end of the buffer may continue in the next chunk.
+            await more()
+            continue
+        buf = buf[end:]
+        yield item
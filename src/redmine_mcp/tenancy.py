@@ -0,0 +1,155 @@
+import functools
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from redmine_mcp.config import env_flag, env_int
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+    from redmine_mcp.client import RedmineClient
+
+DEFAULT_POOL_SIZE = 256
+API_KEY_HEADER = "x-redmine-api-key"
+URL_HEADER = "x-redmine-url"
+
+# The client for the credentials of the tool call being served, when they
+# differ from the server's own (see ``ClientPool``).
+current_tenant: ContextVar["RedmineClient | None"] = ContextVar("redmine_mcp_tenant", default=None)
+# Whether the tool call being served came over SSE or streamable HTTP
+# (with or without a key) rather than from the local stdio client.
+remote_call: ContextVar[bool] = ContextVar("redmine_mcp_remote_call", default=False)
+
+
+def tenant_scope(base_url: str, api_key: str) -> str:
+    """Opaque, stable identifier for a set of credentials (never the key itself)."""
+    return hashlib.sha256(f"{base_url}\0{api_key}".encode()).hexdigest()[:16]
+
+
+def cache_scope() -> str | None:
+    """Scope for per-user cached data: None for the server's own credentials."""
+    tenant = current_tenant.get()
+    return tenant.scope if tenant is not None else None
+
+
+class ClientPool:
+    """LRU pool of per-user clients, keyed by (Redmine URL, API key).
+
+    Every pooled client is a ``RedmineClient.with_credentials`` view of
+    ``root``, so all users share one keep-alive connection pool, one set of
+    circuit breakers and one rate limit. Beyond ``max_size`` entries the least
+    recently used idle client is dropped; clients serving a call are kept.
+    Each function in ``on_evict`` is then called with the dropped client's
+    scope, so per-user state kept elsewhere can go with it.
+    A URL other than the root's is accepted only if listed in
+    REDMINE_ALLOWED_URLS, so the server cannot be pointed at arbitrary hosts.
+    """
+
+    def __init__(self, root: "RedmineClient", max_size: int | None = None):
+        self.root = root
+        self.max_size = max_size or env_int("REDMINE_CLIENT_POOL_SIZE", DEFAULT_POOL_SIZE)
+        self.allowed_urls = {
+            url.strip().rstrip("/")
+            for url in os.environ.get("REDMINE_ALLOWED_URLS", "").split(",")
+            if url.strip()
+        }
+        self._clients: OrderedDict[tuple[str, str], RedmineClient] = OrderedDict()
+        self._leases: dict[tuple[str, str], int] = {}
+        self.on_evict: list[Callable[[str], None]] = []
+        self.created = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _get(self, url: str | None, api_key: str) -> tuple[tuple[str, str], "RedmineClient"]:
+        base_url = (url or self.root.base_url).rstrip("/")
+        if base_url != self.root.base_url and base_url not in self.allowed_urls:
+            raise ValueError(f"Redmine URL {base_url!r} is not allowed (see REDMINE_ALLOWED_URLS)")
+        key = (base_url, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = self.root.with_credentials(base_url, api_key)
+            self.created += 1
+            self._evict()
+        else:
+            self._clients.move_to_end(key)
+        return key, client
+
+    def _evict(self) -> None:
+        for key in list(self._clients):
+            if len(self._clients) <= self.max_size:
+                return
+            if not self._leases.get(key):
+                client = self._clients.pop(key)
+                self.evicted += 1
+                for forget in self.on_evict:
+                    forget(client.scope)
+
+    @asynccontextmanager
+    async def lease(self, url: str | None, api_key: str) -> AsyncIterator["RedmineClient"]:
+        """Serve the enclosed calls with the client for these credentials."""
+        key, client = self._get(url, api_key)
+        self._leases[key] = self._leases.get(key, 0) + 1
+        token = current_tenant.set(client)
+        try:
+            yield client
+        finally:
+            current_tenant.reset(token)
+            self._leases[key] -= 1
+            if not self._leases[key]:
+                del self._leases[key]
+            self._evict()
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self._clients), "created": self.created, "evicted": self.evicted}
+
+
+def _request_headers(mcp: "FastMCP") -> Mapping[str, str] | None:
+    try:
+        request = mcp.get_context().request_context.request
+    except (LookupError, ValueError):
+        return None
+    return getattr(request, "headers", None)
+
+
+def install(mcp: "FastMCP", pool: ClientPool) -> None:
+    """Serve every tool registered on ``mcp`` from now on with the caller's credentials.
+
+    Over SSE and streamable HTTP, a request carrying ``X-Redmine-API-Key``
+    (and optionally ``X-Redmine-URL``) is served with those credentials
+    instead of the server's. With REDMINE_REQUIRE_USER_KEY set, HTTP requests
+    without a key are rejected rather than falling back to the server's key.
+    """
+    add_tool = mcp.add_tool
+    require_key = env_flag("REDMINE_REQUIRE_USER_KEY")
+
+    def wrap(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            headers = _request_headers(mcp)
+            if headers is None:
+                return await fn(*args, **kwargs)
+            token = remote_call.set(True)
+            try:
+                api_key = headers.get(API_KEY_HEADER)
+                if not api_key:
+                    if require_key:
+                        raise PermissionError(f"This server requires the {API_KEY_HEADER} header")
+                    return await fn(*args, **kwargs)
+                async with pool.lease(headers.get(URL_HEADER), api_key):
+                    return await fn(*args, **kwargs)
+            finally:
+                remote_call.reset(token)
+
+        return wrapper
+
+    def add_tenant_tool(fn: Callable[..., Any], name: str | None = None, **kwargs: Any) -> None:
+        add_tool(wrap(fn), name=name or fn.__name__, **kwargs)
+
+    mcp.add_tool = add_tenant_tool
@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import mimetypes
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.tenancy import current_tenant, remote_call
+
+# Bytes read from disk or the network per step; memory use is bounded by this.
+CHUNK_SIZE = 1024 * 1024
+# Progress is reported each time another this fraction of the file is done.
+PROGRESS_STEP = 0.01
+
+
+def local_path(path: str) -> Path:
+    """Resolve a path given to a tool, confined to REDMINE_ATTACHMENT_DIR if set.
+
+    Relative paths are taken relative to that directory. Without it, only
+    local (stdio) calls may touch the disk: a call over SSE or streamable
+    HTTP, with or without a key, could otherwise read or write any file the
+    server can.
+    """
+    root = os.environ.get("REDMINE_ATTACHMENT_DIR")
+    if not root:
+        if remote_call.get() or current_tenant.get() is not None:
+            raise PermissionError("File transfers over HTTP require REDMINE_ATTACHMENT_DIR")
+        return Path(path).expanduser().resolve()
+    base = Path(root).expanduser().resolve()
+    resolved = (base / path).resolve()
+    if not resolved.is_relative_to(base):
+        raise PermissionError(f"{path!r} is outside REDMINE_ATTACHMENT_DIR")
+    return resolved
+
+
+class Transfer:
+    """Byte count, SHA-256 and throttled progress notifications of one transfer."""
+
+    def __init__(self, ctx: Context | None, total: int, message: str):
+        self.ctx = ctx
+        self.total = total
+        self.message = message
+        self.done = 0
+        self.sha256 = hashlib.sha256()
+        self.started = time.perf_counter()
+        self._reported = 0
+
+    async def add(self, chunk: bytes) -> None:
+        self.done += len(chunk)
+        self.sha256.update(chunk)
+        if self.ctx is not None and (
+            self.done - self._reported >= self.total * PROGRESS_STEP or self.done == self.total
+        ):
+            self._reported = self.done
+            await self.ctx.report_progress(self.done, self.total or None, self.message)
+
+    def stats(self) -> dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "size": self.done,
+            "sha256": self.sha256.hexdigest(),
+            "elapsed_seconds": round(elapsed, 3),
+            "bytes_per_second": round(self.done / elapsed) if elapsed > 0 else None,
+        }
+
+
+def register(mcp: FastMCP, client: RedmineClient) -> None:
+    """Register attachment transfer tools on the MCP server."""
+
+    @mcp.tool()
+    async def upload_attachment(
+        file_path: str,
+        filename: str | None = None,
+        content_type: str | None = None,
+        description: str | None = None,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Upload a local file to Redmine so it can be attached to an issue.
+
+        The file is streamed from disk in chunks, so large files use constant
+        memory; progress is reported while it is sent. Pass the returned
+        "upload" object in the uploads list of create_issue or update_issue to
+        attach the file.
+
+        Args:
+            file_path: Path of the file to upload (relative to REDMINE_ATTACHMENT_DIR if set).
+            filename: Attachment file name (defaults to the name of the file).
+            content_type: MIME type (guessed from the file name when omitted).
+            description: Attachment description.
+        """
+        path = local_path(file_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"No such file: {file_path}")
+        size = path.stat().st_size
+        filename = filename or path.name
+        transfer = Transfer(ctx, size, f"Uploading {filename}")
+
+        async def body() -> AsyncIterator[bytes]:
+            nonlocal transfer
+            # Every attempt rereads the file from the start.
+            transfer = Transfer(ctx, size, f"Uploading {filename}")
+            with path.open("rb") as f:
+                while chunk := await asyncio.to_thread(f.read, CHUNK_SIZE):
+                    await transfer.add(chunk)
+                    yield chunk
+
+        result = await client.upload(body, size, filename)
+        upload: dict[str, Any] = {
+            "token": result["upload"]["token"],
+            "filename": filename,
+            "content_type": content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        }
+        if description:
+            upload["description"] = description
+        return {"upload": upload, "id": result["upload"].get("id"), **transfer.stats()}
+
+    @mcp.tool()
+    async def download_attachment(
+        attachment_id: int,
+        path: str | None = None,
+        overwrite: bool = False,
+        ctx: Context | None = None,
+    ) -> dict[str, Any]:
+        """Download an attachment to a local file.
+
+        The content is streamed to disk in chunks, so large files use constant
+        memory; progress is reported while it is received. The file is
+        written under a temporary name and renamed only once complete, i.e.
+        of the size Redmine reports (the API exposes no checksum; the SHA-256
+        of what was received is returned for checking against a known one).
+
+        Args:
+            attachment_id: The attachment id (see the attachments of get_issue).
+            path: Destination file or existing directory (relative to
+                  REDMINE_ATTACHMENT_DIR if set). Defaults to the attachment's
+                  file name in that directory, or the working directory.
+            overwrite: Replace an existing file at the destination.
+        """
+        meta = (await client.get(f"/attachments/{attachment_id}.json"))["attachment"]
+        filename = Path(meta["filename"]).name or f"attachment-{attachment_id}"
+        dest = local_path(path or filename)
+        if dest.is_dir():
+            dest = dest / filename
+        if dest.exists() and not overwrite:
+            raise FileExistsError(f"{dest} already exists (set overwrite to replace it)")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        partial = dest.with_name(dest.name + ".part")
+        transfer = Transfer(ctx, meta.get("filesize", 0), f"Downloading {filename}")
+
+        try:
+            async with client.stream(f"/attachments/download/{attachment_id}") as resp:
+                with partial.open("wb") as f:
+                    async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                        await transfer.add(chunk)
+                        await asyncio.to_thread(f.write, chunk)
+            expected = meta.get("filesize")
+            if expected is not None and transfer.done != expected:
+                raise OSError(f"Received {transfer.done} bytes of attachment {attachment_id}, expected {expected}")
+            os.replace(partial, dest)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        return {
+            "path": str(dest),
+            "filename": filename,
+            "content_type": meta.get("content_type"),
+            **transfer.stats(),
+        }
@@ -1,12 +1,381 @@
-from typing import Any
+import asyncio
+import itertools
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import httpx
 from mcp.server.fastmcp import FastMCP
 
+from redmine_mcp import stats
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.changes import ALL_PROJECTS, Cursor, cursor_cache, fetch_changes, normalize_since
 from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_int
+from redmine_mcp.executor import BulkExecutor, BulkReport
+from redmine_mcp.jobs import Job, JobQueue
+from redmine_mcp.pagination import MAX_PAGE_SIZE, Paginator, fetch_limit
+from redmine_mcp.projection import shape
+from redmine_mcp.resolver import NameIndex
+from redmine_mcp.rules import get_rules, rules_cache
+from redmine_mcp.scheduler import background
+from redmine_mcp.streaming import iter_array_items
+from redmine_mcp.tenancy import current_tenant
+from redmine_mcp.tools.attachments import local_path
 
+if TYPE_CHECKING:
+    from redmine_mcp.mirror import IssueMirror
 
-def register(mcp: FastMCP, client: RedmineClient) -> None:
-    """Register issue-related tools on the MCP server."""
+# Associations /issues.json can embed; anything else needs per-issue requests.
+LIST_INCLUDES = frozenset({"attachments", "relations"})
+# Keep the issue_id filter well below common proxy URL limits.
+MAX_ID_FILTER_LENGTH = 1500
+# Items a background job processes between checkpoints.
+JOB_CHUNK_SIZE = 100
+DEFAULT_TREE_MAX_NODES = 500
+DEFAULT_TREE_FIELDS = "id,subject,tracker,status,assigned_to,done_ratio"
+# A relation as seen from its other end.
+INVERSE_RELATIONS = {
+    "blocks": "blocked", "blocked": "blocks",
+    "precedes": "follows", "follows": "precedes",
+    "duplicates": "duplicated", "duplicated": "duplicates",
+    "copied_to": "copied_from", "copied_from": "copied_to",
+}
+# Fields create_issue can set, i.e. the TicketRules required fields it can check.
+CREATE_FIELDS = frozenset({
+    "project_id", "subject", "description", "tracker_id", "status_id", "priority_id",
+    "assigned_to_id", "parent_issue_id", "start_date", "due_date", "estimated_hours",
+})
+
+logger = logging.getLogger(__name__)
+
+
+def chunk_issue_ids(issue_ids: list[int], max_length: int = MAX_ID_FILTER_LENGTH) -> list[list[int]]:
+    """Split ids into groups whose comma-joined filter fits a URL and one page."""
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    length = 0
+    for iid in issue_ids:
+        size = len(str(iid)) + 1
+        if current and (length + size > max_length or len(current) >= MAX_PAGE_SIZE):
+            chunks.append(current)
+            current, length = [], 0
+        current.append(iid)
+        length += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def fetch_issues_by_ids(
+    client: RedmineClient,
+    issue_ids: list[int],
+    include: str | None = None,
+) -> dict[str, Any]:
+    """Fetch issues by id using as few requests as the includes allow.
+
+    Returns "issues" keyed by id (in input order), plus "missing", "forbidden"
+    and "errors" for ids that could not be fetched. A list query leaves out
+    both nonexistent and invisible issues, so the ids it did not return are
+    fetched one by one to tell the two apart.
+    """
+    ids = list(dict.fromkeys(issue_ids))
+    includes = {i.strip() for i in include.split(",") if i.strip()} if include else set()
+    found: dict[str, Any] = {}
+    missing: list[int] = []
+    forbidden: list[int] = []
+    errors: dict[str, str] = {}
+    executor = BulkExecutor()
+
+    async def fetch_each(iids: list[int]) -> None:
+        params = {"include": ",".join(sorted(includes))} if includes else None
+        report = await executor.run(
+            iids, lambda iid: client.get(f"/issues/{iid}.json", params=params),
+        )
+        for outcome in report.outcomes:
+            status = (
+                outcome.error.response.status_code
+                if isinstance(outcome.error, httpx.HTTPStatusError) else None
+            )
+            if outcome.ok:
+                found[str(outcome.item)] = outcome.result["issue"]
+            elif status == 404:
+                missing.append(outcome.item)
+            elif status == 403:
+                forbidden.append(outcome.item)
+            else:
+                errors[str(outcome.item)] = str(outcome.error)
+
+    if includes <= LIST_INCLUDES:
+        async def fetch_chunk(chunk: list[int]) -> dict[str, Any]:
+            params: dict[str, Any] = {
+                "issue_id": ",".join(map(str, chunk)),
+                "status_id": "*",
+                "limit": len(chunk),
+            }
+            if includes:
+                params["include"] = ",".join(sorted(includes))
+            return await client.get("/issues.json", params=params)
+
+        report = await executor.run(chunk_issue_ids(ids), fetch_chunk)
+        unmatched: list[int] = []
+        for outcome in report.outcomes:
+            if outcome.ok:
+                for issue in outcome.result.get("issues", []):
+                    found[str(issue["id"])] = issue
+                unmatched.extend(i for i in outcome.item if str(i) not in found)
+            else:
+                for iid in outcome.item:
+                    errors[str(iid)] = str(outcome.error)
+        if unmatched:
+            await fetch_each(unmatched)
+    else:
+        await fetch_each(ids)
+
+    return {
+        "issues": {str(iid): found[str(iid)] for iid in ids if str(iid) in found},
+        "missing": missing,
+        "forbidden": forbidden,
+        "errors": errors,
+    }
+
+
+async def read_journals(
+    client: RedmineClient,
+    issue_id: int,
+    *,
+    limit: int,
+    since: str | None = None,
+    cursor: int | None = None,
+    notes_only: bool = False,
+    user_id: int | None = None,
+    newest_first: bool = False,
+) -> dict[str, Any]:
+    """Return one window of an issue's journals, parsing the response as it streams.
+
+    At most ``limit + 1`` journals are held at a time. Oldest first, reading
+    stops as soon as the window is full; newest first has to read the whole
+    history but keeps only the last matches.
+    """
+
+    def matches(journal: dict[str, Any]) -> bool:
+        if cursor is not None and (journal["id"] >= cursor if newest_first else journal["id"] <= cursor):
+            return False
+        if since is not None and journal.get("created_on", "") < since:
+            return False
+        if notes_only and not journal.get("notes"):
+            return False
+        if user_id is not None and (journal.get("user") or {}).get("id") != user_id:
+            return False
+        return True
+
+    scanned = 0
+    window: deque[dict[str, Any]] = deque(maxlen=limit + 1 if newest_first else None)
+    async with client.stream(f"/issues/{issue_id}.json", params={"include": "journals"}) as resp:
+        async for journal in iter_array_items(resp.aiter_bytes(), "journals"):
+            scanned += 1
+            if matches(journal):
+                window.append(journal)
+                if not newest_first and len(window) > limit:
+                    break
+    journals = list(reversed(window)) if newest_first else list(window)
+    has_more = len(journals) > limit
+    journals = journals[:limit]
+    return {
+        "issue_id": issue_id,
+        "journals": journals,
+        "next_cursor": journals[-1]["id"] if has_more else None,
+        "scanned": scanned,
+    }
+
+
+async def fetch_issue_tree(
+    client: RedmineClient,
+    root_id: int,
+    depth: int,
+    relations: bool = False,
+    max_nodes: int | None = None,
+) -> dict[str, Any]:
+    """Walk the issues below ``root_id`` breadth-first, one level at a time.
+
+    The children of a whole level are listed with ``parent_id`` filters of
+    many parents each (chunked to fit a URL), and with ``relations`` the
+    related issues of the level are fetched by batched id filters, so each
+    level costs about one round trip. Every issue is visited once: a link to
+    an issue already in the tree is reported as an edge, and as a cycle if
+    it points back to an ancestor.
+
+    Returns the visited ``issues`` by id and, per id, its tree ``parent``,
+    the relation it was reached ``via`` (if not a subtask), its
+    ``children`` in the tree and its ``links`` to issues placed elsewhere.
+    """
+    max_nodes = max_nodes or env_int("REDMINE_TREE_MAX_NODES", DEFAULT_TREE_MAX_NODES)
+    include = "relations" if relations else None
+    root = (await fetch_issues_by_ids(client, [root_id], include))["issues"].get(str(root_id))
+    if root is None:
+        raise ValueError(f"Issue {root_id} does not exist or is not visible")
+    issues: dict[int, dict[str, Any]] = {root_id: root}
+    parent: dict[int, int | None] = {root_id: None}
+    via: dict[int, str] = {}
+    children: dict[int, list[int]] = {}
+    links: dict[int, list[dict[str, Any]]] = {}
+    cycles: list[list[int]] = []
+    followed: set[int] = set()
+    executor = BulkExecutor()
+
+    def ancestors(iid: int) -> set[int]:
+        found = set()
+        while iid is not None:
+            found.add(iid)
+            iid = parent[iid]
+        return found
+
+    def visit(iid: int, issue: dict[str, Any], from_id: int, relation: str | None = None) -> bool:
+        if len(issues) >= max_nodes:
+            return False
+        issues[iid] = issue
+        parent[iid] = from_id
+        children.setdefault(from_id, []).append(iid)
+        if relation is not None:
+            via[iid] = relation
+        return True
+
+    async def list_children(chunk: list[int]) -> list[dict[str, Any]]:
+        params = {"parent_id": ",".join(map(str, chunk)), "status_id": "*"}
+        if include:
+            params["include"] = include
+        return (await Paginator(client, "/issues.json", "issues", params).collect())["issues"]
+
+    frontier = [root_id]
+    levels = 0
+    truncated = False
+    while frontier and levels < depth and not truncated:
+        levels += 1
+        report = await executor.run(chunk_issue_ids(frontier), list_children)
+        found: list[int] = []
+        for outcome in report.outcomes:
+            if not outcome.ok:
+                raise outcome.error
+            for issue in outcome.result:
+                iid, pid = issue["id"], (issue.get("parent") or {}).get("id")
+                if pid not in issues:
+                    continue
+                if iid in issues:
+                    # Already reached through a relation, or a cycle back up the tree.
+                    if iid in ancestors(pid):
+                        cycles.append([pid, iid])
+                    links.setdefault(pid, []).append({"id": iid, "relation": "subtask"})
+                    continue
+                if not visit(iid, issue, pid):
+                    truncated = True
+                    break
+                found.append(iid)
+
+        if relations and not truncated:
+            wanted: dict[int, tuple[int, str]] = {}
+            for iid in frontier:
+                for rel in issues[iid].get("relations", []):
+                    # Both ends list a relation; it is followed from the first one visited.
+                    if rel["id"] in followed:
+                        continue
+                    followed.add(rel["id"])
+                    outgoing = rel["issue_id"] == iid
+                    other = rel["issue_to_id"] if outgoing else rel["issue_id"]
+                    kind = rel["relation_type"] if outgoing else INVERSE_RELATIONS.get(
+                        rel["relation_type"], rel["relation_type"],
+                    )
+                    if other in issues or other in wanted:
+                        if other in ancestors(iid):
+                            cycles.append([iid, other])
+                        links.setdefault(iid, []).append({"id": other, "relation": kind})
+                    else:
+                        wanted[other] = (iid, kind)
+            fetched = await fetch_issues_by_ids(client, list(wanted), include)
+            for key, issue in fetched["issues"].items():
+                from_id, kind = wanted[int(key)]
+                if not visit(int(key), issue, from_id, kind):
+                    truncated = True
+                    break
+                found.append(int(key))
+        frontier = found
+
+    return {
+        "issues": issues,
+        "parent": parent,
+        "via": via,
+        "children": children,
+        "links": links,
+        "cycles": cycles,
+        "levels": levels,
+        "truncated": truncated,
+    }
+
+
+def register(
+    mcp: FastMCP,
+    client: RedmineClient,
+    mirror: "IssueMirror | None" = None,
+    rules: TTLCache | None = None,
+    names: NameIndex | None = None,
+    jobs: JobQueue | None = None,
+    cursors: TTLCache | None = None,
+) -> None:
+    """Register issue-related tools on the MCP server.
+
+    With a ``mirror``, list and search queries it can answer are served from
+    the local copy, and writes are written through to it. The mirror holds
+    what the server's own API key can see, so calls made with another user's
+    credentials bypass it. ``rules`` caches the parsed TicketRules pages new
+    issues are checked against, and ``names`` resolves the status, tracker,
+    priority, assignee and project names the tools accept in place of ids.
+    Long operations are submitted to ``jobs``, and ``cursors`` keeps the
+    last change feed position of each project.
+    """
+    rules = rules if rules is not None else rules_cache()
+    names = names if names is not None else NameIndex(client, TTLCache())
+    jobs = jobs if jobs is not None else JobQueue()
+    cursors = cursors if cursors is not None else cursor_cache()
+
+    async def by_name(
+        kind: str,
+        id_value: Any,
+        name: str | None,
+        id_param: str,
+        resolved: dict[str, Any] | None = None,
+    ) -> Any:
+        """The id given directly, or the id of the record called ``name``.
+
+        Write tools pass ``resolved``: only an exact name or a unique prefix is
+        then accepted, and the record picked is noted there under ``id_param``
+        so the result shows what was written.
+        """
+        if name is None:
+            return id_value
+        if id_value is not None:
+            raise ValueError(f"Pass either {id_param} or a name for it, not both")
+        if resolved is None:
+            return await names.resolve(kind, name)
+        rid = await names.resolve(kind, name, strict=True)
+        lookup = await names.lookup(kind)
+        resolved[id_param] = {"id": rid, "name": lookup.label(rid) if rid in lookup.records else name}
+        return rid
+
+    def local_mirror() -> "IssueMirror | None":
+        return mirror if current_tenant.get() is None else None
+
+    async def write_through(issue_ids: list[int]) -> None:
+        mirror = local_mirror()
+        if mirror is None or not issue_ids:
+            return
+        try:
+            include = "journals" if mirror.with_journals else None
+            fetched = await fetch_issues_by_ids(client, issue_ids, include)
+            mirror.upsert(fetched["issues"].values())
+        except Exception as e:
+            logger.warning("Failed to update mirror for issues %s: %s", issue_ids, e)
 
     @mcp.tool()
     async def list_issues(
@@ -14,22 +383,45 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         status_id: str | None = None,
         assigned_to_id: str | None = None,
         tracker_id: int | None = None,
+        status: str | None = None,
+        assignee: str | None = None,
+        tracker: str | None = None,
         limit: int = 25,
         offset: int = 0,
         sort: str | None = None,
+        fetch_all: bool = False,
+        max_items: int | None = None,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """List Redmine issues with optional filters.
 
+        Set fetch_all (or max_items) to page through the whole result set in one
+        call instead of looping on offset; pages are fetched concurrently.
+
         Args:
-            project_id: Filter by project identifier or id.
+            project_id: Filter by project identifier, id or name.
             status_id: Filter by status id. Use "open", "closed", "*" or a numeric id.
             assigned_to_id: Filter by assignee id. Use "me" for current user.
             tracker_id: Filter by tracker id.
+            status: Filter by status name, e.g. "In Progress" (instead of status_id).
+            assignee: Filter by assignee login or name, e.g. "tanaka" (instead of assigned_to_id).
+            tracker: Filter by tracker name (instead of tracker_id).
             limit: Max number of issues to return (default 25, max 100).
             offset: Number of issues to skip.
             sort: Sort field and direction, e.g. "updated_on:desc".
+            fetch_all: Return every matching issue starting at offset (capped by
+                       REDMINE_FETCH_ALL_LIMIT; "truncated" is true if more remain).
+            max_items: Return up to this many issues, fetching as many pages as needed.
+            fields: Comma-separated fields to return per issue, e.g. "id,subject,status.name".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if project_id is not None:
+            project_id = await names.resolve_project(project_id)
+        status_id = await by_name("statuses", status_id, status, "status_id")
+        assigned_to_id = await by_name("users", assigned_to_id, assignee, "assigned_to_id")
+        tracker_id = await by_name("trackers", tracker_id, tracker, "tracker_id")
+        params: dict[str, Any] = {}
         if project_id is not None:
             params["project_id"] = project_id
         if status_id is not None:
@@ -40,12 +432,34 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
             params["tracker_id"] = tracker_id
         if sort is not None:
             params["sort"] = sort
-        return await client.get("/issues.json", params=params)
+        mirror = local_mirror()
+        if mirror is not None and (scope := mirror.scope_for(project_id)) is not None:
+            fresh = await mirror.ensure_fresh(client, scope)
+            local = mirror.list_issues(
+                scope, status_id, assigned_to_id, tracker_id, sort,
+                limit=fetch_limit(max_items) if fetch_all or max_items is not None else limit,
+                offset=offset,
+            )
+            if local is not None:
+                result = {**local, "source": "mirror", "stale": not fresh}
+                return shape(result, "issues", fields, compact)
+        if fetch_all or max_items is not None:
+            result = await Paginator(
+                client, "/issues.json", "issues", params,
+                offset=offset, max_items=fetch_limit(max_items),
+            ).collect()
+        else:
+            result = await client.get(
+                "/issues.json", params={"limit": limit, "offset": offset, **params},
+            )
+        return shape(result, "issues", fields, compact)
 
     @mcp.tool()
     async def get_issue(
         issue_id: int,
         include: str | None = None,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """Get detailed information about a specific Redmine issue.
 
@@ -53,11 +467,133 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
             issue_id: The issue id.
             include: Comma-separated list of associations to include:
                      journals, children, attachments, relations, changesets, watchers.
+            fields: Comma-separated fields to return, e.g. "subject,status,journals.notes".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
         """
         params: dict[str, Any] = {}
         if include is not None:
             params["include"] = include
-        return await client.get(f"/issues/{issue_id}.json", params=params)
+        result = await client.get(f"/issues/{issue_id}.json", params=params)
+        return shape(result, "issue", fields, compact)
+
+    @mcp.tool()
+    async def get_issue_journals(
+        issue_id: int,
+        since: str | None = None,
+        limit: int = 25,
+        cursor: int | None = None,
+        notes_only: bool = False,
+        user_id: int | None = None,
+        newest_first: bool = False,
+        fields: str | None = None,
+        compact: bool = False,
+    ) -> dict[str, Any]:
+        """Page through an issue's history (journals) without loading all of it.
+
+        Prefer this over get_issue(include="journals") for long-lived issues. The
+        response is parsed as it streams from Redmine and only the requested
+        window is kept.
+
+        Args:
+            issue_id: The issue id.
+            since: Only journals created at or after this UTC date/time, e.g. "2024-05-01".
+            limit: Maximum journals to return (max 100).
+            cursor: next_cursor from the previous call, to continue after its last journal.
+            notes_only: Only journals with a comment, skipping pure field changes.
+            user_id: Only journals written by this user.
+            newest_first: Return the most recent journals first.
+            fields: Comma-separated fields to return per journal, e.g. "id,notes,user.name".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
+
+        Returns:
+            journals, next_cursor (null when there are no more matches) and scanned
+            (journals read to build this page).
+        """
+        result = await read_journals(
+            client, issue_id,
+            limit=max(1, min(limit, MAX_PAGE_SIZE)),
+            since=since,
+            cursor=cursor,
+            notes_only=notes_only,
+            user_id=user_id,
+            newest_first=newest_first,
+        )
+        return shape(result, "journals", fields, compact)
+
+    @mcp.tool()
+    async def get_issues(
+        issue_ids: list[int],
+        include: str | None = None,
+        fields: str | None = None,
+        compact: bool = False,
+    ) -> dict[str, Any]:
+        """Get many Redmine issues at once.
+
+        Issues are fetched in a few filtered list requests instead of one request
+        per id. Associations that the list endpoint cannot embed (journals,
+        children, watchers, changesets) fall back to concurrent per-issue requests.
+
+        Args:
+            issue_ids: Issue ids to fetch.
+            include: Comma-separated associations, as for get_issue.
+            fields: Comma-separated fields to return per issue, e.g. "id,subject,status.name".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
+
+        Returns:
+            "issues" keyed by id, plus "missing" (not found), "forbidden"
+            (not visible to you) and "errors" for ids that could not be fetched.
+        """
+        result = await fetch_issues_by_ids(client, issue_ids, include)
+        return shape(result, "issues", fields, compact, keyed=True)
+
+    @mcp.tool()
+    async def get_issue_tree(
+        root_id: int,
+        depth: int = 3,
+        fields: str | None = None,
+        relations: bool = False,
+        compact: bool = True,
+    ) -> dict[str, Any]:
+        """Get an issue and its subtasks (and optionally related issues) as a nested tree.
+
+        Use this instead of calling get_issue level by level to understand an
+        epic: every level of the hierarchy is fetched with a few concurrent
+        requests. Each node lists its "children"; issues reached through a
+        relation carry "relation" (e.g. "blocks"). Relations to issues
+        already in the tree appear as "links" instead of being repeated, and
+        those pointing back to an ancestor are reported in "cycles".
+
+        Args:
+            root_id: Issue at the top of the tree.
+            depth: How many levels below the root to walk (default 3).
+            fields: Comma-separated fields per node (default
+                    "id,subject,tracker,status,assigned_to,done_ratio").
+            relations: Also follow issue relations (blocks, relates, ...).
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
+        """
+        tree = await fetch_issue_tree(client, root_id, max(0, depth), relations)
+        shaped = shape(
+            {"issues": {str(k): v for k, v in tree["issues"].items()}},
+            "issues", fields or DEFAULT_TREE_FIELDS, compact, keyed=True,
+        )["issues"]
+
+        def node(iid: int) -> dict[str, Any]:
+            record = dict(shaped[str(iid)])
+            if iid in tree["via"]:
+                record["relation"] = tree["via"][iid]
+            if iid in tree["children"]:
+                record["children"] = [node(child) for child in tree["children"][iid]]
+            if iid in tree["links"]:
+                record["links"] = tree["links"][iid]
+            return record
+
+        return {
+            "tree": node(root_id),
+            "nodes": len(tree["issues"]),
+            "levels": tree["levels"],
+            "cycles": tree["cycles"],
+            "truncated": tree["truncated"],
+        }
 
     @mcp.tool()
     async def search_issues(
@@ -65,15 +601,21 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         project_id: str | None = None,
         limit: int = 25,
         offset: int = 0,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """Search Redmine issues by keyword.
 
         Args:
             query: Search keyword.
-            project_id: Limit search to a project.
+            project_id: Limit search to a project (identifier, id or name).
             limit: Max results.
             offset: Skip results.
+            fields: Comma-separated fields to return per result, e.g. "id,title".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
         """
+        if project_id is not None:
+            project_id = await names.resolve_project(project_id)
         params: dict[str, Any] = {
             "q": query,
             "issues": 1,
@@ -82,7 +624,106 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         }
         if project_id is not None:
             params["project_id"] = project_id
-        return await client.get("/search.json", params=params)
+        mirror = local_mirror()
+        if mirror is not None and (scope := mirror.scope_for(project_id)) is not None:
+            fresh = await mirror.ensure_fresh(client, scope)
+            local = mirror.search(scope, query, limit=limit, offset=offset)
+            result = {**local, "source": "mirror", "stale": not fresh}
+        else:
+            result = await client.get("/search.json", params=params)
+        return shape(result, "results", fields, compact)
+
+    @mcp.tool()
+    async def issue_stats(
+        project_id: str | None = None,
+        group_by: list[str] | None = None,
+        status_id: str | None = None,
+        tracker_id: int | None = None,
+        assigned_to_id: str | None = None,
+        priority_id: int | None = None,
+        status: str | None = None,
+        tracker: str | None = None,
+        assignee: str | None = None,
+        priority: str | None = None,
+        method: str = "auto",
+    ) -> dict[str, Any]:
+        """Count issues grouped by status, tracker, assignee and/or priority.
+
+        Use this instead of listing issues to answer questions such as "how
+        many open bugs per assignee". Returns only the aggregate rows (one per
+        combination with a non-zero count), the total and how it was computed.
+
+        Args:
+            project_id: Limit to a project (identifier, id or name).
+            group_by: Dimensions to group by, any of "status", "tracker",
+                      "assignee", "priority" (default ["status"]).
+            status_id: Filter by status: "open" (default), "closed", "*" or a numeric id.
+            tracker_id: Filter by tracker id.
+            assigned_to_id: Filter by assignee id. Use "me" for current user.
+            priority_id: Filter by priority id.
+            status: Filter by status name (instead of status_id).
+            tracker: Filter by tracker name (instead of tracker_id).
+            assignee: Filter by assignee login or name (instead of assigned_to_id).
+            priority: Filter by priority name (instead of priority_id).
+            method: "facets" counts each group with a limit=1 query, "scan"
+                    reads every issue (up to REDMINE_STATS_SCAN_LIMIT) and
+                    "auto" (default) picks the cheaper one that applies.
+        """
+        params: dict[str, Any] = {
+            "project_id": await names.resolve_project(project_id) if project_id is not None else None,
+            "status_id": await by_name("statuses", status_id, status, "status_id"),
+            "tracker_id": await by_name("trackers", tracker_id, tracker, "tracker_id"),
+            "assigned_to_id": await by_name("users", assigned_to_id, assignee, "assigned_to_id"),
+            "priority_id": await by_name("priorities", priority_id, priority, "priority_id"),
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        return await stats.issue_stats(client, names, params, group_by or ["status"], method)
+
+    @mcp.tool()
+    async def get_changes(
+        project_id: str | None = None,
+        since: str | None = None,
+        cursor: str | None = None,
+        limit: int = 25,
+    ) -> dict[str, Any]:
+        """List issues changed since a point in time, with only what changed.
+
+        Use this to watch a project instead of re-reading issues. Each changed
+        issue comes with its current subject, tracker, status and assignee,
+        the net field changes ("changes", raw old/new values) and the new
+        comments since the previous position; "created" marks new issues.
+        Issues are returned oldest change first. Pass the returned cursor to
+        get the next changes; while "has_more" is true, more are waiting.
+
+        Args:
+            project_id: Project identifier, id or name (all visible projects when omitted).
+            since: Start at this ISO 8601 date or datetime (UTC unless it has an offset).
+            cursor: Continue from a cursor returned earlier.
+            limit: Max issues per call (default 25, max 100). With neither
+                   since nor cursor, the feed continues where the last such
+                   call for the project stopped (or where the first call
+                   with since started it).
+        """
+        key = None
+        if cursor is not None:
+            position = Cursor.decode(cursor)
+        else:
+            project = await names.resolve_project(project_id) if project_id is not None else None
+            found, token = await cursors.get(("changes", project or ALL_PROJECTS))
+            if since is not None:
+                position = Cursor(project, normalize_since(since))
+                if not found:
+                    key = ("changes", project or ALL_PROJECTS)
+            elif found:
+                position = Cursor.decode(token)
+                key = ("changes", project or ALL_PROJECTS)
+            else:
+                raise ValueError("No earlier position for this feed; pass since to start it")
+        result = await fetch_changes(client, position, max(1, min(limit, MAX_PAGE_SIZE)))
+        # One-off reads (an explicit cursor, or since on a running feed) leave the stored position alone.
+        if key is not None:
+            await cursors.set(key, result["cursor"])
+        return result
 
     @mcp.tool()
     async def create_issue(
@@ -97,11 +738,22 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         start_date: str | None = None,
         due_date: str | None = None,
         estimated_hours: float | None = None,
+        tracker: str | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        assignee: str | None = None,
+        uploads: list[dict[str, Any]] | None = None,
+        check_rules: bool = True,
     ) -> dict[str, Any]:
         """Create a new Redmine issue.
 
+        If the project has a TicketRules wiki page, its default values are
+        filled in and the issue is checked against its allowed trackers,
+        required fields and subject formats before anything is sent. A
+        violation raises an error listing everything to fix.
+
         Args:
-            project_id: Project identifier or id (required).
+            project_id: Project identifier, id or name (required).
             subject: Issue subject (required).
             description: Issue description (Textile or Markdown depending on Redmine config).
             tracker_id: Tracker id.
@@ -112,7 +764,25 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
             start_date: Start date (YYYY-MM-DD).
             due_date: Due date (YYYY-MM-DD).
             estimated_hours: Estimated hours.
+            tracker: Tracker name, e.g. "Bug" (instead of tracker_id).
+            status: Status name (instead of status_id).
+            priority: Priority name, e.g. "High" (instead of priority_id).
+            assignee: Assignee login or name (instead of assigned_to_id).
+            uploads: Files to attach: the "upload" objects returned by upload_attachment.
+            check_rules: Validate against the project's TicketRules (default True).
+
+        Names must match exactly or by a unique prefix; the ids they resolved
+        to are returned under "resolved".
         """
+        resolved: dict[str, Any] = {}
+        project = project_id
+        project_id = await names.resolve_project(project, strict=True)
+        if project_id != project:
+            resolved["project_id"] = {"id": project_id, "name": project}
+        tracker_id = await by_name("trackers", tracker_id, tracker, "tracker_id", resolved)
+        status_id = await by_name("statuses", status_id, status, "status_id", resolved)
+        priority_id = await by_name("priorities", priority_id, priority, "priority_id", resolved)
+        assigned_to_id = await by_name("users", assigned_to_id, assignee, "assigned_to_id", resolved)
         issue_data: dict[str, Any] = {
             "project_id": project_id,
             "subject": subject,
@@ -120,12 +790,33 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         for key in (
             "description", "tracker_id", "status_id", "priority_id",
             "assigned_to_id", "parent_issue_id", "start_date", "due_date",
-            "estimated_hours",
+            "estimated_hours", "uploads",
         ):
             val = locals()[key]
             if val is not None:
                 issue_data[key] = val
-        return await client.post("/issues.json", json={"issue": issue_data})
+        if check_rules:
+            try:
+                project_rules = await get_rules(client, rules, project_id)
+            except Exception as e:
+                # Redmine enforces its own constraints; don't block creation on the wiki,
+                # whether it failed, timed out or sits behind an open circuit breaker.
+                logger.warning("Could not load ticket rules for %s: %s", project_id, e)
+                project_rules = None
+            if project_rules is not None:
+                issue_data = project_rules.apply_defaults(issue_data)
+                violations = project_rules.validate(issue_data, CREATE_FIELDS)
+                if violations:
+                    raise ValueError(
+                        f"Issue violates the TicketRules of {project_id}: " + "; ".join(violations)
+                    )
+        result = await client.post("/issues.json", json={"issue": issue_data})
+        mirror = local_mirror()
+        if mirror is not None and "issue" in result:
+            mirror.upsert([result["issue"]])
+        if resolved:
+            result = {**result, "resolved": resolved}
+        return result
 
     @mcp.tool()
     async def update_issue(
@@ -142,6 +833,11 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         due_date: str | None = None,
         estimated_hours: float | None = None,
         done_ratio: int | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        assignee: str | None = None,
+        tracker: str | None = None,
+        uploads: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Update an existing Redmine issue.
 
@@ -159,19 +855,36 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
             due_date: New due date (YYYY-MM-DD).
             estimated_hours: New estimated hours.
             done_ratio: Percentage done (0-100).
+            status: New status name, e.g. "In Progress" (instead of status_id).
+            priority: New priority name (instead of priority_id).
+            assignee: New assignee login or name (instead of assigned_to_id).
+            tracker: New tracker name (instead of tracker_id).
+            uploads: Files to attach: the "upload" objects returned by upload_attachment.
+
+        Names must match exactly or by a unique prefix; the ids they resolved
+        to are returned under "resolved".
         """
+        resolved: dict[str, Any] = {}
+        status_id = await by_name("statuses", status_id, status, "status_id", resolved)
+        priority_id = await by_name("priorities", priority_id, priority, "priority_id", resolved)
+        assigned_to_id = await by_name("users", assigned_to_id, assignee, "assigned_to_id", resolved)
+        tracker_id = await by_name("trackers", tracker_id, tracker, "tracker_id", resolved)
         issue_data: dict[str, Any] = {}
         for key in (
             "subject", "description", "status_id", "priority_id",
             "assigned_to_id", "tracker_id", "notes", "start_date",
-            "due_date", "estimated_hours", "done_ratio",
+            "due_date", "estimated_hours", "done_ratio", "uploads",
         ):
             val = locals()[key]
             if val is not None:
                 issue_data[key] = val
         if private_notes and notes:
             issue_data["private_notes"] = True
-        return await client.put(f"/issues/{issue_id}.json", json={"issue": issue_data})
+        result = await client.put(f"/issues/{issue_id}.json", json={"issue": issue_data})
+        await write_through([issue_id])
+        if resolved:
+            result = {**result, "resolved": resolved}
+        return result
 
     @mcp.tool()
     async def add_comment(
@@ -189,7 +902,86 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         issue_data: dict[str, Any] = {"notes": notes}
         if private_notes:
             issue_data["private_notes"] = True
-        return await client.put(f"/issues/{issue_id}.json", json={"issue": issue_data})
+        result = await client.put(f"/issues/{issue_id}.json", json={"issue": issue_data})
+        await write_through([issue_id])
+        return result
+
+    async def bulk_update(
+        issue_ids: list[int],
+        issue_data: dict[str, Any],
+        max_concurrency: int | None = None,
+        rate_limit: float | None = None,
+    ) -> tuple[list[dict[str, Any]], BulkReport]:
+        executor = BulkExecutor(max_concurrency=max_concurrency, rate_limit=rate_limit)
+        # Bulk writes yield to interactive calls in the request scheduler.
+        with background():
+            report = await executor.run(
+                issue_ids,
+                lambda iid: client.put(f"/issues/{iid}.json", json={"issue": issue_data}),
+            )
+        results = []
+        for outcome in report.outcomes:
+            if outcome.ok:
+                results.append({"id": outcome.item, "status": "ok"})
+            else:
+                results.append({
+                    "id": outcome.item,
+                    "status": "error",
+                    "message": str(outcome.error),
+                })
+        await write_through([o.item for o in report.outcomes if o.ok])
+        return results, report
+
+    async def run_bulk_update(job: Job) -> None:
+        params = job.params
+        # A resumed job skips the issues it already processed.
+        processed = {result["id"] for result in job.results}
+        job.total = len(params["issue_ids"])
+        pending = [iid for iid in params["issue_ids"] if iid not in processed]
+        for chunk in itertools.batched(pending, JOB_CHUNK_SIZE):
+            results, _ = await bulk_update(
+                list(chunk), params["issue_data"], params["max_concurrency"], params["rate_limit"],
+            )
+            job.results.extend(results)
+            job.done = len(job.results)
+            job.failed = sum(1 for result in job.results if result["status"] == "error")
+            jobs.checkpoint(job)
+
+    async def run_export(job: Job) -> None:
+        params = job.params
+        dest = Path(params["path"])
+        partial = dest.with_name(dest.name + ".part")
+        paginator = Paginator(client, "/issues.json", "issues", params["filters"])
+        job.done = 0
+
+        async def flush(f: Any, batch: list[dict[str, Any]]) -> None:
+            if params["include"]:
+                fetched = await fetch_issues_by_ids(client, [i["id"] for i in batch], params["include"])
+                batch = [fetched["issues"].get(str(i["id"]), i) for i in batch]
+            lines = "".join(json.dumps(issue, ensure_ascii=False) + "\n" for issue in batch)
+            await asyncio.to_thread(f.write, lines)
+            job.done += len(batch)
+            job.total = paginator.total_count
+            jobs.checkpoint(job)
+
+        try:
+            with partial.open("w", encoding="utf-8") as f:
+                batch: list[dict[str, Any]] = []
+                async for issue in paginator:
+                    batch.append(issue)
+                    if len(batch) >= JOB_CHUNK_SIZE:
+                        await flush(f, batch)
+                        batch = []
+                if batch:
+                    await flush(f, batch)
+            os.replace(partial, dest)
+        finally:
+            partial.unlink(missing_ok=True)
+        job.total = job.done
+        job.results.append({"path": str(dest), "issues": job.done})
+
+    jobs.register("bulk_update", run_bulk_update)
+    jobs.register("export_issues", run_export)
 
     @mcp.tool()
     async def bulk_update_issues(
@@ -198,8 +990,19 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         priority_id: int | None = None,
         assigned_to_id: int | None = None,
         notes: str | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        assignee: str | None = None,
+        max_concurrency: int | None = None,
+        rate_limit: float | None = None,
+        background: bool = False,
     ) -> dict[str, Any]:
-        """Update multiple Redmine issues at once.
+        """Update (or comment on) multiple Redmine issues at once.
+
+        Updates run concurrently; results are returned in the order of issue_ids
+        together with the total wall time and throughput. For large batches set
+        background to get a job id immediately and follow the job with
+        get_job_status instead of waiting.
 
         Args:
             issue_ids: List of issue ids to update.
@@ -207,7 +1010,21 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
             priority_id: New priority id for all issues.
             assigned_to_id: New assignee for all issues.
             notes: Comment to add to all issues.
+            status: New status name for all issues (instead of status_id).
+            priority: New priority name for all issues (instead of priority_id).
+            assignee: New assignee login or name for all issues (instead of assigned_to_id).
+            max_concurrency: Max updates in flight at once (default from REDMINE_BULK_CONCURRENCY).
+            rate_limit: Max updates started per second (default from REDMINE_BULK_RATE_LIMIT).
+            background: Run as a background job and return its id right away.
+
+        Names must match exactly or by a unique prefix; the ids they resolved
+        to are returned under "resolved".
         """
+        resolved: dict[str, Any] = {}
+        status_id = await by_name("statuses", status_id, status, "status_id", resolved)
+        priority_id = await by_name("priorities", priority_id, priority, "priority_id", resolved)
+        assigned_to_id = await by_name("users", assigned_to_id, assignee, "assigned_to_id", resolved)
+        echo = {"resolved": resolved} if resolved else {}
         issue_data: dict[str, Any] = {}
         if status_id is not None:
             issue_data["status_id"] = status_id
@@ -218,11 +1035,72 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         if notes is not None:
             issue_data["notes"] = notes
 
-        results = []
-        for iid in issue_ids:
-            try:
-                await client.put(f"/issues/{iid}.json", json={"issue": issue_data})
-                results.append({"id": iid, "status": "ok"})
-            except Exception as e:
-                results.append({"id": iid, "status": "error", "message": str(e)})
-        return {"results": results}
+        if background:
+            job = jobs.submit("bulk_update", {
+                "issue_ids": issue_ids,
+                "issue_data": issue_data,
+                "max_concurrency": max_concurrency,
+                "rate_limit": rate_limit,
+            })
+            return {"job_id": job.id, "status": job.status, "total": len(issue_ids), **echo}
+        results, report = await bulk_update(issue_ids, issue_data, max_concurrency, rate_limit)
+        return {"results": results, **report.stats(), **echo}
+
+    @mcp.tool()
+    async def export_issues(
+        project_id: str,
+        path: str,
+        status_id: str = "*",
+        include: str | None = None,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """Export every issue of a project to a local JSON Lines file, as a background job.
+
+        Returns a job id immediately; follow it with get_job_status. Issues
+        are streamed to disk page by page, one JSON object per line, and the
+        file appears under its name only once complete.
+
+        Args:
+            project_id: Project identifier, id or name.
+            path: Destination file (relative to REDMINE_ATTACHMENT_DIR if set).
+            status_id: Status filter (default "*", every issue).
+            include: Comma-separated associations to include, e.g. "journals,attachments".
+            overwrite: Replace an existing file at the destination.
+        """
+        dest = local_path(path)
+        if dest.exists() and not overwrite:
+            raise FileExistsError(f"{dest} already exists (set overwrite to replace it)")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        job = jobs.submit("export_issues", {
+            "path": str(dest),
+            "filters": {"project_id": await names.resolve_project(project_id), "status_id": status_id},
+            "include": include,
+        })
+        return {"job_id": job.id, "status": job.status, "path": str(dest)}
+
+    if mirror is not None:
+        @mcp.tool()
+        async def sync_issue_mirror(
+            project_id: str | None = None,
+            full: bool = False,
+        ) -> dict[str, Any]:
+            """Refresh the local issue mirror from Redmine.
+
+            Normally the mirror syncs itself when it is older than
+            REDMINE_MIRROR_MAX_AGE; use this to force an immediate update.
+
+            Args:
+                project_id: Mirrored project to sync (all mirrored scopes when omitted).
+                full: Re-fetch every issue instead of only those updated since the
+                      last sync; also drops deleted or moved issues.
+            """
+            if local_mirror() is None:
+                raise PermissionError("The issue mirror is synced with the server's own credentials only")
+            scopes = [project_id] if project_id is not None else mirror.scopes
+            results = []
+            for scope in scopes:
+                if scope not in mirror.scopes:
+                    raise ValueError(f"Project {scope!r} is not mirrored")
+                with background():
+                    results.append(await mirror.sync(client, scope, full=full, force=True))
+            return {"results": results}
@@ -0,0 +1,52 @@
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp.jobs import ACTIVE, JobQueue
+
+
+def register(mcp: FastMCP, queue: JobQueue) -> None:
+    """Register background job tools on the MCP server."""
+
+    @mcp.tool()
+    async def get_job_status(
+        job_id: str,
+        results_offset: int = 0,
+        results_limit: int = 100,
+    ) -> dict[str, Any]:
+        """Get the status, progress and (partial) results of a background job.
+
+        Status is one of "queued", "running", "completed", "failed" or
+        "cancelled". "done" of "total" items are processed so far, "failed"
+        of them with an error; results are available while the job runs.
+
+        Args:
+            job_id: The id returned when the job was submitted.
+            results_offset: Skip this many results.
+            results_limit: Max number of results to return.
+        """
+        job = queue.get(job_id)
+        if job is None:
+            raise ValueError(f"No job {job_id!r}")
+        return job.to_dict(results_offset, results_limit)
+
+    @mcp.tool()
+    async def cancel_job(job_id: str) -> dict[str, Any]:
+        """Cancel a queued or running background job.
+
+        Items already processed stay processed; their results remain available
+        from get_job_status. Status is "cancelling" if the job has not stopped
+        yet, e.g. when it runs in another server process and stops at its
+        next checkpoint.
+
+        Args:
+            job_id: The id returned when the job was submitted.
+        """
+        job = await queue.cancel(job_id)
+        status = "cancelling" if job.status in ACTIVE else job.status
+        return {"id": job.id, "status": status, "done": job.done, "total": job.total}
+
+    @mcp.tool()
+    async def list_jobs() -> dict[str, Any]:
+        """List background jobs (newest first) with their status and progress."""
+        return {"jobs": [job.to_dict(results_limit=0) for job in queue.list_jobs()]}
@@ -1,27 +1,80 @@
+import asyncio
+import logging
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from redmine_mcp.cache import TTLCache
 from redmine_mcp.client import RedmineClient
+from redmine_mcp.pagination import Paginator, fetch_limit
 
+logger = logging.getLogger(__name__)
 
-def register(mcp: FastMCP, client: RedmineClient) -> None:
+# Enumerations that rarely change and are served from the reference cache.
+REFERENCE_ENDPOINTS = {
+    "statuses": "/issue_statuses.json",
+    "trackers": "/trackers.json",
+    "priorities": "/enumerations/issue_priorities.json",
+}
+
+
+async def get_reference(client: RedmineClient, cache: TTLCache, name: str) -> dict[str, Any]:
+    """Return a reference enumeration, fetching it only on a cache miss."""
+    path = REFERENCE_ENDPOINTS[name]
+    return await cache.get_or_fetch(("reference", name), lambda: client.get(path))
+
+
+async def warm_up(client: RedmineClient, cache: TTLCache) -> None:
+    """Prefetch all reference enumerations into the cache.
+
+    Failures are logged and otherwise ignored; the tools fetch on demand.
+    """
+    results = await asyncio.gather(
+        *(get_reference(client, cache, name) for name in REFERENCE_ENDPOINTS),
+        return_exceptions=True,
+    )
+    for name, result in zip(REFERENCE_ENDPOINTS, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to prefetch %s: %s", name, result)
+
+
+def register(mcp: FastMCP, client: RedmineClient, cache: TTLCache | None = None) -> None:
     """Register master data reference tools on the MCP server."""
+    cache = cache if cache is not None else TTLCache()
 
     @mcp.tool()
     async def list_statuses() -> dict[str, Any]:
         """List all issue statuses available in Redmine."""
-        return await client.get("/issue_statuses.json")
+        return await get_reference(client, cache, "statuses")
 
     @mcp.tool()
     async def list_trackers() -> dict[str, Any]:
         """List all trackers available in Redmine."""
-        return await client.get("/trackers.json")
+        return await get_reference(client, cache, "trackers")
 
     @mcp.tool()
     async def list_priorities() -> dict[str, Any]:
         """List all issue priorities available in Redmine."""
-        return await client.get("/enumerations/issue_priorities.json")
+        return await get_reference(client, cache, "priorities")
+
+    @mcp.tool()
+    async def clear_reference_cache(
+        namespace: str | None = None,
+    ) -> dict[str, Any]:
+        """Drop cached reference data so the next call refetches it from Redmine.
+
+        Use after statuses, trackers, priorities or project settings were changed
+        in Redmine.
+
+        Args:
+            namespace: Only clear "reference" (enumerations) or "project" entries.
+                       Clears everything when omitted.
+        """
+        cleared = await cache.invalidate(namespace)
+        if client.http_cache is not None:
+            # Stored responses are still revalidated, so they can stay.
+            await asyncio.to_thread(client.http_cache.expire)
+        return {"cleared": cleared, **cache.stats()}
 
     @mcp.tool()
     async def list_users(
@@ -29,6 +82,8 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         name: str | None = None,
         limit: int = 25,
         offset: int = 0,
+        fetch_all: bool = False,
+        max_items: int | None = None,
     ) -> dict[str, Any]:
         """List Redmine users (requires admin privileges).
 
@@ -37,10 +92,17 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
             name: Filter by name or login (partial match).
             limit: Max number of users to return.
             offset: Number of users to skip.
+            fetch_all: Return every matching user starting at offset, fetching pages concurrently.
+            max_items: Return up to this many users, fetching as many pages as needed.
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        params: dict[str, Any] = {}
         if status is not None:
             params["status"] = status
         if name is not None:
             params["name"] = name
-        return await client.get("/users.json", params=params)
+        if fetch_all or max_items is not None:
+            return await Paginator(
+                client, "/users.json", "users", params,
+                offset=offset, max_items=fetch_limit(max_items),
+            ).collect()
+        return await client.get("/users.json", params={"limit": limit, "offset": offset, **params})
@@ -2,37 +2,66 @@ from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from redmine_mcp.cache import TTLCache
 from redmine_mcp.client import RedmineClient
+from redmine_mcp.pagination import Paginator, fetch_limit
+from redmine_mcp.projection import shape
 
 
-def register(mcp: FastMCP, client: RedmineClient) -> None:
+def register(mcp: FastMCP, client: RedmineClient, cache: TTLCache | None = None) -> None:
     """Register project-related tools on the MCP server."""
+    cache = cache if cache is not None else TTLCache()
 
     @mcp.tool()
     async def list_projects(
         limit: int = 25,
         offset: int = 0,
+        fetch_all: bool = False,
+        max_items: int | None = None,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """List all accessible Redmine projects.
 
         Args:
             limit: Max number of projects to return.
             offset: Number of projects to skip.
+            fetch_all: Return every project starting at offset, fetching pages concurrently.
+            max_items: Return up to this many projects, fetching as many pages as needed.
+            fields: Comma-separated fields to return per project, e.g. "id,identifier,name".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
         """
-        return await client.get("/projects.json", params={"limit": limit, "offset": offset})
+        if fetch_all or max_items is not None:
+            result = await Paginator(
+                client, "/projects.json", "projects",
+                offset=offset, max_items=fetch_limit(max_items),
+            ).collect()
+        else:
+            result = await client.get("/projects.json", params={"limit": limit, "offset": offset})
+        return shape(result, "projects", fields, compact)
 
     @mcp.tool()
     async def get_project(
         project_id: str,
         include: str | None = None,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """Get detailed information about a Redmine project.
 
+        Results are cached; use clear_reference_cache after changing project settings.
+
         Args:
             project_id: Project identifier or numeric id.
             include: Comma-separated associations: trackers, issue_categories, enabled_modules, time_entry_activities.
+            fields: Comma-separated fields to return, e.g. "id,name,trackers".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
         """
         params: dict[str, Any] = {}
         if include is not None:
             params["include"] = include
-        return await client.get(f"/projects/{project_id}.json", params=params)
+        result = await cache.get_or_fetch(
+            ("project", project_id, include),
+            lambda: client.get(f"/projects/{project_id}.json", params=params),
+        )
+        return shape(result, "project", fields, compact)
@@ -2,39 +2,93 @@ from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from redmine_mcp.cache import TTLCache
 from redmine_mcp.client import RedmineClient
+from redmine_mcp.projection import shape
+from redmine_mcp.rules import TICKET_RULES_PAGE, remember, rules_cache
+from redmine_mcp.wikisearch import WikiSearch
 
-TICKET_RULES_PAGE = "TicketRules"
 
+def register(
+    mcp: FastMCP,
+    client: RedmineClient,
+    rules: TTLCache | None = None,
+    search: WikiSearch | None = None,
+) -> None:
+    """Register wiki-related tools on the MCP server.
 
-def register(mcp: FastMCP, client: RedmineClient) -> None:
-    """Register wiki-related tools on the MCP server."""
+    ``rules`` caches parsed TicketRules pages and should be the cache that
+    ``issues.register`` validates new issues against. ``search`` holds the
+    full-text indexes of the project wikis.
+    """
+    rules = rules if rules is not None else rules_cache()
+    search = search if search is not None else WikiSearch()
 
     @mcp.tool()
     async def list_wiki_pages(
         project_id: str,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """List all wiki pages in a Redmine project.
 
         Args:
             project_id: Project identifier or numeric id.
+            fields: Comma-separated fields to return per page, e.g. "title,updated_on".
+            compact: Drop empty values and flatten {id, name} references.
         """
-        return await client.get(f"/projects/{project_id}/wiki/index.json")
+        result = await client.get(f"/projects/{project_id}/wiki/index.json")
+        return shape(result, "wiki_pages", fields, compact)
 
     @mcp.tool()
     async def get_wiki_page(
         project_id: str,
         title: str,
+        fields: str | None = None,
+        compact: bool = False,
     ) -> dict[str, Any]:
         """Get the content of a specific wiki page.
 
         Args:
             project_id: Project identifier or numeric id.
             title: Wiki page title (e.g. "Wiki", "TicketRules").
+            fields: Comma-separated fields to return, e.g. "title,version,updated_on".
+            compact: Drop empty values, flatten {id, name} references and truncate long text.
         """
-        return await client.get(
+        result = await client.get(
             f"/projects/{project_id}/wiki/{title}.json",
         )
+        return shape(result, "wiki_page", fields, compact)
+
+    @mcp.tool()
+    async def search_wiki(
+        project_id: str,
+        query: str,
+        limit: int = 10,
+    ) -> dict[str, Any]:
+        """Full-text search over the wiki pages of a project.
+
+        Use this to find a page (e.g. a spec) instead of fetching pages one by
+        one. Results are ranked by relevance (BM25) and come with a snippet
+        around the match; fetch a page with get_wiki_page to read it in full.
+        Japanese queries match anywhere in the text, without word boundaries.
+        Pages that could not be read (e.g. protected ones) are listed under
+        "pages_failed".
+
+        Args:
+            project_id: Project identifier or numeric id.
+            query: Words to search for.
+            limit: Max pages to return (default 10).
+        """
+        index, refresh = await search.index(client, project_id)
+        result = {
+            "results": index.search(query, max(1, limit)),
+            "pages_indexed": len(index.pages),
+            "pages_fetched": refresh["fetched"],
+        }
+        if refresh["failed"]:
+            result["pages_failed"] = refresh["failed"]
+        return result
 
     @mcp.tool()
     async def get_ticket_rules(
@@ -50,9 +104,15 @@ def register(mcp: FastMCP, client: RedmineClient) -> None:
         If the page does not exist, a 404 error is returned — meaning the
         project has no specific ticket creation rules.
 
+        Besides the raw page, "rules" holds the page parsed into trackers,
+        required_fields, subject_formats, templates, defaults, parent_rules
+        and notes. Calling this also refreshes the rules create_issue checks.
+
         Args:
             project_id: Project identifier or numeric id.
         """
-        return await client.get(
+        result = await client.get(
             f"/projects/{project_id}/wiki/{TICKET_RULES_PAGE}.json",
         )
+        parsed = await remember(rules, project_id, result["wiki_page"])
+        return {**result, "rules": parsed.to_dict()}
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import math
+import re
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.config import env_float, env_int
+from redmine_mcp.executor import BulkExecutor
+from redmine_mcp.tenancy import cache_scope
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_INTERVAL = 60.0
+DEFAULT_MAX_INDEXES = 32
+# BM25 parameters (the usual defaults).
+K1 = 1.2
+B = 0.75
+# Title terms count as this many occurrences in the body.
+TITLE_WEIGHT = 3
+SNIPPET_CHARS = 160
+
+# Kana, CJK unified ideographs (and extension A) and compatibility ideographs.
+_CJK = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKENS = re.compile(rf"([{_CJK}]+)|([^\W{_CJK}]+)")
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    """Terms of ``text``: words for alphabetic scripts, character bigrams for CJK.
+
+    Japanese has no spaces between words, so runs of kana and kanji are
+    indexed as overlapping pairs of characters; a query matches wherever its
+    own bigrams occur, whatever the word boundaries. A lone CJK character is
+    kept as a term of its own.
+    """
+    terms: list[str] = []
+    for cjk, word in _TOKENS.findall(normalize(text)):
+        if word:
+            terms.append(word)
+        elif len(cjk) == 1:
+            terms.append(cjk)
+        else:
+            terms.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+    return terms
+
+
+@dataclass
+class Page:
+    title: str
+    version: int | None
+    updated_on: str | None
+    text: str
+    terms: Counter
+    length: int
+
+
+@dataclass
+class WikiIndex:
+    """Inverted index of one project's wiki pages, ranked with BM25."""
+
+    pages: dict[str, Page] = field(default_factory=dict)
+    postings: dict[str, dict[str, int]] = field(default_factory=dict)
+    total_length: int = 0
+    checked_at: float | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def add(self, page: dict[str, Any]) -> None:
+        title = page["title"]
+        self.remove(title)
+        text = page.get("text") or ""
+        terms = Counter(tokenize(text))
+        for term in tokenize(title.replace("_", " ")):
+            terms[term] += TITLE_WEIGHT
+        length = sum(terms.values())
+        self.pages[title] = Page(title, page.get("version"), page.get("updated_on"), text, terms, length)
+        self.total_length += length
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[title] = tf
+
+    def remove(self, title: str) -> None:
+        page = self.pages.pop(title, None)
+        if page is None:
+            return
+        self.total_length -= page.length
+        for term in page.terms:
+            postings = self.postings[term]
+            del postings[title]
+            if not postings:
+                del self.postings[term]
+
+    def stale(self, listed: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
+        """Titles to (re)fetch and titles to drop, given the current page list."""
+        current = {p["title"]: p for p in listed}
+        changed = [
+            title for title, p in current.items()
+            if title not in self.pages
+            or (self.pages[title].version, self.pages[title].updated_on) != (p.get("version"), p.get("updated_on"))
+        ]
+        removed = [title for title in self.pages if title not in current]
+        return changed, removed
+
+    def search(self, query: str, limit: int) -> list[dict[str, Any]]:
+        terms = set(tokenize(query))
+        n = len(self.pages)
+        if not terms or not n:
+            return []
+        average = self.total_length / n
+        scores: Counter = Counter()
+        idf: dict[str, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf[term] = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for title, tf in postings.items():
+                length = self.pages[title].length
+                scores[title] += idf[term] * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average))
+        results = []
+        for title, score in scores.most_common(limit):
+            page = self.pages[title]
+            results.append({
+                "title": title,
+                "score": round(score, 4),
+                "snippet": snippet(page.text, sorted(idf, key=lambda t: -idf[t])),
+                "version": page.version,
+                "updated_on": page.updated_on,
+            })
+        return results
+
+
+def snippet(text: str, terms: list[str]) -> str:
+    """About SNIPPET_CHARS characters of ``text`` around the first of ``terms`` it contains."""
+    normalized = unicodedata.normalize("NFKC", text)
+    lowered = normalized.lower()
+    if len(lowered) != len(normalized):
+        normalized = lowered
+    at = next((i for i in (lowered.find(t) for t in terms) if i >= 0), 0)
+    start = max(0, at - SNIPPET_CHARS // 3)
+    end = min(len(normalized), start + SNIPPET_CHARS)
+    text = " ".join(normalized[start:end].split())
+    return ("…" if start > 0 else "") + text + ("…" if end < len(normalized) else "")
+
+
+class WikiSearch:
+    """Wiki indexes by project (and credentials), kept up to date incrementally.
+
+    Before a search, the project's page list is read (at most every
+    REDMINE_WIKI_INDEX_CHECK seconds) and only pages whose version or
+    ``updated_on`` changed are fetched again, concurrently; deleted pages
+    are dropped from the index. A page that cannot be fetched does not fail
+    the search: it is reported, dropped if it is gone or no longer visible
+    (404/403) and otherwise kept at its old version until the next check.
+
+    Indexes hold the text of every page, so at most ``max_indexes`` are
+    kept; beyond that the least recently searched one not being refreshed
+    is dropped (and rebuilt if searched again).
+    """
+
+    def __init__(self, check_interval: float | None = None, max_indexes: int | None = None):
+        self.check_interval = check_interval if check_interval is not None else env_float(
+            "REDMINE_WIKI_INDEX_CHECK", DEFAULT_CHECK_INTERVAL,
+        )
+        self.max_indexes = max_indexes or env_int("REDMINE_WIKI_INDEX_MAX", DEFAULT_MAX_INDEXES)
+        self._indexes: OrderedDict[tuple[str | None, str], WikiIndex] = OrderedDict()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def _get(self, key: tuple[str | None, str]) -> WikiIndex:
+        index = self._indexes.get(key)
+        if index is not None:
+            self._indexes.move_to_end(key)
+            return index
+        index = self._indexes[key] = WikiIndex()
+        for old in list(self._indexes):
+            if len(self._indexes) <= self.max_indexes:
+                break
+            if old != key and not self._indexes[old].lock.locked():
+                del self._indexes[old]
+                self.evicted += 1
+        return index
+
+    async def index(self, client: RedmineClient, project_id: str) -> tuple[WikiIndex, dict[str, Any]]:
+        """The project's index, refreshed if due, and what the refresh did."""
+        index = self._get((cache_scope(), project_id))
+        async with index.lock:
+            if index.checked_at is not None and time.monotonic() - index.checked_at < self.check_interval:
+                return index, {"fetched": 0, "removed": 0, "failed": []}
+            listed = (await client.get(f"/projects/{project_id}/wiki/index.json"))["wiki_pages"]
+            changed, removed = index.stale(listed)
+            report = await BulkExecutor().run(
+                changed, lambda title: client.get(f"/projects/{project_id}/wiki/{title}.json"),
+            )
+            failed = []
+            for outcome in report.outcomes:
+                if outcome.ok:
+                    index.add(outcome.result["wiki_page"])
+                    continue
+                logger.warning("Could not index wiki page %s of %s: %s", outcome.item, project_id, outcome.error)
+                failed.append({"title": outcome.item, "error": str(outcome.error)})
+                error = outcome.error
+                if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in (403, 404):
+                    removed.append(outcome.item)
+            for title in removed:
+                index.remove(title)
+            index.checked_at = time.monotonic()
+            return index, {"fetched": len(changed) - len(failed), "removed": len(removed), "failed": failed}
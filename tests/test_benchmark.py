@@ -0,0 +1,27 @@
+import argparse
+
+from benchmarks.run import compare, main
+
+
+async def test_benchmark_runs_scenarios_against_fake_redmine():
+    args = argparse.Namespace(
+        scenarios="get_issue,list_statuses", concurrency="1,4", calls=8,
+        latency=0.0, payload=50, http=False,
+    )
+    results = await main(args)
+    assert set(results) == {"get_issue", "list_statuses"}
+    for levels in results.values():
+        assert set(levels) == {"1", "4"}
+        for r in levels.values():
+            assert r["errors"] == 0
+            assert r["p99_ms"] >= r["p50_ms"] > 0
+            assert r["calls_per_second"] > 0
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"get_issue": {"8": {"p99_ms": 100.0, "calls_per_second": 500.0}}}
+    ok = {"get_issue": {"8": {"p99_ms": 115.0, "calls_per_second": 450.0}}}
+    slow = {"get_issue": {"8": {"p99_ms": 130.0, "calls_per_second": 350.0}}}
+    assert compare(ok, baseline, 0.2) == []
+    assert len(compare(slow, baseline, 0.2)) == 2
+    assert compare({"new": {"1": {"p99_ms": 1, "calls_per_second": 1}}}, baseline, 0.2) == []
@@ -0,0 +1,73 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from redmine_mcp.cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_caches_value():
+    cache = TTLCache(ttl=60)
+    fetch = AsyncMock(return_value={"trackers": []})
+
+    assert await cache.get_or_fetch(("reference", "trackers"), fetch) == {"trackers": []}
+    assert await cache.get_or_fetch(("reference", "trackers"), fetch) == {"trackers": []}
+
+    fetch.assert_awaited_once()
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+@pytest.mark.asyncio
+async def test_entries_expire():
+    cache = TTLCache(ttl=10)
+    with patch("redmine_mcp.cache.time.monotonic", return_value=100.0):
+        await cache.set(("reference", "statuses"), 1)
+    with patch("redmine_mcp.cache.time.monotonic", return_value=111.0):
+        assert await cache.get(("reference", "statuses")) == (False, None)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch():
+    cache = TTLCache(ttl=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(cache.get_or_fetch(("k",), fetch) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = TTLCache(ttl=60)
+    fetch = AsyncMock(side_effect=[RuntimeError("down"), "ok"])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch(("k",), fetch)
+    assert await cache.get_or_fetch(("k",), fetch) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_namespace():
+    cache = TTLCache(ttl=60)
+    await cache.set(("reference", "statuses"), 1)
+    await cache.set(("project", "a", None), 2)
+
+    assert await cache.invalidate("project") == 1
+    assert await cache.get(("reference", "statuses")) == (True, 1)
+    assert await cache.invalidate() == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_caching():
+    cache = TTLCache(ttl=0)
+    await cache.set(("k",), 1)
+    assert len(cache) == 0
@@ -0,0 +1,100 @@
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.changes import Cursor, fetch_changes, normalize_since
+from redmine_mcp.tools import issues
+
+
+class FakeRedmine:
+    def __init__(self):
+        self.issues = {}
+        self.requests = []
+
+    def add(self, iid, at, journals=(), created=None):
+        issue = self.issues.setdefault(iid, {
+            "id": iid, "subject": f"Issue {iid}", "status": {"id": 1, "name": "New"},
+            "created_on": created or at, "journals": [],
+        })
+        issue["updated_on"] = at
+        issue["journals"].extend(journals)
+
+    async def get(self, path, params=None):
+        self.requests.append((path, params))
+        if path != "/issues.json":
+            return {"issue": self.issues[int(path.split("/")[2].split(".")[0])]}
+        since = params["updated_on"].removeprefix(">=")
+        found = sorted(
+            ({k: v for k, v in i.items() if k != "journals"} for i in self.issues.values() if i["updated_on"] >= since),
+            key=lambda i: (i["updated_on"], i["id"]),
+        )
+        return {"issues": found[params["offset"]:params["offset"] + params["limit"]], "total_count": len(found)}
+
+
+def _journal(jid, at, notes="", **changes):
+    details = [{"property": "attr", "name": k, "old_value": o, "new_value": n} for k, (o, n) in changes.items()]
+    return {"id": jid, "created_on": at, "notes": notes, "user": {"name": "Sato"}, "details": details}
+
+
+def test_normalize_since():
+    assert normalize_since("2024-05-01") == "2024-05-01T00:00:00Z"
+    assert normalize_since("2024-05-01T09:00:00+09:00") == "2024-05-01T00:00:00Z"
+    with pytest.raises(ValueError):
+        normalize_since("yesterday")
+    with pytest.raises(ValueError):
+        Cursor.decode("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_feed_returns_only_the_delta():
+    redmine = FakeRedmine()
+    redmine.add(1, "2024-05-01T09:00:00Z", created="2024-04-01T00:00:00Z", journals=[
+        _journal(10, "2024-04-02T00:00:00Z", "old comment"),
+        _journal(11, "2024-05-01T08:00:00Z", "", status_id=("1", "2")),
+        _journal(12, "2024-05-01T09:00:00Z", "done", status_id=("2", "3"), priority_id=("4", "4")),
+    ])
+    redmine.add(2, "2024-05-01T09:00:00Z")
+    redmine.add(3, "2024-05-01T10:00:00Z")
+
+    first = await fetch_changes(redmine, Cursor("p", "2024-05-01T00:00:00Z"), limit=2)
+    assert [c["id"] for c in first["changes"]] == [1, 2]
+    one = first["changes"][0]
+    assert one["changes"] == {"status_id": {"old": "1", "new": "3"}}
+    assert [j["notes"] for j in one["journals"]] == ["done"]
+    assert not one["created"] and first["changes"][1]["created"]
+    # Issue 2 was never updated after its creation: no journal request.
+    assert ("/issues/2.json", {"include": "journals"}) not in redmine.requests
+    assert first["has_more"]
+
+    second = await fetch_changes(redmine, Cursor.decode(first["cursor"]), limit=2)
+    assert [c["id"] for c in second["changes"]] == [3]
+    assert not second["has_more"]
+
+    # Issue 1 changes again: only the new comment comes back.
+    redmine.add(1, "2024-05-02T00:00:00Z", journals=[_journal(13, "2024-05-02T00:00:00Z", "reopened")])
+    third = await fetch_changes(redmine, Cursor.decode(second["cursor"]), limit=2)
+    assert [(c["id"], [j["notes"] for j in c["journals"]]) for c in third["changes"]] == [(1, ["reopened"])]
+    empty = await fetch_changes(redmine, Cursor.decode(third["cursor"]), limit=2)
+    assert empty["changes"] == [] and empty["cursor"] == third["cursor"]
+
+
+@pytest.mark.asyncio
+async def test_tool_resumes_from_the_stored_cursor():
+    redmine = FakeRedmine()
+    redmine.add(1, "2024-05-01T09:00:00Z")
+    server = FastMCP("test")
+    issues.register(server, redmine, cursors=TTLCache(ttl=60))
+    get_changes = server._tool_manager._tools["get_changes"].fn
+
+    with pytest.raises(ValueError):
+        await get_changes(project_id="p")
+    first = await get_changes(project_id="p", since="2024-05-01")
+    assert [c["id"] for c in first["changes"]] == [1]
+
+    redmine.add(2, "2024-05-01T10:00:00Z")
+    # One-off reads do not move the stored position.
+    await get_changes(project_id="p", since="2024-05-01")
+    await get_changes(cursor=first["cursor"])
+    resumed = await get_changes(project_id="p")
+    assert [c["id"] for c in resumed["changes"]] == [2]
+    assert (await get_changes(project_id="p"))["changes"] == []
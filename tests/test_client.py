@@ -23,14 +23,14 @@ def _mock_response(status_code=200, json_data=None):
 async def test_get(client):
     mock_resp = _mock_response(json_data={"issues": []})
     with patch("httpx.AsyncClient") as MockClient:
-        instance = AsyncMock()
-        instance.get.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=instance)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        instance = MockClient.return_value
+        instance.is_closed = False
+        instance.request = AsyncMock(return_value=mock_resp)
 
         result = await client.get("/issues.json", params={"limit": 10})
 
-        instance.get.assert_called_once_with(
+        instance.request.assert_called_once_with(
+            "GET",
             "https://redmine.example.com/issues.json",
             headers=client._headers,
             params={"limit": 10},
@@ -42,14 +42,13 @@ async def test_get(client):
 async def test_post(client):
     mock_resp = _mock_response(status_code=201, json_data={"issue": {"id": 1}})
     with patch("httpx.AsyncClient") as MockClient:
-        instance = AsyncMock()
-        instance.post.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=instance)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        instance = MockClient.return_value
+        instance.is_closed = False
+        instance.request = AsyncMock(return_value=mock_resp)
 
         result = await client.post("/issues.json", json={"issue": {"subject": "Test"}})
 
-        instance.post.assert_called_once()
+        instance.request.assert_called_once()
         assert result == {"issue": {"id": 1}}
 
 
@@ -57,14 +56,13 @@ async def test_post(client):
 async def test_put(client):
     mock_resp = _mock_response(status_code=204)
     with patch("httpx.AsyncClient") as MockClient:
-        instance = AsyncMock()
-        instance.put.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=instance)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        instance = MockClient.return_value
+        instance.is_closed = False
+        instance.request = AsyncMock(return_value=mock_resp)
 
         result = await client.put("/issues/1.json", json={"issue": {"status_id": 2}})
 
-        instance.put.assert_called_once()
+        instance.request.assert_called_once()
         assert result == {}
 
 
@@ -72,14 +70,13 @@ async def test_put(client):
 async def test_delete(client):
     mock_resp = _mock_response(status_code=200)
     with patch("httpx.AsyncClient") as MockClient:
-        instance = AsyncMock()
-        instance.delete.return_value = mock_resp
-        MockClient.return_value.__aenter__ = AsyncMock(return_value=instance)
-        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        instance = MockClient.return_value
+        instance.is_closed = False
+        instance.request = AsyncMock(return_value=mock_resp)
 
         result = await client.delete("/issues/1.json")
 
-        instance.delete.assert_called_once()
+        instance.request.assert_called_once()
         assert result == {}
 
 
@@ -91,3 +88,211 @@ def test_headers(client):
 def test_base_url_trailing_slash():
     c = RedmineClient(url="https://redmine.example.com/", api_key="key")
     assert c.base_url == "https://redmine.example.com"
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_is_reused(client):
+    mock_resp = _mock_response(json_data={})
+    with patch("httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.is_closed = False
+        instance.request = AsyncMock(return_value=mock_resp)
+        instance.aclose = AsyncMock()
+
+        async with client:
+            await client.get("/issues/1.json")
+            await client.put("/issues/1.json", json={"issue": {}})
+
+        MockClient.assert_called_once()
+        assert instance.request.await_count == 2
+        instance.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_nested_contexts_keep_pool_open(client):
+    with patch("httpx.AsyncClient") as MockClient:
+        instance = MockClient.return_value
+        instance.is_closed = False
+        instance.aclose = AsyncMock()
+
+        async with client:
+            async with client:
+                pass
+            instance.aclose.assert_not_awaited()
+        instance.aclose.assert_awaited_once()
+
+
+def test_pool_settings():
+    c = RedmineClient(
+        url="https://redmine.example.com",
+        api_key="key",
+        timeout=5.0,
+        max_connections=4,
+        max_keepalive_connections=2,
+    )
+    assert c.timeout == 5.0
+    assert c.limits.max_connections == 4
+    assert c.limits.max_keepalive_connections == 2
+    assert c.http2 is False
+
+
+def _transport_client(handler, **kwargs):
+    return RedmineClient(
+        url="https://redmine.example.com",
+        api_key="key",
+        transport=httpx.MockTransport(handler),
+        retry_backoff=0,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_errors():
+    statuses = iter([502, 503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    c = _transport_client(handler, retries=3)
+    assert await c.get("/issues.json") == {"ok": True}
+    assert c.stats()["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_put_is_not_retried_after_bad_gateway():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(502)
+
+    c = _transport_client(handler, retries=3)
+    with pytest.raises(httpx.HTTPStatusError):
+        await c.put("/issues/1.json", json={"issue": {"notes": "hi"}})
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored():
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(204)])
+
+    c = _transport_client(lambda request: next(responses), retries=1)
+    assert await c.put("/issues/1.json", json={"issue": {}}) == {}
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast(monkeypatch):
+    from redmine_mcp.resilience import CircuitOpenError
+
+    monkeypatch.setenv("REDMINE_BREAKER_THRESHOLD", "2")
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    c = _transport_client(handler, retries=0)
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await c.get("/issues.json")
+    with pytest.raises(CircuitOpenError):
+        await c.get("/issues.json")
+
+    assert calls == 2
+    breaker = c.stats()["breakers"]["redmine.example.com"]
+    assert breaker["state"] == "open"
+    assert breaker["rejections"] == 1
+
+
+def test_circuit_breaker_half_open_probe(monkeypatch):
+    from redmine_mcp.resilience import CircuitBreaker, CircuitOpenError
+
+    breaker = CircuitBreaker("h", failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    monkeypatch.setattr("redmine_mcp.resilience.time.monotonic", lambda: breaker.opened_at + 11)
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_are_coalesced():
+    import asyncio
+
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"issue": {"id": 1}})
+
+    c = _transport_client(handler)
+    results = await asyncio.gather(
+        c.get("/issues/1.json", params={"include": "journals"}),
+        c.get("/issues/1.json", params={"include": "journals"}),
+        c.get("/issues/1.json", params={"include": "children"}),
+    )
+
+    assert calls == 2
+    assert results[0] == results[1]
+    assert results[0] is not results[1]
+    assert c.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_gets_share_errors():
+    import asyncio
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(404)
+
+    c = _transport_client(handler)
+    results = await asyncio.gather(
+        c.get("/issues/9.json"), c.get("/issues/9.json"), return_exceptions=True,
+    )
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_gets_with_different_api_keys_are_not_coalesced():
+    import asyncio
+
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={})
+
+    transport = httpx.MockTransport(handler)
+    a = RedmineClient(url="https://redmine.example.com", api_key="a", transport=transport)
+    b = RedmineClient(url="https://redmine.example.com", api_key="b", transport=transport)
+    b._flight = a._flight
+    await asyncio.gather(a.get("/issues/1.json"), b.get("/issues/1.json"))
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_credentials_are_read_on_first_use(monkeypatch):
+    monkeypatch.delenv("REDMINE_URL", raising=False)
+    monkeypatch.delenv("REDMINE_API_KEY", raising=False)
+    client = RedmineClient()
+
+    with pytest.raises(RuntimeError, match="is not set"):
+        await client.get("/issues.json")
+
+    monkeypatch.setenv("REDMINE_URL", "https://redmine.example.com/")
+    monkeypatch.setenv("REDMINE_API_KEY", "late-key")
+    assert client.base_url == "https://redmine.example.com"
+    assert client._headers["X-Redmine-API-Key"] == "late-key"
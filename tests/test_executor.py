@@ -0,0 +1,73 @@
+import asyncio
+
+import httpx
+import pytest
+
+from redmine_mcp.executor import BulkExecutor, RateLimiter
+
+
+def _status_error(status_code):
+    request = httpx.Request("PUT", "https://redmine.example.com/issues/1.json")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request),
+    )
+
+
+@pytest.mark.asyncio
+async def test_results_keep_input_order():
+    async def func(item):
+        await asyncio.sleep(0.01 * (5 - item))
+        return item * 10
+
+    report = await BulkExecutor(max_concurrency=5).run([1, 2, 3, 4], func)
+
+    assert [o.item for o in report.outcomes] == [1, 2, 3, 4]
+    assert [o.result for o in report.outcomes] == [10, 20, 30, 40]
+    assert report.succeeded == 4
+    assert report.stats()["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    in_flight = 0
+    peak = 0
+
+    async def func(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await BulkExecutor(max_concurrency=3).run(range(10), func)
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_without_retrying():
+    calls = {}
+
+    async def func(item):
+        calls[item] = calls.get(item, 0) + 1
+        if item == 2:
+            raise _status_error(503)
+        return item
+
+    report = await BulkExecutor().run([1, 2, 3], func)
+
+    # Retrying is left to RedmineClient, which knows whether a repeat is safe.
+    assert calls == {1: 1, 2: 1, 3: 1}
+    assert [o.ok for o in report.outcomes] == [True, False, True]
+    assert report.outcomes[1].error.response.status_code == 503
+    assert report.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_acquisitions():
+    limiter = RateLimiter(rate=50)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(5):
+        await limiter.acquire()
+    assert loop.time() - started >= 0.07
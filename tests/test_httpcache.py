@@ -0,0 +1,84 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.httpcache import HttpCache
+
+
+def _server(pages):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        body = pages[request.url.path]
+        etag = f'W/"{hash(body)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=body, headers={"ETag": etag})
+
+    return handler, requests
+
+
+def _client(handler, cache, api_key="k"):
+    return RedmineClient(
+        url="https://redmine.example.com", api_key=api_key, retries=0,
+        transport=httpx.MockTransport(handler), http_cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_responses_are_revalidated_across_processes(tmp_path):
+    pages = {"/wiki.json": b'{"page": "v1"}'}
+    handler, requests = _server(pages)
+    path = str(tmp_path / "http.db")
+
+    # Each client stands in for a new stdio process on the same file.
+    assert await _client(handler, HttpCache(path)).get("/wiki.json") == {"page": "v1"}
+    cache = HttpCache(path)
+    assert await _client(handler, cache).get("/wiki.json") == {"page": "v1"}
+    assert "If-None-Match" in requests[1].headers
+    assert cache.stats()["revalidated"] == 1
+
+    pages["/wiki.json"] = b'{"page": "v2"}'
+    assert await _client(handler, cache).get("/wiki.json") == {"page": "v2"}
+    assert cache.stats()["misses"] == 1
+
+    # Other credentials never reuse these entries.
+    await _client(handler, cache, api_key="other").get("/wiki.json")
+    assert "If-None-Match" not in requests[-1].headers
+
+
+@pytest.mark.asyncio
+async def test_fresh_entries_skip_the_request_until_a_write(tmp_path):
+    handler, requests = _server({"/issues/1.json": b'{"issue": {"id": 1}}'})
+    client = _client(handler, HttpCache(str(tmp_path / "http.db"), max_age=60))
+
+    first, second = await asyncio.gather(client.get("/issues/1.json"), client.get("/issues/1.json"))
+    await client.get("/issues/1.json")
+    assert first == second == {"issue": {"id": 1}}
+    assert first is not second
+    assert len(requests) == 1
+    assert client.stats()["http_cache"]["hits"] == 1
+
+    client.http_cache.expire()
+    await client.get("/issues/1.json")
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"]
+
+
+def test_lru_eviction_keeps_the_size_cap(tmp_path):
+    cache = HttpCache(str(tmp_path / "http.db"), max_bytes=3000)
+    body = os.urandom(1024)
+    for i in range(10):
+        cache.store(f"k{i}", body, etag=f'"{i}"', last_modified=None)
+    stats = cache.stats()
+    assert stats["bytes"] <= 3000
+    assert cache.lookup("k9") is not None
+    assert cache.lookup("k0") is None
+
+    # Nothing to revalidate with and no freshness: not worth storing.
+    cache.store("plain", body, etag=None, last_modified=None)
+    assert cache.lookup("plain") is None
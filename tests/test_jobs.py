@@ -0,0 +1,160 @@
+import asyncio
+import json
+import sqlite3
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp import jobs as jobs_module
+from redmine_mcp.jobs import JobCancelled, JobQueue
+from redmine_mcp.tools import issues
+from redmine_mcp.tools import jobs as job_tools
+
+
+async def _wait(queue, job_id, status="completed"):
+    for _ in range(200):
+        job = queue.get(job_id)
+        if job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} is {queue.get(job_id).status}, not {status}")
+
+
+@pytest.mark.asyncio
+async def test_job_reports_progress_and_partial_results():
+    queue = JobQueue(max_workers=1)
+    release = asyncio.Event()
+
+    async def runner(job):
+        job.total = 4
+        for i in range(4):
+            if i == 2:
+                await release.wait()
+            job.results.append(i)
+            job.done += 1
+            queue.checkpoint(job)
+
+    queue.register("count", runner)
+    job = queue.submit("count", {})
+    assert job.status == "queued"
+    await asyncio.sleep(0.01)
+
+    running = queue.get(job.id).to_dict()
+    assert running["status"] == "running"
+    assert (running["done"], running["total"], running["results"]) == (2, 4, [0, 1])
+    release.set()
+    done = await _wait(queue, job.id)
+    assert done.to_dict(results_offset=1, results_limit=2)["results"] == [1, 2]
+    assert done.finished_at is not None
+    with pytest.raises(ValueError):
+        queue.submit("unknown", {})
+
+
+@pytest.mark.asyncio
+async def test_cancel_keeps_processed_results():
+    queue = JobQueue()
+    started = asyncio.Event()
+
+    async def runner(job):
+        job.results.append("first")
+        started.set()
+        await asyncio.sleep(60)
+
+    queue.register("slow", runner)
+    job = queue.submit("slow", {})
+    await started.wait()
+    cancelled = await queue.cancel(job.id)
+    assert cancelled.status == "cancelled"
+    assert cancelled.results == ["first"]
+    assert [j.id for j in queue.list_jobs()] == [job.id]
+
+
+@pytest.mark.asyncio
+async def test_persisted_jobs_are_visible_cancellable_and_resumed(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs_module, "CHECKPOINT_INTERVAL", 0)
+    path = str(tmp_path / "jobs.db")
+    first = JobQueue(path=path)
+    blocked = asyncio.Event()
+
+    async def stuck(job):
+        job.total = 3
+        job.results.append(1)
+        job.done = 1
+        first.checkpoint(job)
+        await blocked.wait()
+
+    first.register("sum", stuck)
+    job = first.submit("sum", {"values": [1, 2, 3]})
+    await asyncio.sleep(0.01)
+
+    # Another process sees the job and asks it to stop at its next checkpoint.
+    other = JobQueue(path=path)
+    assert other.get(job.id).done == 1
+    server = FastMCP("test")
+    job_tools.register(server, other)
+    cancelling = await server._tool_manager._tools["cancel_job"].fn(job_id=job.id)
+    assert cancelling["status"] == "cancelling"
+    with pytest.raises(JobCancelled):
+        first.checkpoint(first.get(job.id))
+
+    # The first process stops without finishing; its job is resumed elsewhere.
+    first._tasks[job.id].cancel()
+    await asyncio.sleep(0.01)
+    db = sqlite3.connect(path)
+    db.execute("UPDATE jobs SET heartbeat = 0, cancel_requested = 0")
+    db.commit()
+
+    resumed = JobQueue(path=path)
+
+    async def finish(job):
+        for value in job.params["values"][job.done:]:
+            job.results.append(value)
+            job.done += 1
+            resumed.checkpoint(job)
+
+    resumed.register("sum", finish)
+    assert resumed.resume() == 1
+    done = await _wait(resumed, job.id)
+    assert done.results == [1, 2, 3]
+    assert json.loads(db.execute("SELECT data FROM jobs").fetchone()[0])["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_background_bulk_update_and_export(tmp_path):
+    from redmine_mcp.client import RedmineClient
+
+    with patch.object(RedmineClient, "__init__", lambda self, **kw: None):
+        client = RedmineClient()
+    client.put = AsyncMock(return_value={})
+    client.get = AsyncMock(side_effect=lambda path, params=None: {
+        "issues": [{"id": i} for i in range(1, 251)][params["offset"]:params["offset"] + params["limit"]],
+        "total_count": 250,
+    })
+    queue = JobQueue()
+    server = FastMCP("test")
+    issues.register(server, client, jobs=queue)
+    tools = server._tool_manager._tools
+
+    with patch.object(issues, "JOB_CHUNK_SIZE", 2):
+        submitted = await tools["bulk_update_issues"].fn(issue_ids=[1, 2, 3], notes="hi", background=True)
+        job = await _wait(queue, submitted["job_id"])
+    assert [r["id"] for r in job.results] == [1, 2, 3]
+    assert (job.done, job.failed, job.total) == (3, 0, 3)
+    assert client.put.await_count == 3
+
+    with patch.dict("os.environ", {"REDMINE_ATTACHMENT_DIR": str(tmp_path)}):
+        submitted = await tools["export_issues"].fn(project_id="1", path="out/issues.jsonl")
+        job = await _wait(queue, submitted["job_id"])
+    lines = (tmp_path / "out" / "issues.jsonl").read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == list(range(1, 251))
+    assert job.results == [{"path": str(tmp_path / "out" / "issues.jsonl"), "issues": 250}]
+    assert not list(tmp_path.glob("out/*.part"))
+
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("REDMINE_JOBS_PATH", str(tmp_path / "jobs.db"))
+    monkeypatch.setenv("REDMINE_JOB_WORKERS", "3")
+    queue = JobQueue.from_env()
+    assert queue.stats() == {"running": 0, "known": 0, "workers": 3}
+    assert jobs_module.DEFAULT_WORKERS == 2
@@ -0,0 +1,82 @@
+import httpx
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.metrics import Metrics, instrument
+
+
+def _client(handler, metrics):
+    c = RedmineClient(
+        url="https://redmine.example.com",
+        api_key="key",
+        transport=httpx.MockTransport(handler),
+        retries=0,
+    )
+    c.metrics = metrics
+    return c
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_measured():
+    metrics = Metrics()
+    client = _client(lambda request: httpx.Response(200, json={"issues": []}), metrics)
+    mcp = FastMCP("test")
+    instrument(mcp, metrics)
+
+    @mcp.tool()
+    async def two_calls() -> dict:
+        await client.get("/issues.json")
+        await client.get("/issues.json", params={"offset": 25})
+        return {}
+
+    await mcp.call_tool("two_calls", {})
+
+    assert metrics.tool_calls[("two_calls", "ok")] == 1
+    assert metrics.tool_upstream_calls["two_calls"].sum == 2
+    assert metrics.upstream_responses[("GET", "200")] == 2
+    assert metrics.upstream_bytes_in["GET"] == 2 * len(b'{"issues":[]}')
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted_by_status():
+    metrics = Metrics()
+    client = _client(lambda request: httpx.Response(404), metrics)
+
+    async def get_missing():
+        return await client.get("/issues/9.json")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await metrics.wrap_tool(get_missing, "get_issue")()
+
+    assert metrics.tool_errors[("get_issue", "404")] == 1
+
+
+def test_render_prometheus_text():
+    metrics = Metrics()
+    metrics.observe_upstream("GET", 200, 0.02, 0, 10)
+    metrics.add_gauge("redmine_test_gauge", "A gauge.", lambda: 3)
+    metrics.add_counter("redmine_test_total", "A running total.", lambda: 7)
+
+    text = metrics.render()
+
+    assert 'redmine_upstream_duration_seconds_bucket{method="GET",le="0.025"} 1' in text
+    assert 'redmine_upstream_responses_total{method="GET",status="200"} 1' in text
+    assert "# TYPE redmine_test_gauge gauge\nredmine_test_gauge 3" in text
+    assert "# TYPE redmine_test_total counter\nredmine_test_total 7" in text
+
+
+def test_log_line_per_call(caplog):
+    import asyncio
+    import json
+
+    metrics = Metrics(log_calls=True)
+
+    async def noop():
+        return {}
+
+    with caplog.at_level("INFO", logger="redmine_mcp.metrics"):
+        asyncio.run(metrics.wrap_tool(noop, "noop")())
+
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["tool"] == "noop" and record["status"] == "ok"
@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from redmine_mcp.mirror import IssueMirror
+
+
+def _issue(iid, subject, status_id=1, updated_on="2024-01-01T00:00:00Z", **extra):
+    return {
+        "id": iid,
+        "project": {"id": 1, "name": "Demo"},
+        "tracker": {"id": 1, "name": "Bug"},
+        "status": {"id": status_id, "name": "New" if status_id == 1 else "Closed"},
+        "subject": subject,
+        "description": extra.pop("description", ""),
+        "updated_on": updated_on,
+        **extra,
+    }
+
+
+@pytest.fixture
+def mock_client():
+    from redmine_mcp.client import RedmineClient
+
+    with patch.object(RedmineClient, "__init__", lambda self, **kw: None):
+        client = RedmineClient()
+        client.get = AsyncMock()
+        return client
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    m = IssueMirror(str(tmp_path / "mirror.db"), scopes=["demo"], max_age=60)
+    yield m
+    m.close()
+
+
+def _redmine(issues):
+    async def get(path, params=None):
+        if path == "/issue_statuses.json":
+            return {"issue_statuses": [{"id": 1, "name": "New"}, {"id": 5, "name": "Closed", "is_closed": True}]}
+        if path == "/projects/demo.json":
+            return {"project": {"id": 1, "identifier": "demo"}}
+        return {"issues": issues, "total_count": len(issues)}
+    return get
+
+
+@pytest.mark.asyncio
+async def test_sync_and_list(mock_client, mirror):
+    mock_client.get.side_effect = _redmine([
+        _issue(1, "Login fails", updated_on="2024-01-01T00:00:00Z"),
+        _issue(2, "Old bug", status_id=5, updated_on="2024-01-02T00:00:00Z"),
+    ])
+
+    result = await mirror.sync(mock_client, "demo")
+
+    assert result["synced"] == 2
+    assert result["cursor"] == "2024-01-02T00:00:00Z"
+    assert [i["id"] for i in mirror.list_issues("demo")["issues"]] == [1]
+    assert [i["id"] for i in mirror.list_issues("demo", status_id="*")["issues"]] == [2, 1]
+    assert mirror.list_issues("demo", status_id="closed")["total_count"] == 1
+    assert mirror.list_issues("demo", assigned_to_id="me") is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_uses_cursor(mock_client, mirror):
+    mock_client.get.side_effect = _redmine([_issue(1, "a", updated_on="2024-01-05T00:00:00Z")])
+    await mirror.sync(mock_client, "demo")
+
+    await mirror.sync(mock_client, "demo", force=True)
+
+    params = mock_client.get.call_args_list[-1].kwargs["params"]
+    assert params["updated_on"] == ">=2024-01-05T00:00:00Z"
+    assert params["project_id"] == "demo"
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_matches(mock_client, mirror):
+    mock_client.get.side_effect = _redmine([
+        _issue(1, "ログイン画面の不具合", description="パスワード入力後にエラー"),
+        _issue(2, "一覧の表示崩れ"),
+    ])
+    await mirror.sync(mock_client, "demo")
+
+    result = mirror.search("demo", "ログイン")
+    assert [r["id"] for r in result["results"]] == [1]
+    assert result["results"][0]["title"] == "Bug #1 (New): ログイン画面の不具合"
+    assert mirror.search("demo", "一覧")["total_count"] == 1
+
+
+def test_write_through_upsert(mirror):
+    mirror._db.execute(
+        "INSERT INTO sync_state (scope, project_id, cursor, synced_at) VALUES ('demo', 1, NULL, 0)"
+    )
+    mirror.upsert([_issue(7, "Created")])
+    mirror._db.execute("INSERT INTO statuses (id, is_closed) VALUES (1, 0)")
+
+    assert [i["id"] for i in mirror.list_issues("demo")["issues"]] == [7]
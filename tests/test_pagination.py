@@ -0,0 +1,74 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from redmine_mcp.pagination import Paginator, fetch_limit
+
+
+def _fake_get(total, delays=None):
+    async def get(path, params=None):
+        offset, limit = params["offset"], params["limit"]
+        if delays:
+            await asyncio.sleep(delays.get(offset, 0))
+        ids = range(offset + 1, min(offset + limit, total) + 1)
+        return {"issues": [{"id": i} for i in ids], "total_count": total}
+    return AsyncMock(side_effect=get)
+
+
+@pytest.fixture
+def mock_client():
+    from redmine_mcp.client import RedmineClient
+
+    with patch.object(RedmineClient, "__init__", lambda self, **kw: None):
+        return RedmineClient()
+
+
+@pytest.mark.asyncio
+async def test_fetches_all_pages_in_order(mock_client):
+    # Later pages finish first; output must still follow offset order.
+    mock_client.get = _fake_get(250, delays={100: 0.02, 200: 0.0})
+
+    result = await Paginator(
+        mock_client, "/issues.json", "issues", {"project_id": "p"}, concurrency=4,
+    ).collect()
+
+    assert [i["id"] for i in result["issues"]] == list(range(1, 251))
+    assert result["total_count"] == 250
+    assert result["truncated"] is False
+    assert mock_client.get.call_count == 3
+    mock_client.get.assert_any_call(
+        "/issues.json", params={"project_id": "p", "limit": 100, "offset": 200},
+    )
+
+
+@pytest.mark.asyncio
+async def test_max_items_stops_early(mock_client):
+    mock_client.get = _fake_get(1000)
+
+    result = await Paginator(
+        mock_client, "/issues.json", "issues", offset=10, max_items=150,
+    ).collect()
+
+    assert [i["id"] for i in result["issues"]] == list(range(11, 161))
+    assert result["truncated"] is True
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_streams_incrementally(mock_client):
+    mock_client.get = _fake_get(300)
+    seen = []
+    async for item in Paginator(mock_client, "/issues.json", "issues", concurrency=1):
+        seen.append(item["id"])
+        if len(seen) == 5:
+            break
+
+    assert seen == [1, 2, 3, 4, 5]
+
+
+def test_fetch_limit(monkeypatch):
+    monkeypatch.setenv("REDMINE_FETCH_ALL_LIMIT", "500")
+    assert fetch_limit(None) == 500
+    assert fetch_limit(100) == 100
+    assert fetch_limit(1000) == 500
@@ -0,0 +1,51 @@
+import copy
+
+from redmine_mcp.projection import parse_fields, shape
+
+ISSUE = {
+    "id": 1,
+    "subject": "Login fails",
+    "status": {"id": 2, "name": "In Progress"},
+    "assigned_to": None,
+    "description": "x" * 600,
+    "custom_fields": [],
+    "journals": [
+        {"id": 10, "user": {"id": 3, "name": "Tanaka"}, "notes": "hi", "details": []},
+    ],
+}
+
+
+def test_parse_fields():
+    assert parse_fields("id, status.name,status.id") == {"id": {}, "status": {"name": {}, "id": {}}}
+    assert parse_fields(None) is None
+
+
+def test_fields_whitelist():
+    result = shape({"issue": ISSUE}, "issue", fields="id,status.name,journals.notes")
+    assert result == {"issue": {"id": 1, "status": {"name": "In Progress"}, "journals": [{"notes": "hi"}]}}
+
+
+def test_compact_mode():
+    data = {"issues": [ISSUE], "total_count": 1}
+    original = copy.deepcopy(data)
+
+    result = shape(data, "issues", compact=True)
+
+    issue = result["issues"][0]
+    assert "assigned_to" not in issue and "custom_fields" not in issue
+    assert issue["status"] == "In Progress" and issue["status_id"] == 2
+    assert issue["journals"][0]["user"] == "Tanaka"
+    assert len(issue["description"]) == 501
+    assert result["_truncated"] == [{"path": "issues[0].description", "length": 600}]
+    assert result["total_count"] == 1
+    assert data == original
+
+
+def test_no_options_returns_input():
+    data = {"issue": ISSUE}
+    assert shape(data, "issue") is data
+
+
+def test_keyed_records():
+    result = shape({"issues": {"1": ISSUE}, "missing": []}, "issues", fields="subject", keyed=True)
+    assert result["issues"] == {"1": {"subject": "Login fails"}}
@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.resolver import NameIndex, normalize
+
+RESPONSES = {
+    "/issue_statuses.json": {"issue_statuses": [
+        {"id": 1, "name": "New"}, {"id": 2, "name": "In Progress"}, {"id": 5, "name": "Closed"},
+    ]},
+    "/users.json": {"users": [
+        {"id": 7, "login": "tanaka", "firstname": "太郎", "lastname": "田中"},
+        {"id": 8, "login": "tanabe", "firstname": "Hanako", "lastname": "Tanabe"},
+    ], "total_count": 2},
+    "/projects.json": {"projects": [
+        {"id": 3, "name": "Web Site", "identifier": "web-site"},
+    ], "total_count": 1},
+}
+
+
+@pytest.fixture
+def client():
+    client = AsyncMock()
+    client.get.side_effect = lambda path, params=None: RESPONSES[path]
+    return client
+
+
+def test_normalize_folds_width_case_and_spaces():
+    assert normalize("  Ｉｎ  PROGRESS ") == "in progress"
+
+
+@pytest.mark.asyncio
+async def test_resolve_exact_prefix_and_fuzzy(client):
+    index = NameIndex(client, TTLCache(ttl=60))
+
+    assert await index.resolve("statuses", "in progress") == 2
+    assert await index.resolve("statuses", "clo") == 5
+    assert await index.resolve("statuses", "Closd") == 5
+    assert await index.resolve("users", "tanaka") == 7
+    assert await index.resolve("users", "田中 太郎") == 7
+    assert await index.resolve("statuses", "4") == 4
+    # Each collection is fetched once, however many names are resolved.
+    assert client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_reports_ambiguous_and_unknown_names(client):
+    index = NameIndex(client, TTLCache(ttl=60))
+
+    with pytest.raises(ValueError, match="more than one user"):
+        await index.resolve("users", "tana")
+    with pytest.raises(ValueError, match="No status matches"):
+        await index.resolve("statuses", "Rejected")
+
+
+@pytest.mark.asyncio
+async def test_strict_resolve_accepts_only_exact_names_and_unique_prefixes(client):
+    index = NameIndex(client, TTLCache(ttl=60))
+
+    assert await index.resolve("statuses", "in progress", strict=True) == 2
+    assert await index.resolve("statuses", "clo", strict=True) == 5
+    with pytest.raises(ValueError, match="exactly or by prefix"):
+        await index.resolve("statuses", "Closd", strict=True)
+    with pytest.raises(ValueError, match="exactly or by prefix"):
+        await index.resolve("statuses", "progress", strict=True)
+    with pytest.raises(ValueError, match="more than one user"):
+        await index.resolve("users", "tana", strict=True)
+
+
+@pytest.mark.asyncio
+async def test_unknown_name_refetches_stale_snapshot(client):
+    index = NameIndex(client, TTLCache(ttl=3600))
+    await index.resolve("statuses", "New")
+
+    refreshed = {"issue_statuses": [{"id": 1, "name": "New"}, {"id": 6, "name": "Rejected"}]}
+    client.get.side_effect = lambda path, params=None: refreshed
+    with patch("redmine_mcp.resolver.MIN_REFETCH_INTERVAL", -1):
+        assert await index.resolve("statuses", "Rejected") == 6
+
+
+@pytest.mark.asyncio
+async def test_resolve_project_keeps_identifiers(client):
+    index = NameIndex(client, TTLCache(ttl=60))
+
+    assert await index.resolve_project("web-site") == "web-site"
+    assert await index.resolve_project("42") == "42"
+    client.get.assert_not_called()
+    assert await index.resolve_project("Web Site") == "web-site"
+
+
+@pytest.mark.asyncio
+async def test_lookups_of_evicted_users_are_dropped(client):
+    from redmine_mcp.client import RedmineClient
+    from redmine_mcp.tenancy import ClientPool
+
+    pool = ClientPool(RedmineClient(url="https://redmine.example.com", api_key="server-key"), max_size=1)
+    index = NameIndex(client, TTLCache(ttl=60))
+    pool.on_evict.append(index.forget)
+
+    await index.resolve("statuses", "New")
+    async with pool.lease(None, "alice-key"):
+        await index.resolve("statuses", "New")
+    assert len(index._lookups) == 2
+    async with pool.lease(None, "bob-key") as bob:
+        await index.resolve("statuses", "New")
+    # Alice's client left the pool and took her lookup tables with it.
+    assert set(index._lookups) == {(None, "statuses"), (bob.scope, "statuses")}
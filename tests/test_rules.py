@@ -0,0 +1,59 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.rules import parse_ticket_rules, remember
+
+CONVENTION = Path(__file__).resolve().parent.parent / "docs" / "wiki-convention.md"
+
+
+def _example_page() -> str:
+    """The example TicketRules page from docs/wiki-convention.md."""
+    text = CONVENTION.read_text(encoding="utf-8")
+    return text.split("```markdown\n", 1)[1].rsplit("\n```", 1)[0]
+
+
+def test_parse_convention_example():
+    rules = parse_ticket_rules(_example_page(), version=3)
+
+    assert rules.version == 3
+    assert [(t["name"], t["id"]) for t in rules.trackers] == [("バグ", 1), ("機能", 2), ("タスク", 3)]
+    assert rules.required_fields == ["subject", "description", "tracker_id", "priority_id"]
+    assert rules.subject_formats["バグ"] == "[BUG] 〈現象の簡潔な説明〉"
+    # Headings inside the fenced templates are not sections of the page.
+    assert set(rules.templates) == {"バグ報告テンプレート", "機能要望テンプレート"}
+    assert rules.templates["バグ報告テンプレート"].startswith("## 概要\n")
+    assert rules.defaults == {"priority_id": 2, "assigned_to_id": None}
+    assert len(rules.parent_rules) == 2
+    assert len(rules.notes) == 2
+
+
+def test_validate_reports_every_violation():
+    rules = parse_ticket_rules(_example_page())
+    issue = rules.apply_defaults({"subject": "login fails", "tracker_id": 1})
+
+    assert issue["priority_id"] == 2
+    assert "assigned_to_id" not in issue
+    assert rules.validate(issue, {"subject", "description", "tracker_id", "priority_id"}) == [
+        "description is required (use the template 'バグ報告テンプレート')",
+        "subject must follow the format '[BUG] 〈現象の簡潔な説明〉'",
+    ]
+    issue.update(subject="[BUG] login fails", description="...")
+    assert rules.validate(issue, {"subject", "description", "tracker_id", "priority_id"}) == []
+
+
+@pytest.mark.asyncio
+async def test_remember_reparses_only_new_versions():
+    cache = TTLCache(ttl=60)
+    page = {"version": 1, "text": "## 必須フィールド\n- subject\n"}
+    await remember(cache, "p", page)
+
+    with patch("redmine_mcp.rules.parse_ticket_rules") as parse:
+        assert (await remember(cache, "p", page)).required_fields == ["subject"]
+        parse.assert_not_called()
+
+    updated = await remember(cache, "p", {"version": 2, "text": "## 必須フィールド\n- description\n"})
+    assert updated.required_fields == ["description"]
+    assert (await cache.get(("ticket_rules", "p")))[1]["version"] == 2
@@ -0,0 +1,139 @@
+import asyncio
+
+import httpx
+import pytest
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.scheduler import BACKGROUND, INTERACTIVE, WRITE, Scheduler, background, request_class
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_go_before_queued_background_work():
+    scheduler = Scheduler(max_limit=1)
+    await scheduler.acquire(BACKGROUND)
+    order = []
+
+    async def request(cls, name):
+        await scheduler.acquire(cls)
+        order.append(name)
+        scheduler.release(cls, 0.01)
+
+    waiters = [
+        asyncio.create_task(request(BACKGROUND, "bg1")),
+        asyncio.create_task(request(BACKGROUND, "bg2")),
+        asyncio.create_task(request(WRITE, "write")),
+        asyncio.create_task(request(INTERACTIVE, "read")),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth() == 4
+    scheduler.release(BACKGROUND, 0.01)
+    await asyncio.gather(*waiters)
+    assert order == ["read", "write", "bg1", "bg2"]
+    stats = scheduler.stats()["classes"]
+    assert stats["background"]["admitted"] == 3
+    assert stats["interactive"]["max_wait"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_background_work_leaves_slots_for_interactive_requests():
+    scheduler = Scheduler(max_limit=4)
+    for _ in range(3):
+        await scheduler.acquire(BACKGROUND)
+    blocked = asyncio.create_task(scheduler.acquire(BACKGROUND))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    # The fourth slot is kept for interactive calls, which do not queue.
+    await asyncio.wait_for(scheduler.acquire(INTERACTIVE), 1)
+    assert scheduler.in_flight == {INTERACTIVE: 1, WRITE: 0, BACKGROUND: 3}
+    scheduler.release(BACKGROUND, 0.01)
+    await asyncio.wait_for(blocked, 1)
+    assert scheduler.in_flight[BACKGROUND] == 3
+
+
+def test_limit_backs_off_on_congestion_and_recovers_additively():
+    scheduler = Scheduler(max_limit=10, min_limit=2, latency_tolerance=2.0)
+    scheduler.limit = 10.0
+    scheduler.in_flight[INTERACTIVE] = 1
+    scheduler.release(INTERACTIVE, 0.05, congested=True)
+    assert scheduler.limit == pytest.approx(7.0)
+    # A second failure within the same latency window counts once.
+    scheduler.in_flight[INTERACTIVE] = 1
+    scheduler.release(INTERACTIVE, 0.05, congested=True)
+    assert scheduler.limit == pytest.approx(7.0)
+    assert scheduler.decreases == 1
+
+    for _ in range(7):
+        scheduler.in_flight[INTERACTIVE] = 1
+        scheduler.release(INTERACTIVE, 0.05)
+    assert 7.5 < scheduler.limit < 8.5
+    for _ in range(1000):
+        scheduler.in_flight[INTERACTIVE] = 1
+        scheduler.release(INTERACTIVE, 0.05)
+    assert scheduler.limit == 10
+
+
+def test_limit_backs_off_when_latency_climbs():
+    scheduler = Scheduler(max_limit=8, latency_tolerance=2.0)
+    for _ in range(50):
+        scheduler.in_flight[INTERACTIVE] = 1
+        scheduler.release(INTERACTIVE, 0.02)
+    assert scheduler.limit == 8
+    for _ in range(30):
+        scheduler.in_flight[INTERACTIVE] = 1
+        scheduler._decreased_at = 0.0
+        scheduler.release(INTERACTIVE, 0.5)
+    assert scheduler.limit == 1
+    assert scheduler.recent > 2 * scheduler.baseline
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_keep_a_slot():
+    scheduler = Scheduler(max_limit=1)
+    await scheduler.acquire(INTERACTIVE)
+    waiter = asyncio.create_task(scheduler.acquire(BACKGROUND))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release(INTERACTIVE, 0.01)
+    assert scheduler.in_flight == {INTERACTIVE: 0, WRITE: 0, BACKGROUND: 0}
+    assert scheduler.queue_depth() == 0
+    await asyncio.wait_for(scheduler.acquire(INTERACTIVE), 1)
+
+
+@pytest.mark.asyncio
+async def test_background_marks_requests_and_tasks_started_inside():
+    assert request_class(idempotent=True) == INTERACTIVE
+    assert request_class(idempotent=False) == WRITE
+
+    async def classify():
+        return request_class(idempotent=True)
+
+    with background():
+        assert request_class(idempotent=False) == BACKGROUND
+        task = asyncio.create_task(classify())
+    assert await task == BACKGROUND
+    assert request_class(idempotent=True) == INTERACTIVE
+
+
+@pytest.mark.asyncio
+async def test_client_requests_pass_through_the_scheduler():
+    scheduler = Scheduler(max_limit=2)
+    statuses = iter([503, 200, 200])
+    client = RedmineClient(
+        url="https://redmine.example.com",
+        api_key="key",
+        transport=httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={})),
+        retry_backoff=0,
+        retries=1,
+        scheduler=scheduler,
+    )
+    await client.get("/issues.json")
+    with background():
+        await client.put("/issues/1.json", json={"issue": {}})
+    stats = client.stats()["scheduler"]
+    assert stats["classes"]["interactive"]["admitted"] == 2
+    assert stats["classes"]["background"]["admitted"] == 1
+    assert stats["decreases"] == 1
+    assert sum(scheduler.in_flight.values()) == 0
@@ -0,0 +1,37 @@
+import httpx
+from starlette.testclient import TestClient
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.server import create_http_app, create_server
+
+
+def _call(http, name, arguments, request_id=1):
+    return http.post(
+        "/mcp",
+        json={"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+              "params": {"name": name, "arguments": arguments}},
+        headers={"Accept": "application/json, text/event-stream"},
+    )
+
+
+def test_stateless_http_serves_tool_calls_on_one_pool():
+    client = RedmineClient(
+        url="https://redmine.example.com",
+        api_key="key",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"trackers": []})),
+    )
+    mcp = create_server(client, stateless_http=True, json_response=True)
+    app = create_http_app(mcp)
+
+    with TestClient(app, base_url="http://localhost:8000") as http:
+        pool = client._http
+        assert pool is not None
+        for request_id in (1, 2):
+            resp = _call(http, "list_trackers", {}, request_id)
+            assert resp.status_code == 200
+            assert not resp.json()["result"]["isError"]
+        # Per-request sessions must not close the process-wide pool.
+        assert client._http is pool and not pool.is_closed
+        assert http.get("/metrics").status_code == 200
+
+    assert client._http is None
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import pytest
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.resilience import RateLimiter
+from redmine_mcp.shared import SharedState
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "shared.db")
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_are_shared_between_workers(state_path):
+    worker_a = TTLCache(ttl=60, shared=SharedState(state_path))
+    worker_b = TTLCache(ttl=60, shared=SharedState(state_path))
+
+    await worker_a.set(("reference", "trackers"), {"trackers": [{"id": 1}]})
+
+    assert await worker_b.get(("reference", "trackers")) == (True, {"trackers": [{"id": 1}]})
+    assert worker_b.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_reaches_other_workers(state_path):
+    worker_a = TTLCache(ttl=60, shared=SharedState(state_path))
+    worker_b = TTLCache(ttl=60, shared=SharedState(state_path))
+    await worker_a.set(("reference", "trackers"), 1)
+    await worker_a.set(("references", "x"), 2)
+    await worker_a.set(("project", "p1", ""), 3)
+
+    await worker_a.invalidate("reference")
+
+    assert await worker_b.get(("reference", "trackers")) == (False, None)
+    assert await worker_b.get(("references", "x")) == (True, 2)
+    assert await worker_b.get(("project", "p1", "")) == (True, 3)
+
+
+@pytest.mark.asyncio
+async def test_clearing_one_cache_keeps_other_caches_entries(state_path):
+    shared = SharedState(state_path)
+    reference = TTLCache(ttl=60, shared=shared)
+    rules = TTLCache(ttl=60, shared=shared, name="rules")
+    await reference.set(("reference", "trackers"), 1)
+    await rules.set(("rules", "p1"), {"defaults": {}})
+
+    await reference.invalidate()
+
+    other_worker = TTLCache(ttl=60, shared=SharedState(state_path), name="rules")
+    assert await other_worker.get(("rules", "p1")) == (True, {"defaults": {}})
+    assert await TTLCache(ttl=60, shared=shared).get(("reference", "trackers")) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_unserializable_values_stay_local(state_path):
+    worker_a = TTLCache(ttl=60, shared=SharedState(state_path))
+    worker_b = TTLCache(ttl=60, shared=SharedState(state_path))
+    value = object()
+
+    await worker_a.set(("rules", "p1"), value)
+
+    assert await worker_a.get(("rules", "p1")) == (True, value)
+    assert await worker_b.get(("rules", "p1")) == (False, None)
+
+
+def test_shared_entries_expire(state_path):
+    shared = SharedState(state_path)
+    shared.set('["reference"]', 1, ttl=-1)
+    assert shared.get('["reference"]')[0] is False
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_shared_between_workers(state_path):
+    limiters = [RateLimiter(50, SharedState(state_path), name="upstream") for _ in range(2)]
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        for limiter in limiters:
+            await limiter.acquire()
+    # Six slots 20ms apart across both workers: the last starts after 100ms.
+    assert loop.time() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_waiting_on_the_shared_store_does_not_block_the_loop(state_path, monkeypatch):
+    shared = SharedState(state_path)
+    reserve = shared.reserve
+
+    def slow_reserve(name, interval):
+        # Another worker holding the write lock.
+        time.sleep(0.2)
+        return reserve(name, interval)
+
+    monkeypatch.setattr(shared, "reserve", slow_reserve)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    await RateLimiter(50, shared, name="upstream").acquire()
+    ticker.cancel()
+    assert ticks >= 10
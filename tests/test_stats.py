@@ -0,0 +1,120 @@
+from collections import Counter
+
+import pytest
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.resolver import NameIndex
+from redmine_mcp.stats import OTHER_ASSIGNEE, issue_stats
+
+STATUSES = [
+    {"id": 1, "name": "New", "is_closed": False},
+    {"id": 2, "name": "In Progress", "is_closed": False},
+    {"id": 5, "name": "Closed", "is_closed": True},
+]
+TRACKERS = [{"id": 1, "name": "Bug"}, {"id": 2, "name": "Feature"}]
+ASSIGNEES = [{"id": 7, "name": "Tanaka"}, {"id": 8, "name": "Sato"}, {"id": 9, "name": "Former member"}, None]
+ISSUES = [
+    {
+        "id": i,
+        "status": STATUSES[i % 3],
+        "tracker": TRACKERS[i % 2],
+        **({"assigned_to": ASSIGNEES[i % 4]} if ASSIGNEES[i % 4] else {}),
+    }
+    for i in range(1, 301)
+]
+
+
+class FakeRedmine:
+    def __init__(self):
+        self.paths = Counter()
+
+    @staticmethod
+    def _matches(issue, params):
+        status = str(params.get("status_id", "open"))
+        if status in ("open", "closed"):
+            if issue["status"]["is_closed"] != (status == "closed"):
+                return False
+        elif status != "*" and issue["status"]["id"] != int(status):
+            return False
+        if "tracker_id" in params and issue["tracker"]["id"] != int(params["tracker_id"]):
+            return False
+        assignee = params.get("assigned_to_id")
+        if assignee == "!*":
+            return "assigned_to" not in issue
+        if assignee is not None:
+            return issue.get("assigned_to", {}).get("id") == int(assignee)
+        return True
+
+    async def get(self, path, params=None):
+        self.paths[path] += 1
+        params = params or {}
+        if path == "/issue_statuses.json":
+            return {"issue_statuses": STATUSES}
+        if path == "/projects/p.json":
+            return {"project": {"id": 1, "trackers": TRACKERS}}
+        if path == "/projects/p/memberships.json":
+            users = [{"id": 1, "user": ASSIGNEES[0]}, {"id": 2, "user": ASSIGNEES[1]}]
+            return {"memberships": users, "total_count": 2}
+        assert path == "/issues.json"
+        found = [issue for issue in ISSUES if self._matches(issue, params)]
+        offset, limit = params.get("offset", 0), params["limit"]
+        return {"issues": found[offset:offset + limit], "total_count": len(found)}
+
+
+def _expected(group_by, params):
+    fields = {"status": "status", "tracker": "tracker", "assignee": "assigned_to"}
+    return Counter(
+        tuple((issue.get(fields[d]) or {}).get("name") for d in group_by)
+        for issue in ISSUES if FakeRedmine._matches(issue, params)
+    )
+
+
+def _counts(result):
+    return Counter({tuple(row[d] for d in result["group_by"]): row["count"] for row in result["rows"]})
+
+
+@pytest.mark.asyncio
+async def test_facets_count_with_total_count_only():
+    client = FakeRedmine()
+    names = NameIndex(client, TTLCache(ttl=60))
+    params = {"project_id": "p", "status_id": "*"}
+
+    result = await issue_stats(client, names, params, ["status", "tracker"])
+
+    assert result["method"] == "facets"
+    assert result["total"] == 300
+    assert _counts(result) == _expected(["status", "tracker"], params)
+    # One total query plus one per (status, tracker) pair; no issue pages are read.
+    assert result["queries"] == 1 + 3 * 2
+
+
+@pytest.mark.asyncio
+async def test_facets_count_assignees_outside_the_project():
+    client = FakeRedmine()
+    names = NameIndex(client, TTLCache(ttl=60))
+
+    result = await issue_stats(client, names, {"project_id": "p"}, ["assignee", "status"])
+
+    expected = _expected(["assignee", "status"], {})
+    for status in ("New", "In Progress"):
+        expected[(OTHER_ASSIGNEE, status)] = expected.pop(("Former member", status), 0)
+    assert result["method"] == "facets"
+    assert _counts(result) == +expected
+
+
+@pytest.mark.asyncio
+async def test_scan_when_facets_are_unknown():
+    client = FakeRedmine()
+    names = NameIndex(client, TTLCache(ttl=60))
+
+    # Without a project the assignees cannot be enumerated.
+    result = await issue_stats(client, names, {}, ["assignee"])
+
+    assert result["method"] == "scan"
+    assert _counts(result) == _expected(["assignee"], {})
+    assert not result["truncated"]
+
+    with pytest.raises(ValueError):
+        await issue_stats(client, names, {}, ["assignee"], method="facets")
+    with pytest.raises(ValueError):
+        await issue_stats(client, names, {}, ["author"])
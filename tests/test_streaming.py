@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from redmine_mcp.streaming import StreamFormatError, iter_array_items
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def _collect(data: bytes, key: str, size: int) -> list:
+    return [item async for item in iter_array_items(_chunks(data, size), key)]
+
+
+DOCUMENT = json.dumps({
+    "issue": {
+        "id": 1,
+        "description": 'quoted \\"journals\\":[ and "journals": [ inside text — 日本語',
+        "journals": [{"id": n, "notes": f"ノート {n}", "details": []} for n in range(1, 6)] + [7, "x", None],
+        "watchers": [],
+    },
+}, ensure_ascii=False).encode()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+@pytest.mark.asyncio
+async def test_items_are_decoded_across_any_chunk_boundary(size):
+    items = await _collect(DOCUMENT, "journals", size)
+    assert [i["id"] for i in items[:5]] == [1, 2, 3, 4, 5]
+    assert items[0]["notes"] == "ノート 1"
+    assert items[5:] == [7, "x", None]
+
+
+@pytest.mark.asyncio
+async def test_missing_key_yields_nothing():
+    assert await _collect(b'{"issue": {"id": 1}}', "journals", 4) == []
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_leaves_the_rest_unread():
+    read = []
+
+    async def chunks():
+        for i in range(0, len(DOCUMENT), 16):
+            read.append(i)
+            yield DOCUMENT[i:i + 16]
+
+    async for item in iter_array_items(chunks(), "journals"):
+        break
+    assert item["id"] == 1
+    assert len(read) < len(DOCUMENT) // 16
+
+
+@pytest.mark.asyncio
+async def test_truncated_stream_raises():
+    with pytest.raises(StreamFormatError):
+        await _collect(b'{"journals": [{"id": 1}, {"id": 2', "journals", 5)
@@ -0,0 +1,115 @@
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.server import create_http_app, create_server
+from redmine_mcp.tenancy import ClientPool
+
+
+def _recording_client(seen):
+    def handler(request):
+        seen.append((request.url.host, request.headers["X-Redmine-API-Key"]))
+        return httpx.Response(200, json={"trackers": []})
+
+    return RedmineClient(
+        url="https://redmine.example.com",
+        api_key="server-key",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+@pytest.mark.asyncio
+async def test_leased_credentials_share_the_connection_pool():
+    seen = []
+    client = _recording_client(seen)
+    pool = ClientPool(client)
+
+    async with pool.lease(None, "alice-key") as alice:
+        await client.get("/trackers.json")
+        assert alice._client() is client._client()
+    await client.get("/trackers.json")
+
+    assert seen == [("redmine.example.com", "alice-key"), ("redmine.example.com", "server-key")]
+    assert client.stats()["requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_used_idle_clients():
+    pool = ClientPool(_recording_client([]), max_size=2)
+
+    async with pool.lease(None, "a"):
+        async with pool.lease(None, "b"):
+            pass
+        async with pool.lease(None, "c"):
+            pass
+        # "a" is in use, so the idle "b" goes first.
+        assert [key for _, key in pool._clients] == ["a", "c"]
+
+    assert pool.stats() == {"size": 2, "created": 3, "evicted": 1}
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_unlisted_urls(monkeypatch):
+    monkeypatch.setenv("REDMINE_ALLOWED_URLS", "https://other.example.com/")
+    pool = ClientPool(_recording_client([]))
+
+    async with pool.lease("https://other.example.com", "k") as other:
+        assert other.base_url == "https://other.example.com"
+    with pytest.raises(ValueError, match="not allowed"):
+        async with pool.lease("https://evil.example.com", "k"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_are_kept_per_user():
+    client = _recording_client([])
+    pool = ClientPool(client)
+    cache = TTLCache(ttl=60)
+
+    await cache.set(("project", "p1", ""), "server view")
+    async with pool.lease(None, "alice-key"):
+        assert await cache.get(("project", "p1", "")) == (False, None)
+        await cache.set(("project", "p1", ""), "alice view")
+        assert await cache.get(("project", "p1", "")) == (True, "alice view")
+    assert await cache.get(("project", "p1", "")) == (True, "server view")
+    assert await cache.invalidate("project") == 2
+
+
+def test_http_requests_use_the_callers_api_key():
+    seen = []
+    mcp = create_server(_recording_client(seen), stateless_http=True, json_response=True)
+    body = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "list_trackers", "arguments": {}}}
+    headers = {"Accept": "application/json, text/event-stream"}
+
+    with TestClient(create_http_app(mcp), base_url="http://localhost:8000") as http:
+        http.post("/mcp", json=body, headers={**headers, "X-Redmine-API-Key": "alice-key"})
+        http.post("/mcp", json=body, headers=headers)
+
+    assert [key for _, key in seen] == ["alice-key", "server-key"]
+
+
+def test_http_calls_without_a_key_cannot_use_arbitrary_paths(tmp_path, monkeypatch):
+    monkeypatch.delenv("REDMINE_ATTACHMENT_DIR", raising=False)
+    secret = tmp_path / "secret.txt"
+    secret.write_text("token")
+    seen = []
+    mcp = create_server(_recording_client(seen), stateless_http=True, json_response=True)
+    headers = {"Accept": "application/json, text/event-stream"}
+
+    def call(name, arguments):
+        body = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                "params": {"name": name, "arguments": arguments}}
+        return http.post("/mcp", json=body, headers=headers).json()["result"]
+
+    with TestClient(create_http_app(mcp), base_url="http://localhost:8000") as http:
+        upload = call("upload_attachment", {"file_path": str(secret)})
+        export = call("export_issues", {"project_id": "p", "path": str(tmp_path / "out.jsonl"), "overwrite": True})
+
+    for result in (upload, export):
+        assert result["isError"]
+        assert "REDMINE_ATTACHMENT_DIR" in result["content"][0]["text"]
+    assert seen == []
+    assert not (tmp_path / "out.jsonl").exists()
@@ -0,0 +1,84 @@
+import hashlib
+
+import httpx
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp.client import RedmineClient
+from redmine_mcp.tools import attachments
+
+CONTENT = bytes(range(256)) * 9000  # a little over two chunks
+
+
+def _tools(handler):
+    client = RedmineClient(
+        url="https://redmine.example.com", api_key="key", transport=httpx.MockTransport(handler),
+    )
+    server = FastMCP("test")
+    attachments.register(server, client)
+    return client, {name: tool.fn for name, tool in server._tool_manager._tools.items()}
+
+
+@pytest.mark.asyncio
+async def test_upload_attachment_streams_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("REDMINE_ATTACHMENT_DIR", str(tmp_path))
+    (tmp_path / "log.txt").write_bytes(CONTENT)
+    received = {}
+
+    def handler(request):
+        received["path"] = request.url.path
+        received["params"] = dict(request.url.params)
+        received["headers"] = request.headers
+        received["body"] = request.content
+        return httpx.Response(201, json={"upload": {"id": 5, "token": "5.abc"}})
+
+    client, tools = _tools(handler)
+    async with client:
+        result = await tools["upload_attachment"](file_path="log.txt")
+
+    assert received["path"] == "/uploads.json"
+    assert received["params"] == {"filename": "log.txt"}
+    assert received["headers"]["content-type"] == "application/octet-stream"
+    assert received["body"] == CONTENT
+    assert result["upload"] == {"token": "5.abc", "filename": "log.txt", "content_type": "text/plain"}
+    assert result["size"] == len(CONTENT)
+    assert result["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_upload_attachment_stays_in_attachment_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("REDMINE_ATTACHMENT_DIR", str(tmp_path / "files"))
+    _, tools = _tools(lambda request: httpx.Response(500))
+
+    with pytest.raises(PermissionError):
+        await tools["upload_attachment"](file_path="../secret.txt")
+
+
+@pytest.mark.asyncio
+async def test_download_attachment_verifies_size(tmp_path, monkeypatch):
+    monkeypatch.setenv("REDMINE_ATTACHMENT_DIR", str(tmp_path))
+    body = CONTENT
+
+    def handler(request):
+        if request.url.path == "/attachments/3.json":
+            return httpx.Response(200, json={"attachment": {
+                "id": 3, "filename": "../dump.bin", "filesize": len(CONTENT),
+            }})
+        assert request.url.path == "/attachments/download/3"
+        return httpx.Response(200, content=body)
+
+    client, tools = _tools(handler)
+    async with client:
+        result = await tools["download_attachment"](attachment_id=3)
+        assert (tmp_path / "dump.bin").read_bytes() == CONTENT
+        assert result["size"] == len(CONTENT)
+        assert result["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+
+        with pytest.raises(FileExistsError):
+            await tools["download_attachment"](attachment_id=3)
+
+        body = CONTENT[:-1]
+        with pytest.raises(OSError, match="expected"):
+            await tools["download_attachment"](attachment_id=3, path="copy.bin")
+    assert not (tmp_path / "copy.bin").exists()
+    assert not (tmp_path / "copy.bin.part").exists()
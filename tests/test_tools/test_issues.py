@@ -1,6 +1,32 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
 import pytest
+from mcp.server.fastmcp import FastMCP
 
+from redmine_mcp.resilience import CircuitOpenError
 from redmine_mcp.server import mcp
+from redmine_mcp.tools import issues
+from redmine_mcp.tools.issues import chunk_issue_ids
+
+
+@pytest.fixture
+def mock_client():
+    from redmine_mcp.client import RedmineClient
+
+    with patch.object(RedmineClient, "__init__", lambda self, **kw: None):
+        client = RedmineClient()
+        client.get = AsyncMock()
+        client.post = AsyncMock()
+        client.put = AsyncMock()
+        return client
+
+
+def _tool(client, name):
+    server = FastMCP("test")
+    issues.register(server, client)
+    return server._tool_manager._tools[name].fn
 
 
 @pytest.mark.asyncio
@@ -8,11 +34,338 @@ async def test_tools_registered():
     """Verify that all expected tools are registered."""
     tool_names = set(mcp._tool_manager._tools.keys())
     expected = {
-        "list_issues", "get_issue", "search_issues",
+        "list_issues", "get_issue", "get_issues", "get_issue_journals", "search_issues", "issue_stats",
+        "get_changes", "get_issue_tree",
         "create_issue", "update_issue", "add_comment",
-        "bulk_update_issues",
+        "bulk_update_issues", "export_issues",
+        "get_job_status", "cancel_job", "list_jobs",
         "list_projects", "get_project",
         "list_statuses", "list_trackers", "list_priorities", "list_users",
-        "list_wiki_pages", "get_wiki_page", "get_ticket_rules",
+        "clear_reference_cache",
+        "list_wiki_pages", "get_wiki_page", "search_wiki", "get_ticket_rules",
+        "upload_attachment", "download_attachment",
     }
     assert expected.issubset(tool_names), f"Missing tools: {expected - tool_names}"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_issues_reports_per_item_results(mock_client):
+    async def put(path, json=None):
+        if path == "/issues/2.json":
+            raise ValueError("boom")
+        return {}
+
+    mock_client.put.side_effect = put
+    tool_fn = _tool(mock_client, "bulk_update_issues")
+    result = await tool_fn(issue_ids=[1, 2, 3], status_id=5)
+
+    assert [r["id"] for r in result["results"]] == [1, 2, 3]
+    assert [r["status"] for r in result["results"]] == ["ok", "error", "ok"]
+    assert result["succeeded"] == 2
+    assert result["failed"] == 1
+    assert "elapsed_seconds" in result
+    mock_client.put.assert_any_call("/issues/1.json", json={"issue": {"status_id": 5}})
+
+
+def test_chunk_issue_ids():
+    assert chunk_issue_ids([1, 2, 3], max_length=4) == [[1, 2], [3]]
+    assert [len(c) for c in chunk_issue_ids(list(range(250)))] == [100, 100, 50]
+
+
+@pytest.mark.asyncio
+async def test_get_issues_uses_id_filter(mock_client):
+    async def get(path, params=None):
+        if path == "/issues.json":
+            return {"issues": [{"id": 3}, {"id": 1}]}
+        request = httpx.Request("GET", path)
+        status = 403 if path == "/issues/4.json" else 404
+        raise httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+    mock_client.get.side_effect = get
+    tool_fn = _tool(mock_client, "get_issues")
+    result = await tool_fn(issue_ids=[1, 2, 3, 4, 1], include="attachments")
+
+    assert mock_client.get.call_args_list[0].args == ("/issues.json",)
+    assert mock_client.get.call_args_list[0].kwargs == {"params": {
+        "issue_id": "1,2,3,4", "status_id": "*", "limit": 4, "include": "attachments",
+    }}
+    # Only the ids the list left out are fetched one by one.
+    assert mock_client.get.call_count == 3
+    mock_client.get.assert_any_call("/issues/2.json", params={"include": "attachments"})
+    assert list(result["issues"]) == ["1", "3"]
+    assert result["missing"] == [2]
+    assert result["forbidden"] == [4]
+
+
+@pytest.mark.asyncio
+async def test_get_issues_falls_back_for_journals(mock_client):
+    async def get(path, params=None):
+        if path == "/issues/2.json":
+            request = httpx.Request("GET", path)
+            raise httpx.HTTPStatusError(
+                "forbidden", request=request, response=httpx.Response(403, request=request),
+            )
+        return {"issue": {"id": 1, "journals": []}}
+
+    mock_client.get.side_effect = get
+    tool_fn = _tool(mock_client, "get_issues")
+    result = await tool_fn(issue_ids=[1, 2], include="journals")
+
+    mock_client.get.assert_any_call("/issues/1.json", params={"include": "journals"})
+    assert result["issues"]["1"]["journals"] == []
+    assert result["forbidden"] == [2]
+
+
+@pytest.mark.asyncio
+async def test_list_issues_served_from_mirror(mock_client, tmp_path):
+    from redmine_mcp.mirror import IssueMirror
+
+    mirror = IssueMirror(str(tmp_path / "mirror.db"), scopes=["demo"], max_age=60)
+    issue = {"id": 1, "project": {"id": 1}, "status": {"id": 1}, "subject": "s", "updated_on": "t"}
+
+    async def get(path, params=None):
+        if path == "/issue_statuses.json":
+            return {"issue_statuses": [{"id": 1, "name": "New"}]}
+        if path == "/projects/demo.json":
+            return {"project": {"id": 1}}
+        return {"issues": [issue], "total_count": 1}
+
+    mock_client.get.side_effect = get
+    server = FastMCP("test")
+    issues.register(server, mock_client, mirror)
+    tool_fn = server._tool_manager._tools["list_issues"].fn
+
+    first = await tool_fn(project_id="demo")
+    calls = mock_client.get.call_count
+    second = await tool_fn(project_id="demo")
+
+    assert first["source"] == "mirror"
+    assert second["issues"] == [issue]
+    assert mock_client.get.call_count == calls
+    mirror.close()
+
+
+def _journal_client(journals, requests=None):
+    from redmine_mcp.client import RedmineClient
+
+    body = json.dumps({"issue": {"id": 7, "subject": "s", "journals": journals}}).encode()
+
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(200, content=body)
+
+    return RedmineClient(
+        url="https://redmine.example.com", api_key="k", transport=httpx.MockTransport(handler),
+    )
+
+
+JOURNALS = [
+    {"id": n, "user": {"id": n % 2 + 1, "name": f"User {n % 2 + 1}"},
+     "notes": "" if n % 3 == 0 else f"note {n}",
+     "created_on": f"2024-01-{n:02d}T00:00:00Z", "details": []}
+    for n in range(1, 21)
+]
+
+
+@pytest.mark.asyncio
+async def test_get_issue_journals_pages_with_cursor():
+    requests = []
+    get_issue_journals = _tool(_journal_client(JOURNALS, requests), "get_issue_journals")
+
+    first = await get_issue_journals(issue_id=7, limit=8)
+    second = await get_issue_journals(issue_id=7, limit=8, cursor=first["next_cursor"])
+    last = await get_issue_journals(issue_id=7, limit=8, cursor=second["next_cursor"])
+
+    assert [j["id"] for j in first["journals"]] == list(range(1, 9))
+    assert first["next_cursor"] == 8 and first["scanned"] == 9
+    assert [j["id"] for j in second["journals"]] == list(range(9, 17))
+    assert [j["id"] for j in last["journals"]] == list(range(17, 21))
+    assert last["next_cursor"] is None
+    assert requests[0].url.params["include"] == "journals"
+
+
+@pytest.mark.asyncio
+async def test_get_issue_journals_filters_and_newest_first():
+    get_issue_journals = _tool(_journal_client(JOURNALS), "get_issue_journals")
+
+    result = await get_issue_journals(
+        issue_id=7, notes_only=True, user_id=1, since="2024-01-10", newest_first=True, limit=3,
+        fields="id,notes",
+    )
+
+    assert result["journals"] == [
+        {"id": 20, "notes": "note 20"}, {"id": 16, "notes": "note 16"}, {"id": 14, "notes": "note 14"},
+    ]
+    assert result["next_cursor"] == 14
+    more = await get_issue_journals(
+        issue_id=7, notes_only=True, user_id=1, since="2024-01-10", newest_first=True, limit=3,
+        cursor=14,
+    )
+    assert [j["id"] for j in more["journals"]] == [10]
+    assert more["next_cursor"] is None
+
+
+RULES_PAGE = {
+    "wiki_page": {
+        "title": "TicketRules",
+        "version": 4,
+        "text": (
+            "## トラッカー\n\n| トラッカー | tracker_id | 用途 |\n|---|---|---|\n| バグ | 1 | 不具合 |\n\n"
+            "## 必須フィールド\n\n- subject（件名）\n- description（説明）\n\n"
+            "## 件名の命名規則\n\n- バグ: `[BUG] 〈現象〉`\n\n"
+            "## デフォルト値\n\n| フィールド | デフォルト値 |\n|---|---|\n| priority_id | 2 |\n"
+        ),
+    }
+}
+
+
+@pytest.mark.asyncio
+async def test_create_issue_validates_ticket_rules(mock_client):
+    mock_client.get.return_value = RULES_PAGE
+    mock_client.post.return_value = {"issue": {"id": 9}}
+    create = _tool(mock_client, "create_issue")
+
+    with pytest.raises(ValueError) as excinfo:
+        await create(project_id="p", subject="crash", tracker_id=5)
+    message = str(excinfo.value)
+    assert "description is required" in message
+    assert "tracker_id 5 is not allowed" in message
+    mock_client.post.assert_not_called()
+
+    await create(project_id="p", subject="[BUG] crash", tracker_id=1, description="d")
+    sent = mock_client.post.call_args.kwargs["json"]["issue"]
+    assert sent["priority_id"] == 2
+    # The parsed rules were cached after the first fetch.
+    assert mock_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_issue_without_ticket_rules(mock_client):
+    request = httpx.Request("GET", "https://r.example/projects/p/wiki/TicketRules.json")
+    mock_client.get.side_effect = httpx.HTTPStatusError(
+        "404", request=request, response=httpx.Response(404, request=request)
+    )
+    mock_client.post.return_value = {"issue": {"id": 9}}
+    create = _tool(mock_client, "create_issue")
+
+    await create(project_id="p", subject="anything")
+    await create(project_id="p", subject="again", check_rules=False)
+    assert mock_client.post.call_count == 2
+    assert mock_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_issue_goes_ahead_while_the_circuit_is_open(mock_client):
+    mock_client.get.side_effect = CircuitOpenError("r.example", 30)
+    mock_client.post.return_value = {"issue": {"id": 9}}
+    create = _tool(mock_client, "create_issue")
+
+    await create(project_id="p", subject="anything")
+    assert mock_client.post.call_args.kwargs["json"]["issue"]["subject"] == "anything"
+
+
+@pytest.mark.asyncio
+async def test_update_issue_accepts_names(mock_client):
+    mock_client.get.side_effect = lambda path, params=None: {
+        "/issue_statuses.json": {"issue_statuses": [{"id": 2, "name": "In Progress"}]},
+        "/users.json": {"users": [{"id": 7, "login": "tanaka", "firstname": "Taro", "lastname": "Tanaka"}],
+                        "total_count": 1},
+    }[path]
+    mock_client.put.return_value = {}
+    update = _tool(mock_client, "update_issue")
+
+    result = await update(issue_id=1, status="in prog", assignee="tanaka")
+    sent = mock_client.put.call_args.kwargs["json"]["issue"]
+    assert sent == {"status_id": 2, "assigned_to_id": 7}
+    assert result["resolved"] == {
+        "status_id": {"id": 2, "name": "In Progress"},
+        "assigned_to_id": {"id": 7, "name": "Taro Tanaka"},
+    }
+
+    # A typo is not corrected on a write.
+    mock_client.put.reset_mock()
+    with pytest.raises(ValueError, match="exactly or by prefix"):
+        await update(issue_id=1, status="In Progres s")
+    mock_client.put.assert_not_called()
+
+    with pytest.raises(ValueError, match="not both"):
+        await update(issue_id=1, status_id=3, status="In Progress")
+
+
+class FakeTree:
+    """Issues 1 > 2..11 > 12..111 (ten subtasks each), plus some relations."""
+
+    def __init__(self):
+        self.issues = {1: {"id": 1, "subject": "Epic", "status": {"id": 1, "name": "New"}, "parent": {"id": 600}}}
+        for i in range(2, 112):
+            parent = 1 if i < 12 else 2 + (i - 12) // 10
+            self.issues[i] = {"id": i, "subject": f"Task {i}", "parent": {"id": parent}}
+        self.relations = [
+            {"id": 1, "issue_id": 1, "issue_to_id": 500, "relation_type": "blocks"},
+            {"id": 2, "issue_id": 500, "issue_to_id": 3, "relation_type": "relates"},
+            {"id": 3, "issue_id": 12, "issue_to_id": 1, "relation_type": "precedes"},
+            {"id": 4, "issue_id": 3, "issue_to_id": 600, "relation_type": "blocks"},
+        ]
+        self.issues[500] = {"id": 500, "subject": "Elsewhere"}
+        # The epic is a subtask of an issue it (indirectly) blocks.
+        self.issues[600] = {"id": 600, "subject": "Umbrella"}
+        self.calls = []
+
+    def _issue(self, iid, params):
+        issue = dict(self.issues[iid])
+        if "relations" in (params.get("include") or ""):
+            issue["relations"] = [r for r in self.relations if iid in (r["issue_id"], r["issue_to_id"])]
+        return issue
+
+    async def get(self, path, params=None):
+        self.calls.append((path, params))
+        params = params or {}
+        if "issue_id" in params:
+            ids = [int(i) for i in params["issue_id"].split(",")]
+        else:
+            parents = {int(i) for i in params["parent_id"].split(",")}
+            ids = [i for i, issue in self.issues.items() if issue.get("parent", {}).get("id") in parents]
+        found = [self._issue(i, params) for i in ids if i in self.issues]
+        offset = params.get("offset", 0)
+        return {"issues": found[offset:offset + params["limit"]], "total_count": len(found)}
+
+
+@pytest.mark.asyncio
+async def test_get_issue_tree_fetches_each_level_at_once():
+    redmine = FakeTree()
+    tool_fn = _tool(redmine, "get_issue_tree")
+
+    result = await tool_fn(root_id=1, depth=5)
+
+    assert result["nodes"] == 111
+    assert [c["id"] for c in result["tree"]["children"]] == list(range(2, 12))
+    assert len(result["tree"]["children"][0]["children"]) == 10
+    # Root, then one listing per level: levels 1 and 2, plus an empty level 3.
+    assert len(redmine.calls) == 4
+    assert result["tree"]["status"] == "New"
+
+
+@pytest.mark.asyncio
+async def test_get_issue_tree_follows_relations_and_reports_cycles():
+    redmine = FakeTree()
+    tool_fn = _tool(redmine, "get_issue_tree")
+
+    result = await tool_fn(root_id=1, depth=3, relations=True, fields="id,subject")
+
+    children = result["tree"]["children"]
+    by_id = {c["id"]: c for c in children}
+    assert by_id[500]["relation"] == "blocks"
+    # 12 is reached first through its relation to the root, then found again as a subtask.
+    assert by_id[12]["relation"] == "follows"
+    assert {"id": 12, "relation": "subtask"} in by_id[2]["links"]
+    # A relation is listed once, on the end visited first.
+    assert by_id[3]["links"] == [{"id": 500, "relation": "relates"}]
+    umbrella = by_id[3]["children"][-1]
+    assert (umbrella["id"], umbrella["relation"]) == (600, "blocks")
+    assert umbrella["links"] == [{"id": 1, "relation": "subtask"}]
+    assert result["cycles"] == [[600, 1]]
+    assert result["nodes"] == 113
+
+    with pytest.raises(ValueError):
+        await tool_fn(root_id=999)
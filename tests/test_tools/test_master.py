@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp.cache import TTLCache
+from redmine_mcp.tools import master, projects
+
+
+@pytest.fixture
+def mock_client():
+    from redmine_mcp.client import RedmineClient
+
+    with patch.object(RedmineClient, "__init__", lambda self, **kw: None):
+        client = RedmineClient()
+        client.get = AsyncMock()
+        client.http_cache = None
+        return client
+
+
+@pytest.mark.asyncio
+async def test_list_statuses_is_cached(mock_client):
+    mcp = FastMCP("test")
+    master.register(mcp, mock_client, TTLCache(ttl=60))
+    mock_client.get.return_value = {"issue_statuses": [{"id": 1, "name": "New"}]}
+
+    tool_fn = mcp._tool_manager._tools["list_statuses"].fn
+    first = await tool_fn()
+    second = await tool_fn()
+
+    mock_client.get.assert_called_once_with("/issue_statuses.json")
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_clear_reference_cache(mock_client):
+    mcp = FastMCP("test")
+    cache = TTLCache(ttl=60)
+    master.register(mcp, mock_client, cache)
+    projects.register(mcp, mock_client, cache)
+    mock_client.get.return_value = {"trackers": []}
+
+    await mcp._tool_manager._tools["list_trackers"].fn()
+    await mcp._tool_manager._tools["get_project"].fn(project_id="p", include="trackers")
+    result = await mcp._tool_manager._tools["clear_reference_cache"].fn(namespace="project")
+
+    assert result["cleared"] == 1
+    assert result["size"] == 1
+    await mcp._tool_manager._tools["get_project"].fn(project_id="p", include="trackers")
+    assert mock_client.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_up_prefetches_references(mock_client):
+    cache = TTLCache(ttl=60)
+    mock_client.get.return_value = {}
+
+    await master.warm_up(mock_client, cache)
+
+    assert mock_client.get.call_count == len(master.REFERENCE_ENDPOINTS)
+    assert len(cache) == len(master.REFERENCE_ENDPOINTS)
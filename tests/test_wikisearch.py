@@ -0,0 +1,118 @@
+import httpx
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from redmine_mcp.tools import wiki
+from redmine_mcp.wikisearch import WikiIndex, WikiSearch, tokenize
+
+
+def test_tokenize_indexes_japanese_as_bigrams():
+    assert tokenize("起票ルール TicketRules v2") == ["起票", "票ル", "ルー", "ール", "ticketrules", "v2"]
+    # Full-width and half-width forms are folded together.
+    assert tokenize("ＡＰＩ ｶﾀｶﾅ 漢") == ["api", "カタ", "タカ", "カナ", "漢"]
+
+
+def test_bm25_ranks_and_snippets():
+    index = WikiIndex()
+    index.add({"title": "Deploy", "version": 1, "text": "本番環境へのデプロイ手順。"})
+    index.add({"title": "API_Spec", "version": 1, "text": "認証 API の仕様。デプロイは Deploy ページを参照。"})
+    index.add({"title": "Wiki", "version": 1, "text": "トップページ"})
+
+    results = index.search("デプロイ 手順", 10)
+    assert [r["title"] for r in results] == ["Deploy", "API_Spec"]
+    assert results[0]["snippet"] == "本番環境へのデプロイ手順。"
+    assert index.search("api spec", 10)[0]["title"] == "API_Spec"
+    assert index.search("存在しない", 10) == []
+
+    index.remove("Deploy")
+    assert [r["title"] for r in index.search("デプロイ", 10)] == ["API_Spec"]
+    assert "手順" not in index.postings
+
+    long = WikiIndex()
+    long.add({"title": "Long", "text": "前置き。" * 100 + "ここにデプロイ手順。" + "後書き。" * 100})
+    snippet = long.search("デプロイ", 1)[0]["snippet"]
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "ここにデプロイ手順" in snippet
+
+
+class FakeWiki:
+    def __init__(self):
+        self.pages = {
+            "Wiki": {"title": "Wiki", "version": 1, "text": "トップページ"},
+            "Spec": {"title": "Spec", "version": 3, "text": "チケットの起票ルールについて"},
+        }
+        self.fetched = []
+
+    async def get(self, path, params=None):
+        if path.endswith("/index.json"):
+            listed = [{k: v for k, v in p.items() if k != "text"} for p in self.pages.values()]
+            return {"wiki_pages": listed}
+        title = path.rsplit("/", 1)[1].removesuffix(".json")
+        self.fetched.append(title)
+        return {"wiki_page": self.pages[title]}
+
+
+@pytest.mark.asyncio
+async def test_search_wiki_updates_the_index_incrementally():
+    redmine = FakeWiki()
+    server = FastMCP("test")
+    wiki.register(server, redmine, search=WikiSearch(check_interval=0))
+    search_wiki = server._tool_manager._tools["search_wiki"].fn
+
+    result = await search_wiki(project_id="p", query="起票")
+    assert [r["title"] for r in result["results"]] == ["Spec"]
+    assert sorted(redmine.fetched) == ["Spec", "Wiki"]
+
+    redmine.pages["Wiki"] = {"title": "Wiki", "version": 2, "text": "起票の前に読むこと"}
+    redmine.pages["New"] = {"title": "New", "version": 1, "text": "新しいページ"}
+    del redmine.pages["Spec"]
+    result = await search_wiki(project_id="p", query="起票")
+    assert [r["title"] for r in result["results"]] == ["Wiki"]
+    assert redmine.fetched[2:] == ["Wiki", "New"]
+    assert (result["pages_indexed"], result["pages_fetched"]) == (2, 2)
+
+    await search_wiki(project_id="p", query="ページ")
+    assert len(redmine.fetched) == 4
+
+
+@pytest.mark.asyncio
+async def test_least_recently_searched_indexes_are_dropped():
+    redmine = FakeWiki()
+    search = WikiSearch(check_interval=60, max_indexes=2)
+
+    first, _ = await search.index(redmine, "a")
+    await search.index(redmine, "b")
+    assert (await search.index(redmine, "a"))[0] is first
+    await search.index(redmine, "c")
+
+    assert len(search) == 2 and search.evicted == 1
+    # "b" was searched least recently, so "a" is still served without a refresh.
+    assert (await search.index(redmine, "a"))[1]["fetched"] == 0
+    assert (await search.index(redmine, "b"))[1]["fetched"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pages_that_cannot_be_read_do_not_fail_the_search():
+    redmine = FakeWiki()
+    redmine.pages["Secret"] = {"title": "Secret", "version": 1, "text": "起票"}
+    get = redmine.get
+
+    async def get_or_forbid(path, params=None):
+        if path.endswith("/Secret.json"):
+            request = httpx.Request("GET", path)
+            raise httpx.HTTPStatusError("403", request=request, response=httpx.Response(403, request=request))
+        return await get(path, params)
+
+    redmine.get = get_or_forbid
+    server = FastMCP("test")
+    search = WikiSearch(check_interval=60)
+    wiki.register(server, redmine, search=search)
+    search_wiki = server._tool_manager._tools["search_wiki"].fn
+
+    result = await search_wiki(project_id="p", query="起票")
+    assert [r["title"] for r in result["results"]] == ["Spec"]
+    assert [f["title"] for f in result["pages_failed"]] == ["Secret"]
+    # The index counts as checked, so the next search makes no request.
+    fetched = len(redmine.fetched)
+    result = await search_wiki(project_id="p", query="起票")
+    assert "pages_failed" not in result and len(redmine.fetched) == fetched